@@ -0,0 +1,59 @@
+"""
+Benchmark the ASCII fast path of the case changing functions.
+
+Compares the per-call latency of the built-in case changing functions, which
+find the words of pure ASCII strings with a single regular expression, with
+the same cases built on the general regular expression pipeline.
+
+Run with::
+
+    PYTHONPATH=src python benchmarks/bench_ascii.py
+"""
+import argparse
+import timeit
+
+from case_changer import changers
+
+IDENTIFIERS = (
+        'id',
+        'userId',
+        'user_name',
+        'XMLHttpRequest',
+        'CONSTANT_VALUE',
+        'version 1.21.0',
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--number', type=int, default=100000)
+    parser.add_argument('-c', '--cases', nargs='+',
+                        default=['snake_case', 'camel_case', 'header_case'])
+    args = parser.parse_args()
+
+    for case in args.cases:
+        fast = getattr(changers, case)
+        delimiter, transform = changers._CASES[case]
+        if not isinstance(transform, tuple):
+            transform = (transform, transform)
+        # custom patterns force the general pipeline
+        general = changers.make_converter(
+                delimiter, *transform,
+                split_patterns=changers.DEFAULT_SPLIT_REGEXP,
+                strip_pattern=changers.DEFAULT_STRIP_REGEXP)
+
+        print(f'{case}:')
+        for s in IDENTIFIERS:
+            assert fast(s) == general(s)
+            t_fast = min(timeit.repeat(lambda: fast(s), number=args.number,
+                                       repeat=3)) / args.number
+            t_general = min(timeit.repeat(lambda: general(s),
+                                          number=args.number,
+                                          repeat=3)) / args.number
+            print(f'  {s!r:18} general {t_general * 1e6:6.2f} us  '
+                  f'ascii {t_fast * 1e6:6.2f} us  '
+                  f'{t_general / t_fast:5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
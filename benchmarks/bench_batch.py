@@ -0,0 +1,54 @@
+"""
+Benchmark the batch conversion functions.
+
+Compares the throughput of :func:`case_changer.snake_case_many` with the
+baseline of mapping :func:`case_changer.snake_case` over the same strings.
+
+Run with::
+
+    PYTHONPATH=src python benchmarks/bench_batch.py
+"""
+import argparse
+import random
+import string
+import timeit
+
+import case_changer
+
+
+def corpus(size: int, seed: int = 0):
+    rng = random.Random(seed)
+    words = [''.join(rng.choice(string.ascii_lowercase)
+                     for _ in range(rng.randint(2, 8)))
+             for _ in range(500)]
+    styles = (case_changer.camel_case, case_changer.snake_case,
+              case_changer.constant_case, case_changer.param_case)
+    return [rng.choice(styles)(' '.join(rng.sample(words, rng.randint(1, 4))))
+            for _ in range(size)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-s', '--size', type=int, default=100000)
+    parser.add_argument('-c', '--cases', nargs='+',
+                        default=['snake_case', 'camel_case', 'header_case'])
+    args = parser.parse_args()
+
+    strings = corpus(args.size)
+    for case in args.cases:
+        fn = getattr(case_changer, case)
+        many = getattr(case_changer, f'{case}_many')
+
+        t_map = min(timeit.repeat(lambda: list(map(fn, strings)),
+                                  number=1, repeat=3))
+        t_many = min(timeit.repeat(lambda: many(strings),
+                                   number=1, repeat=3))
+
+        print(f'{case}:')
+        print(f'  map:  {args.size / t_map:12,.0f} strings/s')
+        print(f'  many: {args.size / t_many:12,.0f} strings/s')
+        print(f'  speedup: {t_map / t_many:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
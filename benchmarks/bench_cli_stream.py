@@ -0,0 +1,88 @@
+"""
+Benchmark the streaming input of the command line interface.
+
+Writes a dump of random identifiers of the requested size to a temporary
+file, converts it with ``case-changer <case> --jobs N --input FILE`` and
+reports the throughput and the peak memory of the converting processes.
+
+Run with::
+
+    PYTHONPATH=src python benchmarks/bench_cli_stream.py --size 2G --jobs 4
+"""
+import argparse
+import os
+import random
+import resource
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+_UNITS = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+
+def size(value: str) -> int:
+    unit = _UNITS.get(value[-1:].upper())
+    return int(float(value[:-1]) * unit) if unit else int(value)
+
+
+def write_dump(path: str, nbytes: int, seed: int = 0):
+    rng = random.Random(seed)
+    words = [''.join(rng.choice(string.ascii_lowercase)
+                     for _ in range(rng.randint(2, 8)))
+             for _ in range(1000)]
+    seps = ('_', '-', ' ', '.', '')
+    # a block of identifiers written over and over again
+    lines = []
+    for _ in range(10000):
+        ws = rng.sample(words, rng.randint(1, 4))
+        sep = rng.choice(seps)
+        lines.append(sep.join(w.capitalize() if not sep else w for w in ws))
+    block = ('\n'.join(lines) + '\n').encode()
+
+    written = 0
+    with open(path, 'wb') as fh:
+        while written < nbytes:
+            fh.write(block)
+            written += len(block)
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-s', '--size', type=size, default='64M',
+                        help='Size of the identifier dump e.g., 512M or 2G.')
+    parser.add_argument('-c', '--case', default='snake')
+    parser.add_argument('-j', '--jobs', type=int, default=1)
+    parser.add_argument('--keep', metavar='PATH',
+                        help='Use (and keep) the dump at PATH.')
+    args = parser.parse_args()
+
+    path = args.keep or tempfile.mkstemp(suffix='.txt')[1]
+    try:
+        if not args.keep or not os.path.exists(path):
+            write_dump(path, args.size)
+        nbytes = os.path.getsize(path)
+
+        start = time.perf_counter()
+        with open(os.devnull, 'wb') as devnull:
+            subprocess.run([sys.executable, '-m', 'case_changer.cli',
+                            args.case, '--jobs', str(args.jobs),
+                            '--input', path],
+                           stdout=devnull, check=True)
+        elapsed = time.perf_counter() - start
+        maxrss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    finally:
+        if not args.keep:
+            os.unlink(path)
+
+    print(f'input:      {nbytes / (1 << 20):10.1f} MiB')
+    print(f'time:       {elapsed:10.2f} s')
+    print(f'throughput: {nbytes / (1 << 20) / elapsed:10.1f} MiB/s')
+    print(f'peak RSS:   {maxrss / 1024:10.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark the memory taken by tokenizing a large batch of strings.
+
+Compares keeping the words of every string as :class:`case_changer.Words`,
+a list of word strings, with keeping them as :class:`case_changer.Tokens`,
+an array of offsets into the string. Memory is traced with
+:mod:`tracemalloc`, counting the bytes and memory blocks still allocated
+after tokenizing, the peak bytes while tokenizing, and the time taken.
+
+Run with::
+
+    PYTHONPATH=src python benchmarks/bench_memory.py
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+import corpora
+
+from case_changer import tokenize
+from case_changer import tokenize_compact
+
+
+def measure(fn: Callable[[str], object],
+            strings: List[str]) -> Tuple[int, int, int, float]:
+    """
+    Trace the memory allocated by tokenizing every string.
+
+    Returns
+    -------
+    size : int
+        Bytes still allocated after tokenizing, that is held by the result.
+    blocks : int
+        Memory blocks still allocated after tokenizing.
+    peak : int
+        Peak bytes allocated while tokenizing.
+    seconds : float
+        Time taken to tokenize without tracing.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    list(map(fn, strings))
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = list(map(fn, strings))
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, 'filename')
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del result
+
+    return size, blocks, peak, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--size', type=int, default=100000)
+    parser.add_argument('-c', '--corpus', default='identifiers',
+                        choices=sorted(corpora.CORPORA))
+    args = parser.parse_args()
+
+    strings = corpora.CORPORA[args.corpus](args.size)
+    results = {name: measure(fn, strings)
+               for name, fn in (('tokenize', tokenize),
+                                ('tokenize_compact', tokenize_compact))}
+
+    print(f'{len(strings):,d} strings of the {args.corpus} corpus')
+    print(f'{"":18} {"retained":>12} {"blocks":>10} {"peak":>12} '
+          f'{"time":>9}')
+    for name, (size, blocks, peak, seconds) in results.items():
+        print(f'{name:18} {size / 2 ** 20:9.2f} MiB {blocks:10,d} '
+              f'{peak / 2 ** 20:8.2f} MiB {seconds:7.3f} s')
+    size, blocks, peak, _ = results['tokenize']
+    compact_size, compact_blocks, compact_peak, _ = \
+        results['tokenize_compact']
+    print(f'{"ratio":18} {compact_size / size:12.2f} '
+          f'{compact_blocks / blocks:10.2f} {compact_peak / peak:12.2f}')
+
+
+if __name__ == '__main__':
+    main()
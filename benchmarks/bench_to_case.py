@@ -0,0 +1,98 @@
+"""
+Benchmark the deep key conversion of large JSON payloads.
+
+Converts the keys of a JSON document with :func:`case_changer.to_snake` and
+:func:`case_changer.to_camel`, and reads a single key through
+:func:`case_changer.snake_view` for comparison. Either loads the document from a file or
+generates an API-response-like payload of the requested size.
+
+Run with::
+
+    PYTHONPATH=src python benchmarks/bench_to_case.py --size 50M
+    PYTHONPATH=src python benchmarks/bench_to_case.py --file payload.json
+"""
+import argparse
+import json
+import random
+import string
+import time
+
+import case_changer
+
+_UNITS = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+
+def size(value: str) -> int:
+    unit = _UNITS.get(value[-1:].upper())
+    return int(float(value[:-1]) * unit) if unit else int(value)
+
+
+def payload(nbytes: int, seed: int = 0):
+    """
+    Generate a list of nested camelCase records of roughly `nbytes` as JSON.
+    """
+    rng = random.Random(seed)
+    words = [''.join(rng.choice(string.ascii_lowercase)
+                     for _ in range(rng.randint(3, 8)))
+             for _ in range(300)]
+
+    def key():
+        return case_changer.camel_case(' '.join(rng.sample(words, 2)))
+
+    shapes = [[key() for _ in range(rng.randint(4, 12))] for _ in range(50)]
+
+    def record(depth=0):
+        out = {}
+        for k in rng.choice(shapes):
+            r = rng.random()
+            if depth < 2 and r < 0.1:
+                out[k] = record(depth + 1)
+            elif depth < 2 and r < 0.15:
+                out[k] = [record(depth + 1) for _ in range(rng.randint(1, 3))]
+            elif r < 0.5:
+                out[k] = rng.choice(words)
+            else:
+                out[k] = rng.randint(0, 10 ** 6)
+        return out
+
+    sample = [record() for _ in range(200)]
+    per_record = len(json.dumps(sample)) / len(sample)
+    return sample + [record() for _ in range(int(nbytes / per_record) - 200)]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-s', '--size', type=size, default='10M',
+                        help='Size of the generated payload e.g., 10M.')
+    parser.add_argument('-f', '--file', help='JSON document to convert.')
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'rb') as fh:
+            raw = fh.read()
+    else:
+        raw = json.dumps(payload(args.size)).encode()
+    mib = len(raw) / (1 << 20)
+
+    document, t_load = timed(json.loads, raw)
+    snake, t_snake = timed(case_changer.to_snake, document)
+    _, t_camel = timed(case_changer.to_camel, snake)
+    # sparse access: read the first key of the first record through a view
+    _, t_view = timed(lambda d: next(iter(case_changer.snake_view(d)[0])),
+                      document)
+
+    print(f'payload:   {mib:8.1f} MiB')
+    print(f'json.loads {t_load:8.2f} s  {mib / t_load:8.1f} MiB/s')
+    print(f'to_snake   {t_snake:8.2f} s  {mib / t_snake:8.1f} MiB/s')
+    print(f'to_camel   {t_camel:8.2f} s  {mib / t_camel:8.1f} MiB/s')
+    print(f'snake_view {t_view:8.6f} s  (first key of the first record)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark rendering several cases from a single tokenization.
+
+Compares calling the individual case changing functions one after another
+with tokenizing once via :func:`case_changer.tokenize` and rendering every
+case from the returned words.
+
+Run with::
+
+    PYTHONPATH=src python benchmarks/bench_words.py
+"""
+import argparse
+import timeit
+
+import case_changer
+from case_changer import tokenize
+
+IDENTIFIERS = (
+        'XMLHttpRequest',
+        'user_id',
+        'createdAt',
+        'CONSTANT_VALUE',
+        'version 1.21.0',
+        'anHTMLTag',
+        'some-param-name',
+        'IQueryAArgs',
+)
+
+
+def individual(cases):
+    functions = [getattr(case_changer, case) for case in cases]
+    for s in IDENTIFIERS:
+        for fn in functions:
+            fn(s)
+
+
+def tokenized(cases):
+    for s in IDENTIFIERS:
+        tokenize(s).render_all(cases)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--number', type=int, default=20000)
+    parser.add_argument('-c', '--cases', nargs='+',
+                        default=['camel_case', 'snake_case', 'constant_case',
+                                 'header_case'])
+    args = parser.parse_args()
+
+    t_individual = min(timeit.repeat(lambda: individual(args.cases),
+                                     number=args.number, repeat=3))
+    t_tokenized = min(timeit.repeat(lambda: tokenized(args.cases),
+                                    number=args.number, repeat=3))
+    per_name = args.number * len(IDENTIFIERS)
+
+    print(f'cases: {", ".join(args.cases)}')
+    print(f'individual functions: {t_individual / per_name * 1e6:8.3f} us/name')
+    print(f'tokenize + render:    {t_tokenized / per_name * 1e6:8.3f} us/name')
+    print(f'speedup:              {t_individual / t_tokenized:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Deterministic corpora for the benchmarks.
+
+Every corpus is generated from a fixed seed, so that results of different
+runs and of different versions of case-changer are comparable.
+"""
+import random
+import string
+from typing import Any, Dict, List
+
+_LETTERS = string.ascii_lowercase
+
+_ACRONYMS = ('HTTP', 'XML', 'JSON', 'URL', 'ID', 'API', 'SQL', 'UTF8', 'CPU',
+             'IO', 'TCP', 'UUID')
+
+_UNICODE_WORDS = ('straße', 'café', 'naïve', 'İstanbul', 'Ärger', 'Ωmega',
+                  'ελληνικά', 'привет', 'Überweisung', 'façade', 'smörgåsbord',
+                  'jalapeño')
+
+
+def _words(rng: random.Random, count: int = 1000) -> List[str]:
+    return [''.join(rng.choice(_LETTERS) for _ in range(rng.randint(2, 9)))
+            for _ in range(count)]
+
+
+def identifiers(size: int, seed: int = 0) -> List[str]:
+    """
+    Short identifiers in mixed styles e.g., :code:`userId` or
+    :code:`MAX_VALUE`.
+    """
+    rng = random.Random(seed)
+    words = _words(rng)
+    styles = (
+            lambda ws: ws[0] + ''.join(w.capitalize() for w in ws[1:]),
+            lambda ws: ''.join(w.capitalize() for w in ws),
+            lambda ws: '_'.join(ws),
+            lambda ws: '_'.join(ws).upper(),
+            lambda ws: '-'.join(ws),
+    )
+    return [rng.choice(styles)(rng.sample(words, rng.randint(1, 4)))
+            for _ in range(size)]
+
+
+def sentences(size: int, seed: int = 0) -> List[str]:
+    """
+    Long sentences of 10 to 30 words with punctuation and numbers.
+    """
+    rng = random.Random(seed)
+    words = _words(rng) + [str(n) for n in range(100)]
+    return [' '.join(rng.sample(words, rng.randint(10, 30))).capitalize()
+            + rng.choice('.!?')
+            for _ in range(size)]
+
+
+def unicode(size: int, seed: int = 0) -> List[str]:
+    """
+    Identifiers and phrases mixing ASCII and non-ASCII words.
+    """
+    rng = random.Random(seed)
+    words = _words(rng, 200) + list(_UNICODE_WORDS) * 20
+    return [rng.choice((' ', '_', '')).join(
+                    w.capitalize() if rng.random() < 0.5 else w
+                    for w in rng.sample(words, rng.randint(1, 5)))
+            for _ in range(size)]
+
+
+def acronyms(size: int, seed: int = 0) -> List[str]:
+    """
+    Identifiers heavy with acronyms e.g., :code:`XMLHttpRequestID`.
+    """
+    rng = random.Random(seed)
+    words = _words(rng)
+    return [''.join(rng.choice(_ACRONYMS) if rng.random() < 0.5
+                    else rng.choice(words).capitalize()
+                    for _ in range(rng.randint(2, 5)))
+            for _ in range(size)]
+
+
+def json_document(records: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    JSON-like payload of records with nested objects and lists, as returned
+    by a typical REST API.
+    """
+    rng = random.Random(seed)
+    keys = identifiers(200, seed)
+    return [{'recordId': n,
+             'createdAt': '2020-03-30T12:00:00Z',
+             'ownerUser': {k: rng.randint(0, 100)
+                           for k in rng.sample(keys, 8)},
+             'lineItems': [{k: rng.choice(keys)
+                            for k in rng.sample(keys, 5)}
+                           for _ in range(rng.randint(1, 4))],
+             'tagNames': rng.sample(keys, 3)}
+            for n in range(records)]
+
+
+def records(count: int, shapes: int = 4, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    List of flat records sharing a few sets of keys, as returned by a typical
+    REST API listing e.g., users or orders.
+    """
+    rng = random.Random(seed)
+    keys = identifiers(200, seed)
+    layouts = [rng.sample(keys, rng.randint(6, 12)) for _ in range(shapes)]
+    return [{k: rng.randint(0, 100) for k in rng.choice(layouts)}
+            for _ in range(count)]
+
+
+CORPORA = {
+        'identifiers': identifiers,
+        'sentences': sentences,
+        'unicode': unicode,
+        'acronyms': acronyms,
+}
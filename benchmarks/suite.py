@@ -0,0 +1,245 @@
+"""
+Benchmark suite with machine-readable results and regression checks.
+
+Times every case changing function and its batch counterpart on several
+corpora (short identifiers, long sentences, Unicode text and acronym-heavy
+names), :func:`to_snake` and :func:`to_camel` on a large JSON payload and on a
+long list of records, and the end-to-end throughput of the command line
+interface. Results are written as JSON and can be compared with a baseline,
+flagging every benchmark that got slower by more than a threshold.
+
+Run with::
+
+    PYTHONPATH=src python benchmarks/suite.py run -o results.json
+    PYTHONPATH=src python benchmarks/suite.py compare \\
+        benchmarks/baselines/reference.json results.json --threshold 0.1
+
+``compare`` exits with status 1 if any benchmark regressed.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from typing import Callable, Dict, Iterator, Tuple
+
+import corpora
+
+import case_changer
+from case_changer import changers
+
+# Name of a benchmark and a function running it once, and the number of items
+# it processes per run
+Benchmark = Tuple[str, Callable[[], object], int]
+
+
+def case_benchmarks(size: int) -> Iterator[Benchmark]:
+    for corpus, make in corpora.CORPORA.items():
+        strings = make(size)
+        for case in changers._CASES:
+            fn = getattr(changers, case)
+            yield (f'case/{case}/{corpus}',
+                   lambda fn=fn, strings=strings: list(map(fn, strings)),
+                   len(strings))
+
+
+def batch_benchmarks(size: int) -> Iterator[Benchmark]:
+    for corpus, make in corpora.CORPORA.items():
+        strings = make(size)
+        for case in changers._CASES:
+            fn = getattr(case_changer, f'{case}_many')
+            yield (f'batch/{case}_many/{corpus}',
+                   lambda fn=fn, strings=strings: fn(strings),
+                   len(strings))
+
+
+def to_case_benchmarks(records: int) -> Iterator[Benchmark]:
+    document = corpora.json_document(records)
+    # many more records than the JSON document, which are much smaller
+    listing = corpora.records(records * 10)
+    for name in ('to_snake', 'to_camel'):
+        fn = getattr(case_changer, name)
+        yield (f'to_case/{name}/json',
+               lambda fn=fn: fn(document),
+               len(document))
+        yield (f'to_case/{name}/records',
+               lambda fn=fn: fn(listing),
+               len(listing))
+
+
+def cli_benchmarks(size: int,
+                   records: int,
+                   tmpdir: str) -> Iterator[Benchmark]:
+    lines = os.path.join(tmpdir, 'identifiers.txt')
+    strings = corpora.identifiers(size)
+    with open(lines, 'w', encoding='utf-8') as fh:
+        fh.write('\n'.join(strings) + '\n')
+
+    document = os.path.join(tmpdir, 'document.ndjson')
+    payload = corpora.json_document(records)
+    with open(document, 'w', encoding='utf-8') as fh:
+        fh.writelines(json.dumps(record) + '\n' for record in payload)
+
+    def invoke(*args):
+        with open(os.devnull, 'wb') as devnull:
+            subprocess.run([sys.executable, '-m', 'case_changer.cli', *args],
+                           stdout=devnull, check=True)
+
+    yield ('cli/snake/identifiers',
+           lambda: invoke('snake', '--input', lines),
+           len(strings))
+    yield ('cli/json/snake',
+           lambda: invoke('json', 'snake', document),
+           len(payload))
+
+
+def run_benchmarks(benchmarks: Iterator[Benchmark],
+                   repeat: int,
+                   only: str = None) -> Dict[str, dict]:
+    results = {}
+    for name, fn, items in benchmarks:
+        if only and only not in name:
+            continue
+
+        seconds = min(timeit.repeat(fn, number=1, repeat=repeat))
+        results[name] = {
+                'items': items,
+                'seconds': seconds,
+                'per_item': seconds / items,
+        }
+        print(f'{name:45} {seconds / items * 1e6:10.3f} us/item',
+              file=sys.stderr)
+
+    return results
+
+
+def run(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        benchmarks = [case_benchmarks(args.size),
+                      batch_benchmarks(args.size),
+                      to_case_benchmarks(args.records)]
+        if not args.no_cli:
+            benchmarks.append(cli_benchmarks(args.size, args.records, tmpdir))
+
+        results = {}
+        for group in benchmarks:
+            results.update(run_benchmarks(group, args.repeat, args.only))
+
+    report = {
+            'meta': {
+                    'case_changer': case_changer.__version__,
+                    'python': platform.python_version(),
+                    'implementation': platform.python_implementation(),
+                    'machine': platform.machine(),
+                    'system': platform.system(),
+                    'date': datetime.datetime.now().isoformat(
+                            timespec='seconds'),
+                    'size': args.size,
+                    'records': args.records,
+                    'repeat': args.repeat,
+            },
+            'results': results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True) + '\n'
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            fh.write(text)
+    else:
+        sys.stdout.write(text)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as fh:
+            return compare_reports(json.load(fh), report, args.threshold)
+
+    return 0
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float) -> int:
+    """
+    Print the change of every benchmark and count the regressions.
+
+    Returns
+    -------
+    status : int
+        :code:`1` if any benchmark is slower than its baseline by more than
+        :code:`threshold` (a fraction e.g., :code:`0.1` for 10%), :code:`0`
+        otherwise.
+    """
+    old, new = baseline['results'], current['results']
+    regressions = 0
+    for name in sorted(old.keys() | new.keys()):
+        if name not in new:
+            print(f'{name:45} {"missing":>10}')
+            continue
+        if name not in old:
+            print(f'{name:45} {"new":>10}')
+            continue
+
+        change = new[name]['per_item'] / old[name]['per_item'] - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        print(f'{name:45} {change:+10.1%}{flag}')
+
+    print(f'\n{regressions} regression(s) beyond {threshold:.0%}')
+
+    return 1 if regressions else 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    with open(args.baseline, encoding='utf-8') as fh:
+        baseline = json.load(fh)
+    with open(args.current, encoding='utf-8') as fh:
+        current = json.load(fh)
+
+    return compare_reports(baseline, current, args.threshold)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    parser_run = commands.add_parser('run', help='Run the benchmarks.')
+    parser_run.add_argument('-o', '--output',
+                            help='Write the results to OUTPUT instead of '
+                                 'standard output.')
+    parser_run.add_argument('-s', '--size', type=int, default=10000,
+                            help='Number of strings per corpus.')
+    parser_run.add_argument('-r', '--records', type=int, default=2000,
+                            help='Number of records of the JSON payload.')
+    parser_run.add_argument('-n', '--repeat', type=int, default=5,
+                            help='Number of runs of which the fastest counts.')
+    parser_run.add_argument('--only', metavar='SUBSTRING',
+                            help='Run only benchmarks whose name contains '
+                                 'SUBSTRING.')
+    parser_run.add_argument('--no-cli', action='store_true',
+                            help='Skip the command line benchmarks.')
+    parser_run.add_argument('--compare', metavar='BASELINE',
+                            help='Compare the results with BASELINE.')
+    parser_run.add_argument('-t', '--threshold', type=float, default=0.1)
+    parser_run.set_defaults(func=run)
+
+    parser_compare = commands.add_parser(
+            'compare', help='Compare results with a baseline.')
+    parser_compare.add_argument('baseline')
+    parser_compare.add_argument('current')
+    parser_compare.add_argument('-t', '--threshold', type=float, default=0.1,
+                                help='Relative slowdown counted as a '
+                                     'regression e.g., 0.1 for 10%%.')
+    parser_compare.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    start = time.perf_counter()
+    status = args.func(args)
+    print(f'done in {time.perf_counter() - start:.1f} s', file=sys.stderr)
+    sys.exit(status)
+
+
+if __name__ == '__main__':
+    main()
@@ -73,6 +73,9 @@ setup(
                 'click',
         ],
         extras_require={
+                'arrow': ['pyarrow'],
+                'numpy': ['numpy'],
+                'pandas': ['pandas'],
         },
         entry_points={
                 'console_scripts': [
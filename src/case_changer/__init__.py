@@ -1,9 +1,91 @@
-from case_changer.changers import *
+"""
+Change the case of strings and of the keys of nested dictionaries.
+
+The functions of the package are imported from their submodules on first
+access, so that :code:`import case_changer` and the command line stay fast.
+"""
+import importlib as _importlib
 
 __author__ = 'Philipp Tempel'
 __email__ = 'python@philipptempel.me'
 __version__ = '0.1.0'
 
+# Submodule defining each function of the package
+_SUBMODULES = {
+        'camel_case': 'changers',
+        'capital_case': 'changers',
+        'constant_case': 'changers',
+        'dot_case': 'changers',
+        'header_case': 'changers',
+        'no_case': 'changers',
+        'param_case': 'changers',
+        'pascal_case': 'changers',
+        'path_case': 'changers',
+        'sentence_case': 'changers',
+        'snake_case': 'changers',
+        'to_snake': 'changers',
+        'to_camel': 'changers',
+        'Words': 'words',
+        'tokenize': 'words',
+        'Tokens': 'words',
+        'tokenize_compact': 'words',
+        'get_tokenizer': 'changers',
+        'set_tokenizer': 'changers',
+        'make_converter': 'changers',
+        'detect_case': 'changers',
+        'Case': 'changers',
+        'get_case': 'changers',
+        'register_case': 'changers',
+        'unregister_case': 'changers',
+        'cache_info': 'cache',
+        'clear_cache': 'cache',
+        'disable_cache': 'cache',
+        'enable_cache': 'cache',
+        'disable_stats': 'stats',
+        'enable_stats': 'stats',
+        'reset_stats': 'stats',
+        'stats_info': 'stats',
+        'camel_case_many': 'batch',
+        'capital_case_many': 'batch',
+        'constant_case_many': 'batch',
+        'dot_case_many': 'batch',
+        'header_case_many': 'batch',
+        'no_case_many': 'batch',
+        'param_case_many': 'batch',
+        'pascal_case_many': 'batch',
+        'path_case_many': 'batch',
+        'sentence_case_many': 'batch',
+        'snake_case_many': 'batch',
+        'camel_view': 'views',
+        'snake_view': 'views',
+        'aconvert': 'aio',
+        'ato_camel': 'aio',
+        'ato_snake': 'aio',
+}
+
+
+def __getattr__(name: str):
+    # submodules which used to be imported by the package itself
+    if name in _SUBMODULES.values():
+        return _importlib.import_module(f'{__name__}.{name}')
+
+    try:
+        submodule = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(
+                f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(_importlib.import_module(f'{__name__}.{submodule}'), name)
+    # later lookups find the function without calling this hook again
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(globals().keys() | _SUBMODULES.keys())
+
+
 __all__ = [
         'camel_case',
         'capital_case',
@@ -18,4 +100,40 @@ __all__ = [
         'snake_case',
         'to_snake',
         'to_camel',
+        'Words',
+        'tokenize',
+        'Tokens',
+        'tokenize_compact',
+        'get_tokenizer',
+        'set_tokenizer',
+        'make_converter',
+        'detect_case',
+        'Case',
+        'get_case',
+        'register_case',
+        'unregister_case',
+        'cache_info',
+        'clear_cache',
+        'disable_cache',
+        'enable_cache',
+        'disable_stats',
+        'enable_stats',
+        'reset_stats',
+        'stats_info',
+        'camel_case_many',
+        'capital_case_many',
+        'constant_case_many',
+        'dot_case_many',
+        'header_case_many',
+        'no_case_many',
+        'param_case_many',
+        'pascal_case_many',
+        'path_case_many',
+        'sentence_case_many',
+        'snake_case_many',
+        'camel_view',
+        'snake_view',
+        'aconvert',
+        'ato_camel',
+        'ato_snake',
 ]
@@ -0,0 +1,251 @@
+"""
+Asynchronous case conversion for asyncio applications.
+
+Converting a large batch of strings or a large nested structure in one go
+blocks the event loop for as long as the conversion takes. The functions of
+this module convert in bounded chunks instead and yield to the event loop
+between chunks, or hand the chunks to an executor. They build on the case
+changing functions and on :func:`case_changer.to_snake` and
+:func:`case_changer.to_camel`, so they give identical results.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Generator, Iterable, List, Optional, Tuple, Union
+
+from case_changer.changers import _deep_change_case_steps
+from case_changer.changers import camel_case
+from case_changer.changers import snake_case
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+
+def _convert_chunk(fn: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    return list(map(fn, chunk))
+
+
+def _step(steps: Generator) -> Tuple[bool, Any]:
+    # walk the next chunk, a `StopIteration` must not escape into a future
+    try:
+        next(steps)
+    except StopIteration as stop:
+        return True, stop.value
+
+    return False, None
+
+
+async def _chunks(source: Union[Iterable[Any], AsyncIterable[Any]],
+                  chunk_size: int) -> AsyncIterator[List[Any]]:
+    """
+    Group the items of a synchronous or asynchronous iterable into lists.
+
+    Parameters
+    ----------
+    source : Iterable[Any] | AsyncIterable[Any]
+        Items to group.
+    chunk_size : int
+        Maximum number of items per list.
+
+    Yields
+    ------
+    chunk : List[Any]
+        Next non-empty list of at most :code:`chunk_size` items.
+    """
+    chunk = []
+    if isinstance(source, AsyncIterable):
+        async for item in source:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for item in source:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+    if chunk:
+        yield chunk
+
+
+async def aconvert(fn: Callable[[Any], Any],
+                   source: Union[Iterable[Any], AsyncIterable[Any]],
+                   chunk_size: int = 1024,
+                   executor: Optional[Executor] = None,
+                   executor_threshold: int = 256) -> AsyncIterator[Any]:
+    """
+    Apply a case changing function to every item of a stream.
+
+    Items are converted in chunks of at most :code:`chunk_size` items. After
+    each chunk, control returns to the event loop, so the loop is never
+    blocked for longer than one chunk takes. Memory use is bounded by the
+    chunk size, too.
+
+    Parameters
+    ----------
+    fn : Callable[[Any], Any]
+        Function to apply to every item e.g., :func:`case_changer.snake_case`
+        or :func:`case_changer.to_camel`.
+    source : Iterable[Any] | AsyncIterable[Any]
+        Items to convert.
+    chunk_size : int, optional
+        Maximum number of items converted at once. Items of asynchronous
+        sources are held back until their chunk is full or the source ends.
+    executor : concurrent.futures.Executor, optional
+        Executor to convert chunks in instead of the event loop's thread.
+        Process pools require :code:`fn` to be picklable, which the case
+        changing functions of :mod:`case_changer.changers` are.
+    executor_threshold : int, optional
+        Minimum number of items of a chunk to hand it to :code:`executor`.
+        Smaller chunks are converted in the event loop's thread.
+
+    Yields
+    ------
+    converted : Any
+        Result of :code:`fn` for every item, in the order of :code:`source`.
+
+    Raises
+    ------
+    ValueError
+        If :code:`chunk_size` is not positive.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from case_changer import snake_case
+    >>> async def main():
+    ...     return [s async for s in aconvert(snake_case, ['fooBar', 'BazQux'])]
+    >>> asyncio.run(main())
+    ['foo_bar', 'baz_qux']
+    """
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size must be positive, got {chunk_size}.')
+
+    loop = asyncio.get_running_loop()
+    async for chunk in _chunks(source, chunk_size):
+        if executor is not None and len(chunk) >= executor_threshold:
+            converted = await loop.run_in_executor(
+                    executor, _convert_chunk, fn, chunk)
+        else:
+            converted = _convert_chunk(fn, chunk)
+            await asyncio.sleep(0)
+
+        for item in converted:
+            yield item
+
+
+async def _ato_case(value: Any,
+                    case_fn: Callable[[str], str],
+                    chunk_size: int,
+                    executor: Optional[Executor]) -> Any:
+    """
+    Change case of the keys of all dictionaries in a nested structure
+    without blocking the event loop.
+
+    Parameters
+    ----------
+    value : Any
+        Structure to change the case of, see
+        :func:`case_changer.changers._deep_change_case`.
+    case_fn : Callable[[str], str]
+        Case changing function to apply to each key.
+    chunk_size : int
+        Number of values to walk before yielding to the event loop.
+    executor : concurrent.futures.Executor | None
+        Executor to walk the structure in once it turns out to need more
+        than one chunk. Must run its tasks in the current process e.g., a
+        thread pool.
+
+    Returns
+    -------
+    value : Any
+        Copy of :code:`value` with the case of its keys changed.
+    """
+    if chunk_size < 1:
+        raise ValueError(f'Chunk size must be positive, got {chunk_size}.')
+
+    loop = asyncio.get_running_loop()
+    steps = _deep_change_case_steps(value, case_fn, chunk_size)
+    # small structures are converted within the first chunk, larger ones are
+    # walked chunk by chunk
+    done, converted = _step(steps)
+    while not done:
+        if executor is None:
+            await asyncio.sleep(0)
+            done, converted = _step(steps)
+        else:
+            done, converted = await loop.run_in_executor(
+                    executor, _step, steps)
+
+    return converted
+
+
+async def ato_camel(value: Any,
+                    chunk_size: int = 1024,
+                    executor: Optional[Executor] = None) -> Any:
+    """
+    Transform the keys of a nested structure into camelCase without blocking
+    the event loop.
+
+    Gives the same result as :func:`case_changer.to_camel`.
+
+    Parameters
+    ----------
+    value : Any
+        Structure to transform, see :func:`case_changer.to_camel`.
+    chunk_size : int, optional
+        Number of values to walk before yielding to the event loop.
+    executor : concurrent.futures.Executor, optional
+        Executor to walk large structures in, see :func:`ato_snake`.
+
+    Returns
+    -------
+    value : Any
+        Copy of :code:`value` with its keys in camelCase.
+    """
+    return await _ato_case(value, camel_case, chunk_size, executor)
+
+
+async def ato_snake(value: Any,
+                    chunk_size: int = 1024,
+                    executor: Optional[Executor] = None) -> Any:
+    """
+    Transform the keys of a nested structure into snake_case without blocking
+    the event loop.
+
+    Gives the same result as :func:`case_changer.to_snake`.
+
+    Parameters
+    ----------
+    value : Any
+        Structure to transform, see :func:`case_changer.to_snake`.
+    chunk_size : int, optional
+        Number of values to walk before yielding to the event loop.
+    executor : concurrent.futures.Executor, optional
+        Executor to walk the structure in once it needs more than one chunk.
+        The walk is not picklable, so this must be an executor running its
+        tasks in the current process e.g., a
+        :class:`~concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    value : Any
+        Copy of :code:`value` with its keys in snake_case.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> asyncio.run(ato_snake({'userId': [{'firstName': 'a'}]}))
+    {'user_id': [{'first_name': 'a'}]}
+    """
+    return await _ato_case(value, snake_case, chunk_size, executor)
+
+
+__all__ = [
+        'aconvert',
+        'ato_camel',
+        'ato_snake',
+]
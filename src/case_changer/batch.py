@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import re as _re
+import time as _time
+from typing import AnyStr, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from case_changer import stats as _instrument
+from case_changer.changers import DEFAULT_SPLIT_REGEXP
+from case_changer.changers import _ASCII_WORD_REGEXP
+from case_changer.changers import _BYTES_TYPES
+from case_changer.changers import _CASES
+from case_changer.changers import _JOINED_TRANSFORMS
+from case_changer.changers import _bytes_transform
+from case_changer.changers import _joiner
+from case_changer.changers import _replace
+from case_changer.changers import get_case
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+# Separator between the strings of a batch in the joined buffer
+_SENTINEL = '\x1e'
+
+# Like `DEFAULT_STRIP_REGEXP` but keeping the sentinel
+_BATCH_STRIP_REGEXP = _re.compile(r'[^A-Z0-9\x1e]+', _re.IGNORECASE)
+
+# Word separators at the start or end of a string in the joined buffer
+_BATCH_TRIM_REGEXP = _re.compile(r'\0?\x1e\0?')
+
+# Sentinels and words of ASCII buffers, found in a single pass. Trying the
+# sentinel first rejects most positions quickest.
+_BATCH_WORD_REGEXP = _re.compile(r'\x1e|' + _ASCII_WORD_REGEXP.pattern)
+
+# Bytes counterparts of the above, where non-ASCII bytes always separate words
+_BYTES_SENTINEL = b'\x1e'
+_BATCH_BYTES_WORD_REGEXP = _re.compile(_BATCH_WORD_REGEXP.pattern.encode())
+
+
+def _change_case_many(strings: Iterable[str],
+                      delimiter: str,
+                      transform: Union[
+                          Callable[[str], str],
+                          Tuple[Callable[[str], str], Callable[[str], str]],
+                      ],
+                      case: str) -> List[str]:
+    """
+    Change case of words in many strings at once.
+
+    ASCII strings are split one by one with the same steps as the case
+    changing function but without its per-call overhead. Other strings, and
+    all strings while statistics are collected, are joined into one buffer so
+    that each regular expression runs only once per batch rather than once
+    per string.
+
+    Parameters
+    ----------
+    strings : Iterable[str]
+        Original strings.
+    delimiter : str
+        Delimiter to put between words.
+    transform : Callable[[str], str] | Tuple[Callable[[str], str], Callable[[
+    str], str]]
+        Transformation callback or tuple of transformation callbacks for the
+        first and the remaining words, see :code:`_CASES`.
+    case : str
+        Name of the case changing function e.g., :code:`snake_case`. Strings
+        which cannot be joined into a buffer are changed one by one by this
+        function, and if statistics are enabled, the call is recorded under
+        the name of the batch function, see :mod:`case_changer.stats`.
+
+    Returns
+    -------
+    changed : List[str]
+        Case-changed strings in the order of :code:`strings`.
+    """
+    strings = strings if isinstance(strings, list) else list(strings)
+    if not strings:
+        return []
+
+    if all(isinstance(s, _BYTES_TYPES) for s in strings):
+        return _change_bytes_case_many(strings, delimiter, transform, case)
+
+    buffer = _SENTINEL.join(strings)
+    # strings containing the sentinel themselves cannot be told apart in the
+    # buffer, so change them one by one
+    if buffer.count(_SENTINEL) != len(strings) - 1 or _SENTINEL in delimiter:
+        return list(map(get_case(case).convert, strings))
+
+    stats = _instrument._stats
+    ascii = buffer.isascii()
+    if ascii and stats is None:
+        return _change_ascii_case_many(strings, get_case(case).convert)
+
+    times = None if stats is None else {}
+    if ascii:
+        buffer = _find_buffer_words(buffer, _BATCH_WORD_REGEXP, _SENTINEL,
+                                    "\0", times)
+    else:
+        buffer = _tokenize_buffer(buffer, DEFAULT_SPLIT_REGEXP,
+                                  _BATCH_STRIP_REGEXP, _BATCH_TRIM_REGEXP,
+                                  _SENTINEL, "\0", "\\1\0\\2", times)
+    changed = _split_buffer(buffer, strings, _SENTINEL, "\0", delimiter,
+                            transform, times)
+
+    if stats is not None:
+        stats.record_batch(f'{case}_many', map(len, strings), **times)
+
+    return changed
+
+
+def _change_ascii_case_many(strings: List[str],
+                            convert: Callable[[str], str]) -> List[str]:
+    """
+    Change case of words in many ASCII strings at once.
+
+    ASCII strings are split with a single regular expression each, which is
+    faster than the several passes over a joined buffer. So they are changed
+    one by one like :code:`convert` does, without the overhead of calling it
+    for every string.
+
+    Parameters
+    ----------
+    strings : List[str]
+        Original ASCII strings.
+    convert : Callable[[str], str]
+        Case changing function created by
+        :func:`case_changer.changers.make_converter`, whose joiner and
+        canonical check are used.
+
+    Returns
+    -------
+    changed : List[str]
+        Case-changed strings in the order of :code:`strings`.
+    """
+    findall = _ASCII_WORD_REGEXP.findall
+    join = convert.join
+    is_canonical = convert.is_canonical
+
+    changed = []
+    append = changed.append
+    for s in strings:
+        if is_canonical is not None and is_canonical(s):
+            append(s)
+            continue
+        words = findall(s)
+        append(join(words) if words else s)
+
+    return changed
+
+
+def _change_bytes_case_many(strings: List[Union[bytes, bytearray,
+                                                memoryview]],
+                            delimiter: str,
+                            transform: Union[
+                                Callable[[str], str],
+                                Tuple[Callable[[str], str],
+                                      Callable[[str], str]],
+                            ],
+                            case: str) -> List[bytes]:
+    """
+    Change case of words in many bytes-like objects at once.
+
+    Works like :func:`_change_case_many` on a bytes buffer, with the bytes
+    counterparts of the patterns and of :code:`transform`, so that the input
+    is never decoded. Non-ASCII bytes always separate words.
+
+    Parameters
+    ----------
+    strings : List[bytes | bytearray | memoryview]
+        Original UTF-8 encoded strings.
+    delimiter : str
+        Delimiter to put between words.
+    transform : Callable[[str], str] | Tuple[Callable[[str], str], Callable[[
+    str], str]]
+        Transformation callback or tuple of transformation callbacks, see
+        :func:`_change_case_many`.
+    case : str
+        Name of the case changing function, see :func:`_change_case_many`.
+
+    Returns
+    -------
+    changed : List[bytes]
+        Case-changed strings in the order of :code:`strings`.
+    """
+    strings = [bytes(s) for s in strings]
+    delimiter = delimiter.encode('utf-8')
+    if isinstance(transform, Tuple):
+        transform = tuple(map(_bytes_transform, transform))
+    else:
+        transform = _bytes_transform(transform)
+
+    buffer = _BYTES_SENTINEL.join(strings)
+    if buffer.count(_BYTES_SENTINEL) != len(strings) - 1 \
+            or _BYTES_SENTINEL in delimiter:
+        return list(map(get_case(case).convert, strings))
+
+    stats = _instrument._stats
+    times = None if stats is None else {}
+    buffer = _find_buffer_words(buffer, _BATCH_BYTES_WORD_REGEXP,
+                                _BYTES_SENTINEL, b"\0", times)
+    changed = _split_buffer(buffer, strings, _BYTES_SENTINEL, b"\0",
+                            delimiter, transform, times)
+
+    if stats is not None:
+        stats.record_batch(f'{case}_many', map(len, strings), **times)
+
+    return changed
+
+
+def _tokenize_buffer(buffer: AnyStr,
+                     split_patterns: Sequence[_re.Pattern],
+                     strip_pattern: _re.Pattern,
+                     trim_pattern: _re.Pattern,
+                     sentinel: AnyStr,
+                     null: AnyStr,
+                     boundary: AnyStr,
+                     times: Optional[Dict[str, float]] = None) -> AnyStr:
+    """
+    Separate the words of the strings of a joined buffer.
+
+    Parameters
+    ----------
+    buffer : str | bytes
+        Strings joined by :code:`sentinel`.
+    split_patterns : Sequence[_re.Pattern]
+        Patterns with two groups each, between which a word boundary is
+        inserted.
+    strip_pattern : _re.Pattern
+        Pattern of the characters separating words, except for
+        :code:`sentinel`.
+    trim_pattern : _re.Pattern
+        Pattern of word separators next to :code:`sentinel`.
+    sentinel : str | bytes
+        Separator between the strings in :code:`buffer`.
+    null : str | bytes
+        Separator to put between the words.
+    boundary : str | bytes
+        Replacement template inserting :code:`null` between the two groups of
+        each split pattern.
+    times : Dict[str, float], optional
+        If given, the time spent splitting and stripping is stored under
+        :code:`split` and :code:`strip`.
+
+    Returns
+    -------
+    buffer : str | bytes
+        Buffer with the words separated by :code:`null` and the strings
+        separated by :code:`sentinel`.
+    """
+    if times is not None:
+        start = _time.perf_counter()
+
+    buffer = _replace(buffer, split_patterns, boundary)
+
+    if times is not None:
+        split = _time.perf_counter()
+        times['split'] = split - start
+
+    buffer = trim_pattern.sub(
+            sentinel, strip_pattern.sub(null, buffer)).strip(null)
+
+    if times is not None:
+        times['strip'] = _time.perf_counter() - split
+
+    return buffer
+
+
+def _find_buffer_words(buffer: AnyStr,
+                       word_pattern: _re.Pattern,
+                       sentinel: AnyStr,
+                       null: AnyStr,
+                       times: Optional[Dict[str, float]] = None) -> AnyStr:
+    """
+    Separate the words of the strings of a joined ASCII buffer.
+
+    Gives the same buffer as :func:`_tokenize_buffer`, but finds every word
+    and sentinel with a single regular expression instead of inserting word
+    boundaries and stripping separators in several passes.
+
+    Parameters
+    ----------
+    buffer : str | bytes
+        Strings joined by :code:`sentinel`.
+    word_pattern : _re.Pattern
+        Pattern matching each word and each :code:`sentinel`.
+    sentinel : str | bytes
+        Separator between the strings in :code:`buffer`.
+    null : str | bytes
+        Separator to put between the words.
+    times : Dict[str, float], optional
+        If given, the time spent finding the words is stored under
+        :code:`split`, and the time spent joining them under :code:`strip`.
+
+    Returns
+    -------
+    buffer : str | bytes
+        Buffer with the words separated by :code:`null` and the strings
+        separated by :code:`sentinel`.
+    """
+    if times is not None:
+        start = _time.perf_counter()
+
+    words = word_pattern.findall(buffer)
+
+    if times is not None:
+        split = _time.perf_counter()
+        times['split'] = split - start
+
+    # no separator is left next to a sentinel, even between two of them
+    buffer = null.join(words).replace(null + sentinel, sentinel).replace(
+            sentinel + null, sentinel)
+
+    if times is not None:
+        times['strip'] = _time.perf_counter() - split
+
+    return buffer
+
+
+def _split_buffer(buffer: AnyStr,
+                  strings: List[AnyStr],
+                  sentinel: AnyStr,
+                  null: AnyStr,
+                  delimiter: AnyStr,
+                  transform: Union[
+                      Callable[[AnyStr], AnyStr],
+                      Tuple[Callable[[AnyStr], AnyStr],
+                            Callable[[AnyStr], AnyStr]],
+                  ],
+                  times: Optional[Dict[str, float]] = None) -> List[AnyStr]:
+    """
+    Transform and join the words of a prepared buffer.
+
+    Parameters
+    ----------
+    buffer : str | bytes
+        Joined strings with their words separated by :code:`null` and the
+        strings separated by :code:`sentinel`.
+    strings : List[str | bytes]
+        Original strings, returned for items without any words.
+    sentinel : str | bytes
+        Separator between the strings in :code:`buffer`.
+    null : str | bytes
+        Separator between the words in :code:`buffer`.
+    delimiter : str | bytes
+        Delimiter to put between words.
+    transform : Callable[[AnyStr], AnyStr] | Tuple[Callable[[AnyStr],
+    AnyStr], Callable[[AnyStr], AnyStr]]
+        Transformation callback or tuple of transformation callbacks.
+    times : Dict[str, float], optional
+        If given, the time spent transforming and joining the words is
+        stored under :code:`transform` and :code:`join`. The words are then
+        transformed and joined in separate passes.
+
+    Returns
+    -------
+    changed : List[str | bytes]
+        Case-changed strings in the order of :code:`strings`.
+    """
+    if times is not None:
+        return _split_buffer_timed(buffer, strings, sentinel, null,
+                                   delimiter, transform, times)
+
+    # empty items do not contain any words and are returned unchanged
+    if transform in _JOINED_TRANSFORMS:
+        items = transform(buffer).replace(null, delimiter).split(sentinel)
+        return [item or s for item, s in zip(items, strings)]
+
+    if not isinstance(transform, Tuple):
+        transform = (transform, transform)
+    join = _joiner(delimiter, *transform)
+
+    return [join(item.split(null)) if item else s
+            for item, s in zip(buffer.split(sentinel), strings)]
+
+
+def _split_buffer_timed(buffer: AnyStr,
+                        strings: List[AnyStr],
+                        sentinel: AnyStr,
+                        null: AnyStr,
+                        delimiter: AnyStr,
+                        transform: Union[
+                            Callable[[AnyStr], AnyStr],
+                            Tuple[Callable[[AnyStr], AnyStr],
+                                  Callable[[AnyStr], AnyStr]],
+                        ],
+                        times: Dict[str, float]) -> List[AnyStr]:
+    """
+    Transform and join the words of a prepared buffer timing each stage.
+
+    See :func:`_split_buffer` for the parameters and return value.
+    """
+    clock = _time.perf_counter
+    start = clock()
+    if transform in _JOINED_TRANSFORMS:
+        buffer = transform(buffer)
+        transformed = clock()
+        items = buffer.replace(null, delimiter).split(sentinel)
+        changed = [item or s for item, s in zip(items, strings)]
+    else:
+        first, rest = transform if isinstance(transform, Tuple) \
+            else (transform, transform)
+        words = [item.split(null) if item else None
+                 for item in buffer.split(sentinel)]
+        words = [[first(w[0]), *map(rest, w[1:])] if w else None
+                 for w in words]
+        transformed = clock()
+        changed = [delimiter.join(w) if w else s
+                   for w, s in zip(words, strings)]
+
+    times['transform'] = transformed - start
+    times['join'] = clock() - transformed
+
+    return changed
+
+
+def _many(case: str) -> Callable[[Iterable[str]], List[str]]:
+    """
+    Create the batch variant of a case changing function.
+
+    Parameters
+    ----------
+    case : str
+        Name of the case changing function e.g., :code:`snake_case`.
+
+    Returns
+    -------
+    many : Callable[[Iterable[str]], List[str]]
+        Function taking an iterable of strings and returning the list of
+        transformed strings.
+    """
+    delimiter, transform = _CASES[case]
+    name = f'{case}_many'
+
+    def many(strings: Iterable[str]) -> List[str]:
+        return _change_case_many(strings, delimiter, transform, case)
+
+    many.__name__ = many.__qualname__ = name
+    many.__doc__ = f"""
+    Transform many strings like :func:`case_changer.{case}`.
+
+    Parameters
+    ----------
+    strings : Iterable[str]
+        Original strings to transform.
+
+    Returns
+    -------
+    changed : List[str]
+        Transformed strings in the order of :code:`strings`.
+    """
+
+    return many
+
+
+camel_case_many = _many('camel_case')
+capital_case_many = _many('capital_case')
+constant_case_many = _many('constant_case')
+dot_case_many = _many('dot_case')
+header_case_many = _many('header_case')
+no_case_many = _many('no_case')
+param_case_many = _many('param_case')
+pascal_case_many = _many('pascal_case')
+path_case_many = _many('path_case')
+sentence_case_many = _many('sentence_case')
+snake_case_many = _many('snake_case')
+
+__all__ = [
+        'camel_case_many',
+        'capital_case_many',
+        'constant_case_many',
+        'dot_case_many',
+        'header_case_many',
+        'no_case_many',
+        'param_case_many',
+        'pascal_case_many',
+        'path_case_many',
+        'sentence_case_many',
+        'snake_case_many',
+]
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Optional
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+CacheInfo = namedtuple('CacheInfo',
+                       ('hits', 'misses', 'evictions', 'maxsize', 'currsize'))
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Size-bounded mapping which evicts the least recently used entry.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries kept in the cache. Must be positive.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups which found their key.
+    misses : int
+        Number of lookups which did not find their key.
+    evictions : int
+        Number of entries dropped to stay within :code:`maxsize`.
+    """
+
+    __slots__ = ('maxsize', 'hits', 'misses', 'evictions', '_data', '_lock')
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError(f'Cache size must be positive, got {maxsize}.')
+
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key and mark it as most recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key to look up.
+        default : Any, optional
+            Value to return if :code:`key` is not cached.
+
+        Returns
+        -------
+        value : Any
+            Cached value of :code:`key` or :code:`default`.
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used entry if full.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key to cache :code:`value` under.
+        value : Any
+            Value to cache.
+        """
+        with self._lock:
+            data = self._data
+            data[key] = value
+            data.move_to_end(key)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Report the statistics of the cache.
+
+        Returns
+        -------
+        info : CacheInfo
+            Hits, misses, evictions, maximum and current size of the cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions,
+                         self.maxsize, len(self._data))
+
+
+# Cache shared by all case changing functions, `None` while caching is disabled
+_cache: Optional[LRUCache] = None
+
+
+def enable_cache(maxsize: int = 4096) -> None:
+    """
+    Cache the results of the case changing functions.
+
+    The cache is shared by all case changing functions and thus also by
+    :func:`to_snake` and :func:`to_camel`. Enabling an already enabled cache
+    replaces it by an empty one of the new size.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of cached results. Once full, the least recently used
+        result is evicted.
+    """
+    global _cache
+
+    _cache = LRUCache(maxsize)
+
+
+def disable_cache() -> None:
+    """
+    Stop caching the results of the case changing functions.
+    """
+    global _cache
+
+    _cache = None
+
+
+def clear_cache() -> None:
+    """
+    Drop all cached results and reset the cache statistics.
+    """
+    if _cache is not None:
+        _cache.clear()
+
+
+def cache_info() -> Optional[CacheInfo]:
+    """
+    Report the statistics of the cache.
+
+    Returns
+    -------
+    info : CacheInfo | None
+        Hits, misses, evictions, maximum and current size of the cache or
+        `None` if caching is disabled.
+    """
+    return None if _cache is None else _cache.info()
+
+
+__all__ = [
+        'CacheInfo',
+        'LRUCache',
+        'cache_info',
+        'clear_cache',
+        'disable_cache',
+        'enable_cache',
+]
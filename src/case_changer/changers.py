@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import functools
+import itertools as _itertools
 import re as _re
-from typing import Callable, Sequence, Tuple, Union
-from collections import OrderedDict
+import string as _string
+import sys as _sys
+import time as _time
+from array import array
+from typing import AnyStr, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+from collections import OrderedDict, namedtuple
+
+from case_changer import cache as _caching
+from case_changer import stats as _instrument
 
 __author__ = 'Philipp Tempel'
 __email__ = 'p.tempel@tudelft.nl'
@@ -45,67 +54,558 @@ def _replace(string: str,
         return string
 
 
-def _change_case(s: str,
-                 delimiter: str,
-                 transform: Union[
-                     Callable[[str], str],
-                     Tuple[Callable[[str], str], Callable[[str], str]],
-                 ]):
+# Words of pure ASCII strings, matching exactly what the default split and
+# strip regular expressions give: an optional run of capitals followed by
+# lower case letters and digits, where a run of several capitals followed by
+# a lower case letter leaves its last capital to the next word
+_ASCII_WORD_REGEXP = _re.compile(
+        r'[A-Z]*[0-9][a-z0-9]*'
+        r'|[A-Z]?[a-z][a-z0-9]*'
+        r'|[A-Z]+(?![a-z])')
+
+# Words of bytes, which are split like ASCII strings. Non-ASCII bytes always
+# separate words.
+_ASCII_WORD_BYTES_REGEXP = _re.compile(_ASCII_WORD_REGEXP.pattern.encode())
+
+
+def _regex_words(s: str) -> List[str]:
     """
-    Change case of words in a string separated by a certain delimiter.
+    Split a string into its words using the default regular expressions.
+
+    Words are separated at every lower-to-upper case transition, before the
+    last capital of an acronym that is followed by a capitalized word, and at
+    every run of non-alphanumeric characters. Pure ASCII strings take a fast
+    path finding all words with a single regular expression.
 
     Parameters
     ----------
     s : str
-         Original string with words separated by :code:`delimiter`, each of
-         which is to be changed in case.
-    delimiter : str
-        Delimiter between words in :code:`s` to use for splitting the string
-        into parts.
-    transform : Callable[[str], str] | Tuple[Callable[[str], str], Callable[[
-    str], str]]
-        A transformation callback or a list of transformation callbacks. Each
-        callback must take one argument (the original word) and return the
-        case-changed word. If :code:`transform` is a single callback, then it
-        will be applied to every word. This can be useful if every word
-        should be e.g., upper-cased. If :code:`transform` is a tuple of two
-        callbacks, then the first callback :code:`transform[0]` will be
-        applied to only the first word, and the remaining words will be
-        processed by the second callback :code:`transform[1]`.
+        Original string to split into words.
+
+    Returns
+    -------
+    words : List[str]
+        Words of :code:`s` in their original case. Empty if :code:`s` does
+        not contain any alphanumeric characters.
+    """
+    if s.isascii():
+        return _ASCII_WORD_REGEXP.findall(s)
+
+    return _pattern_words(s)
+
+
+def _pattern_words(s: str) -> List[str]:
+    """
+    Split a string into its words applying the default regular expressions
+    one after another.
+
+    See :func:`_regex_words` for the parameters and return value.
+    """
+    for reg in DEFAULT_SPLIT_REGEXP:
+        s = reg.sub("\\1\0\\2", s)
+    s = DEFAULT_STRIP_REGEXP.sub("\0", s).strip("\0")
+
+    # split word into pieces
+    return s.split("\0") if s else []
+
+
+_pattern_words.patterns = (DEFAULT_SPLIT_REGEXP, DEFAULT_STRIP_REGEXP)
+
+
+def _regex_tokenizer(split_patterns: Sequence[_re.Pattern],
+                     strip_pattern: _re.Pattern) -> Callable[[str], List[str]]:
+    """
+    Create a tokenizer splitting strings by custom regular expressions.
+
+    Parameters
+    ----------
+    split_patterns : Sequence[_re.Pattern]
+        Patterns with two groups each, between which a word boundary is
+        inserted, see :code:`DEFAULT_SPLIT_REGEXP`.
+    strip_pattern : _re.Pattern
+        Pattern of the characters separating words, see
+        :code:`DEFAULT_STRIP_REGEXP`. Tokenizes bytes if it is a bytes
+        pattern, in which case all patterns must be bytes patterns.
+
+    Returns
+    -------
+    tokenizer : Callable[[str], List[str]]
+        Function splitting a string into its words like :func:`_regex_words`.
+    """
+    split_patterns = tuple(split_patterns)
+    null = b"\0" if isinstance(strip_pattern.pattern, bytes) else "\0"
+    boundary = (b"\\1\0\\2" if isinstance(strip_pattern.pattern, bytes)
+                else "\\1\0\\2")
+
+    def tokenizer(s: str) -> List[str]:
+        for reg in split_patterns:
+            s = reg.sub(boundary, s)
+        s = strip_pattern.sub(null, s).strip(null)
+
+        return s.split(null) if s else []
+
+    # the patterns let the instrumentation time splitting and stripping apart
+    tokenizer.patterns = (split_patterns, strip_pattern)
+
+    return tokenizer
+
+
+def _bytes_pattern(pattern: Union[str, _re.Pattern]) -> _re.Pattern:
+    """
+    Compile the bytes counterpart of a string pattern.
+
+    Parameters
+    ----------
+    pattern : str | _re.Pattern
+        Pattern to compile for bytes.
 
     Returns
     -------
+    pattern : _re.Pattern
+        Pattern matching bytes with the same expression and flags, except
+        for Unicode matching.
+    """
+    if isinstance(pattern, str):
+        pattern = _re.compile(pattern)
+    if isinstance(pattern.pattern, bytes):
+        return pattern
+
+    return _re.compile(pattern.pattern.encode('utf-8'),
+                       pattern.flags & ~_re.UNICODE)
+
+
+# Character classes of the single-pass tokenizer
+_SEPARATOR, _LOWER, _UPPER, _DIGIT, _OTHER = range(5)
+
+# Class of every character :code:`DEFAULT_STRIP_REGEXP` does not strip. Besides
+# ASCII letters and digits, these are the non-ASCII characters which
+# case-insensitively match :code:`[A-Z]`. They belong to words, but like in
+# :code:`DEFAULT_SPLIT_REGEXP` they never start a new word.
+_CHAR_CLASSES = dict(
+        [(c, _LOWER) for c in _string.ascii_lowercase]
+        + [(c, _UPPER) for c in _string.ascii_uppercase]
+        + [(c, _DIGIT) for c in _string.digits]
+        + [(c, _OTHER) for c in '\u0130\u0131\u017f\u212a']
+)
+
+
+def _scan_words(s: str,
+                spans: bool = False
+                ) -> Union[List[str], List[Tuple[int, int]]]:
+    """
+    Split a string into its words in a single left-to-right scan.
+
+    Gives the same words as :func:`_regex_words` without creating any
+    intermediate strings.
+
+    Parameters
+    ----------
     s : str
-        Case-changed string.
+        Original string to split into words.
+    spans : bool, optional
+        Whether to return the start and end offsets of the words instead of
+        the words, which creates no strings at all.
+
+    Returns
+    -------
+    words : List[str] | List[Tuple[int, int]]
+        Words of :code:`s` in their original case, or their offsets. Empty if
+        :code:`s` does not contain any alphanumeric characters.
+    """
+    classes = _CHAR_CLASSES
+    words = []
+    append = words.append
+    n = len(s)
+    start = -1
+    prev = _SEPARATOR
+    for i, c in enumerate(s):
+        cls = classes.get(c, _SEPARATOR)
+        if cls == _SEPARATOR:
+            if start >= 0:
+                append((start, i) if spans else s[start:i])
+                start = -1
+        elif start < 0:
+            start = i
+        elif cls == _UPPER and (
+                prev == _LOWER or prev == _DIGIT
+                or (prev == _UPPER and i + 1 < n
+                    and classes.get(s[i + 1]) == _LOWER)):
+            append((start, i) if spans else s[start:i])
+            start = i
+        prev = cls
+
+    if start >= 0:
+        append((start, n) if spans else s[start:])
+
+    return words
+
+
+# Available tokenizers, see :func:`set_tokenizer`
+_TOKENIZERS = {
+        'regex': _regex_words,
+        'scan': _scan_words,
+}
+
+# Tokenizer used to split strings into words
+_split_words = _regex_words
+
+
+def get_tokenizer() -> str:
+    """
+    Get the name of the tokenizer used to split strings into words.
+
+    Returns
+    -------
+    name : str
+        Name of the current tokenizer, see :func:`set_tokenizer`.
     """
-    ss: str = _replace(
-            _replace(s, DEFAULT_SPLIT_REGEXP, "\\1\0\\2"),
-            DEFAULT_STRIP_REGEXP,
-            "\0")
+    for name, tokenizer in _TOKENIZERS.items():
+        if tokenizer is _split_words:
+            return name
+
+
+def set_tokenizer(name: str) -> None:
+    """
+    Set the tokenizer used to split strings into words.
+
+    Parameters
+    ----------
+    name : str
+        Name of the tokenizer. :code:`regex` (the default) applies
+        :code:`DEFAULT_SPLIT_REGEXP` and :code:`DEFAULT_STRIP_REGEXP`
+        one after another, :code:`scan` finds the words in a single scan
+        over the string. Both give the same words.
+
+    Raises
+    ------
+    ValueError
+        If :code:`name` does not denote a known tokenizer.
+    """
+    global _split_words
 
     try:
-        start = 0
-        end = len(ss)
-        while ss[start] == "\0":
-            start += 1
-        while ss[end - 1] == "\0":
-            end -= 1
+        _split_words = _TOKENIZERS[name]
+    except KeyError:
+        raise ValueError(f'Unknown tokenizer {name!r}, must be one of '
+                         f'{", ".join(_TOKENIZERS)}.') from None
 
-        # split word into pieces
-        words = ss[start:end].split("\0")
 
-        if not isinstance(transform, Tuple):
-            transform = (transform, transform)
+def _word_offsets(s: str) -> array:
+    """
+    Find the offsets of the words of a string.
 
-        words = [transform[0](words[0])] + [transform[1](w) for w in words[1:]]
+    Parameters
+    ----------
+    s : str
+        Original string to split into words.
+
+    Returns
+    -------
+    offsets : array
+        Unsigned integer array of the start and end offsets of every word of
+        :code:`s` in turn, bounding the same words as either tokenizer finds.
+    """
+    if not s.isascii():
+        return array('I', _itertools.chain.from_iterable(
+                _scan_words(s, spans=True)))
 
-        # words = transform[0](words[0], 0) + \
-        #         + [transform(w, idx) for idx, w in enumerate(words, start=1)]
+    offsets = array('I')
+    extend = offsets.extend
+    for match in _ASCII_WORD_REGEXP.finditer(s):
+        extend(match.span())
+
+    return offsets
+
+
+def _change_case_timed(stats: _instrument.Stats,
+                       name: str,
+                       s: AnyStr,
+                       tokenize: Callable[[AnyStr], List[AnyStr]],
+                       delimiter: AnyStr,
+                       first: Callable[[AnyStr], AnyStr],
+                       rest: Callable[[AnyStr], AnyStr]) -> AnyStr:
+    """
+    Change case of words in a string timing each stage.
+
+    Gives the same result as the untimed conversion and records it in
+    :code:`stats`. If :code:`tokenize` splits and strips in separate passes,
+    these are timed apart, otherwise tokenizing is timed as splitting.
+
+    Parameters
+    ----------
+    stats : case_changer.stats.Stats
+        Recorder to record the call and its stage times in.
+    name : str
+        Name of the case changing function to record the call under.
+    s : str | bytes
+        Original string.
+    tokenize : Callable[[AnyStr], List[AnyStr]]
+        Tokenizer splitting :code:`s` into its words.
+    delimiter : str | bytes
+        Delimiter to put between the transformed words.
+    first : Callable[[AnyStr], AnyStr]
+        Transformation callback applied to the first word.
+    rest : Callable[[AnyStr], AnyStr]
+        Transformation callback applied to the remaining words.
 
-        return delimiter.join(words)
-    except IndexError:
+    Returns
+    -------
+    s : str | bytes
+        Case-changed string.
+    """
+    clock = _time.perf_counter
+    if tokenize is _regex_words and not s.isascii():
+        tokenize = _pattern_words
+    patterns = getattr(tokenize, 'patterns', None)
+
+    start = clock()
+    if patterns is None:
+        words = tokenize(s)
+        split = clock()
+        strip = split
+    else:
+        split_patterns, strip_pattern = patterns
+        null, boundary = ((b"\0", b"\\1\0\\2") if isinstance(s, bytes)
+                          else ("\0", "\\1\0\\2"))
+        text = s
+        for reg in split_patterns:
+            text = reg.sub(boundary, text)
+        split = clock()
+        text = strip_pattern.sub(null, text).strip(null)
+        words = text.split(null) if text else []
+        strip = clock()
+
+    if not words:
+        stats.record(name, len(s), split=split - start, strip=strip - split)
         return s
 
+    words = [first(words[0]), *map(rest, words[1:])]
+    transform = clock()
+    changed = delimiter.join(words)
+    join = clock()
+
+    stats.record(name, len(s), split=split - start, strip=strip - split,
+                 transform=transform - strip, join=join - transform)
+
+    return changed
+
+
+# Transforms which give the same result on the joined words as on each word
+_JOINED_TRANSFORMS = (str.lower, str.upper, bytes.lower, bytes.upper)
+
+# Types of bytes-like objects accepted by the case changing functions
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+
+def _joiner(delimiter: AnyStr,
+            first: Callable[[AnyStr], AnyStr],
+            rest: Callable[[AnyStr], AnyStr]
+            ) -> Callable[[Iterable[AnyStr]], AnyStr]:
+    """
+    Create a function transforming words and joining them by a delimiter.
+
+    Parameters
+    ----------
+    delimiter : str | bytes
+        Delimiter to put between the transformed words.
+    first : Callable[[AnyStr], AnyStr]
+        Transformation callback applied to the first word.
+    rest : Callable[[AnyStr], AnyStr]
+        Transformation callback applied to the remaining words.
+
+    Returns
+    -------
+    join : Callable[[Iterable[AnyStr]], AnyStr]
+        Function taking a non-empty iterable of words and returning the
+        joined transformed words.
+    """
+    if first is rest and first in _JOINED_TRANSFORMS \
+            and first(delimiter) == delimiter:
+        def join(words):
+            return first(delimiter.join(words))
+    elif first is rest:
+        def join(words):
+            return delimiter.join(map(first, words))
+    else:
+        def join(words):
+            words = iter(words)
+            return delimiter.join([first(next(words)), *map(rest, words)])
+
+    return join
+
+
+def make_converter(delimiter: str,
+                   first: Callable[[str], str],
+                   rest: Optional[Callable[[str], str]] = None,
+                   split_patterns: Optional[
+                       Sequence[Union[str, _re.Pattern]]] = None,
+                   strip_pattern: Optional[Union[str, _re.Pattern]] = None,
+                   canonical: Optional[Union[str, _re.Pattern]] = None,
+                   ) -> Callable[[str], str]:
+    """
+    Create a case changing function.
+
+    All setup e.g., compiling patterns and choosing how to apply the
+    transforms, happens once here instead of on every call, so custom cases
+    are as fast as the built-in ones, which are created by this factory, too.
+
+    Parameters
+    ----------
+    delimiter : str
+        Delimiter to put between the transformed words.
+    first : Callable[[str], str]
+        Transformation callback applied to the first word.
+    rest : Callable[[str], str], optional
+        Transformation callback applied to the remaining words. Defaults to
+        :code:`first`.
+    split_patterns : Sequence[str | _re.Pattern], optional
+        Patterns with two groups each, between which a word boundary is
+        inserted. Defaults to :code:`DEFAULT_SPLIT_REGEXP`.
+    strip_pattern : str | _re.Pattern, optional
+        Pattern of the characters separating words. Defaults to
+        :code:`DEFAULT_STRIP_REGEXP`.
+    canonical : str | _re.Pattern, optional
+        Pattern fully matching only strings which are already in the case,
+        that is which the converter returns unchanged. Such strings are
+        returned right away without splitting and joining them. The pattern
+        may reject canonical strings, but it must never match others.
+
+    Returns
+    -------
+    convert : Callable[[str], str]
+        Function transforming a string into the case. Like the built-in
+        case changing functions, it returns strings without any words
+        unchanged and uses the cache of :mod:`case_changer.cache` if enabled.
+        Bytes-like input is split with bytes patterns and transformed with
+        the bytes counterparts of the transforms where known, and returned
+        as :code:`bytes`. Its :code:`join` and :code:`is_canonical`
+        attributes render and recognize strings like it, see
+        :meth:`case_changer.words.Words.render`.
+
+    Examples
+    --------
+    >>> train_case = make_converter('-', str.capitalize)
+    >>> train_case('XMLHttpRequest')
+    'Xml-Http-Request'
+    >>> ada_case = make_converter('_', str.capitalize)
+    >>> ada_case('some identifier')
+    'Some_Identifier'
+    """
+    if rest is None:
+        rest = first
+
+    if split_patterns is None and strip_pattern is None:
+        tokenizer = None
+    else:
+        tokenizer = _regex_tokenizer(
+                [_re.compile(p) for p in (
+                        DEFAULT_SPLIT_REGEXP if split_patterns is None
+                        else split_patterns)],
+                _re.compile(DEFAULT_STRIP_REGEXP if strip_pattern is None
+                            else strip_pattern))
+
+    join = _joiner(delimiter, first, rest)
+
+    # the bytes counterparts of the tokenizer and the transforms
+    if tokenizer is None:
+        bytes_tokenizer = _ASCII_WORD_BYTES_REGEXP.findall
+    else:
+        bytes_tokenizer = _regex_tokenizer(
+                [_bytes_pattern(p) for p in (
+                        DEFAULT_SPLIT_REGEXP if split_patterns is None
+                        else split_patterns)],
+                _bytes_pattern(DEFAULT_STRIP_REGEXP if strip_pattern is None
+                               else strip_pattern))
+    bytes_transforms = (delimiter.encode('utf-8'),
+                        _bytes_transform(first),
+                        _bytes_transform(rest))
+    bytes_join = _joiner(*bytes_transforms)
+
+    if canonical is None:
+        is_canonical = bytes_is_canonical = None
+    else:
+        is_canonical = _re.compile(canonical).fullmatch
+        bytes_is_canonical = _bytes_pattern(canonical).fullmatch
+
+    # identifies the results of this converter in the shared cache
+    token = object()
+
+    def convert(s: str) -> str:
+        # bytes-like input is converted with bytes patterns and transforms
+        # without decoding it
+        if isinstance(s, _BYTES_TYPES):
+            s = bytes(s)
+            tokenize, join_, canonical_ = (bytes_tokenizer, bytes_join,
+                                           bytes_is_canonical)
+        else:
+            tokenize, join_, canonical_ = (tokenizer or _split_words, join,
+                                           is_canonical)
+
+        stats = _instrument._stats
+        if canonical_ is not None and canonical_(s):
+            if stats is not None:
+                stats.record(convert.__name__, len(s))
+            return s
+
+        cache = _caching._cache
+        if cache is not None:
+            key = (token, s)
+            changed = cache.get(key)
+            if changed is not None:
+                if stats is not None:
+                    stats.record(convert.__name__, len(s))
+                return changed
+
+        # the default tokenizer is looked up on every call so that it follows
+        # `set_tokenizer`
+        if stats is None:
+            words = tokenize(s)
+            changed = join_(words) if words else s
+        elif type(s) is bytes:
+            changed = _change_case_timed(stats, convert.__name__, s, tokenize,
+                                         *bytes_transforms)
+        else:
+            changed = _change_case_timed(stats, convert.__name__, s, tokenize,
+                                         delimiter, first, rest)
+
+        if cache is not None:
+            cache.put(key, changed)
+
+        return changed
+
+    # words tokenized once are rendered like the converter would render them,
+    # see `case_changer.words.Words.render`
+    convert.join = join
+    convert.is_canonical = is_canonical
+
+    return convert
+
+
+def _builtin(fn: Callable[[str], str]) -> Callable[[str], str]:
+    """
+    Define a built-in case changing function from its entry in :code:`_CASES`.
+
+    Parameters
+    ----------
+    fn : Callable[[str], str]
+        Stub function whose name denotes the case and whose docstring
+        documents it.
+
+    Returns
+    -------
+    convert : Callable[[str], str]
+        Case changing function created by :func:`make_converter`, carrying
+        the name and docstring of :code:`fn`.
+    """
+    delimiter, transform = _CASES[fn.__name__]
+    if not isinstance(transform, Tuple):
+        transform = (transform, transform)
+
+    return functools.update_wrapper(
+            make_converter(delimiter, *transform,
+                           canonical=_CANONICAL_REGEXPS[fn.__name__]),
+            fn)
+
 
 def _replace_separator_by(string: str, sep: str, by: str):
     """
@@ -128,6 +628,283 @@ def _replace_separator_by(string: str, sep: str, by: str):
     return _re.sub(r'({})'.format(sep), by, string)
 
 
+def _capitalize_or_number(word: str) -> str:
+    """
+    Capitalize a word or prefix it with an underscore if it is numeric.
+
+    Used for the non-leading words of delimiter-less cases like camelCase,
+    where a numeric word would otherwise merge with its predecessor.
+
+    Parameters
+    ----------
+    word : str
+        Word to transform.
+
+    Returns
+    -------
+    word : str
+        Transformed word.
+    """
+    return f'_{word}' if word.isnumeric() else word.capitalize()
+
+
+def _capitalize_or_number_bytes(word: bytes) -> bytes:
+    """
+    Capitalize a word of bytes or prefix it with an underscore if it is
+    numeric, see :func:`_capitalize_or_number`.
+    """
+    return b'_' + word if word.isdigit() else word.capitalize()
+
+
+# Bytes counterparts of the transforms of the built-in cases
+_BYTES_TRANSFORMS = {
+        str.capitalize: bytes.capitalize,
+        str.lower: bytes.lower,
+        str.upper: bytes.upper,
+        _capitalize_or_number: _capitalize_or_number_bytes,
+}
+
+
+def _bytes_transform(transform: Callable[[str], str]
+                     ) -> Callable[[bytes], bytes]:
+    """
+    Get the bytes counterpart of a word transform.
+
+    Parameters
+    ----------
+    transform : Callable[[str], str]
+        Transformation callback of string words.
+
+    Returns
+    -------
+    transform : Callable[[bytes], bytes]
+        Transformation callback of UTF-8 encoded words. Unless a native
+        counterpart is known, the word is decoded, transformed and encoded.
+    """
+    try:
+        return _BYTES_TRANSFORMS[transform]
+    except KeyError:
+        pass
+
+    def transform_bytes(word: bytes) -> bytes:
+        return transform(word.decode('utf-8', 'surrogateescape')).encode(
+                'utf-8', 'surrogateescape')
+
+    return transform_bytes
+
+
+# Delimiter and word transformation(s) of every case, keyed by the name of its
+# case changing function
+_CASES = OrderedDict((
+        ('camel_case', ('', (str.lower, _capitalize_or_number))),
+        ('capital_case', (' ', str.capitalize)),
+        ('constant_case', ('_', str.upper)),
+        ('dot_case', ('.', str.lower)),
+        ('header_case', ('-', str.capitalize)),
+        ('no_case', (' ', str.lower)),
+        ('param_case', ('-', str.lower)),
+        ('pascal_case', ('', (str.capitalize, _capitalize_or_number))),
+        ('path_case', ('/', str.lower)),
+        ('sentence_case', (' ', (str.capitalize, str.lower))),
+        ('snake_case', ('_', str.lower)),
+))
+
+
+# Patterns fully matching ASCII strings which are already canonical in each
+# case, see the `canonical` argument of `make_converter`. They are derived from
+# the words the default tokenizer finds: lower-case words never split, upper
+# case letters only split off a word after a lower-case letter or a digit, and
+# a run of upper-case letters is one word unless followed by a lower-case one.
+_CANONICAL_REGEXPS = {
+        'camel_case': r'[a-z][a-z0-9]*(?:[A-Z][a-z0-9]+|_[0-9]+)*[A-Z]?',
+        'capital_case': r'[A-Z0-9][a-z0-9]*(?: [A-Z0-9][a-z0-9]*)*',
+        'constant_case': r'(?:[A-Z]+[0-9]*|[0-9]+)(?:_(?:[A-Z]+[0-9]*|[0-9]+))*',
+        'dot_case': r'[a-z0-9]+(?:\.[a-z0-9]+)*',
+        'header_case': r'[A-Z0-9][a-z0-9]*(?:-[A-Z0-9][a-z0-9]*)*',
+        'no_case': r'[a-z0-9]+(?: [a-z0-9]+)*',
+        'param_case': r'[a-z0-9]+(?:-[a-z0-9]+)*',
+        'pascal_case': r'[A-Z][a-z0-9]+(?:[A-Z][a-z0-9]+|_[0-9]+)*[A-Z]?',
+        'path_case': r'[a-z0-9]+(?:/[a-z0-9]+)*',
+        'sentence_case': r'[A-Z0-9][a-z0-9]*(?: [a-z0-9]+)*',
+        'snake_case': r'[a-z0-9]+(?:_[a-z0-9]+)*',
+}
+
+
+def _case_name(case: str) -> str:
+    """
+    Normalize the name of a case to the name of its case changing function.
+
+    Parameters
+    ----------
+    case : str
+        Name of the case with or without the trailing :code:`_case` e.g.,
+        :code:`snake` or :code:`snake_case`.
+
+    Returns
+    -------
+    case : str
+        Name of the case changing function e.g., :code:`snake_case`.
+
+    Raises
+    ------
+    ValueError
+        If :code:`case` does not denote a known case.
+    """
+    name = case if case.endswith('_case') else f'{case}_case'
+    if name not in _CASES:
+        raise ValueError(f'Unknown case {case!r}, must be one of '
+                         f'{", ".join(_CASES)}.')
+
+    return name
+
+
+# Delimiters of the delimited cases, any other non-alphanumeric character
+# means a string is in no case at all
+_DELIMITERS = frozenset(' _-./')
+
+# States of the scan of camelCase and PascalCase humps in `detect_case`: in a
+# word, after a leading capital of the first word, after a capital, after the
+# second of two capitals, after an underscore, in a number following an
+# underscore, and rejected
+(_HUMP_WORD, _HUMP_FIRST, _HUMP_UPPER, _HUMP_PAIR, _HUMP_SCORE, _HUMP_NUMBER,
+ _HUMP_NONE) = range(7)
+
+# Transitions of the hump scan by state and character class, where an
+# underscore counts as `_SEPARATOR`. Missing transitions reject. Words are
+# split like the tokenizer splits them: before a capital following a lower
+# case letter or a digit, and before the last of two capitals followed by a
+# lower case letter, so that two capitals are two single-letter humps only if
+# a lower case letter follows.
+_HUMPS = {
+        (_HUMP_WORD, _LOWER): _HUMP_WORD,
+        (_HUMP_WORD, _DIGIT): _HUMP_WORD,
+        (_HUMP_WORD, _UPPER): _HUMP_UPPER,
+        (_HUMP_WORD, _SEPARATOR): _HUMP_SCORE,
+        (_HUMP_FIRST, _LOWER): _HUMP_WORD,
+        (_HUMP_FIRST, _DIGIT): _HUMP_WORD,
+        (_HUMP_FIRST, _UPPER): _HUMP_PAIR,
+        (_HUMP_FIRST, _SEPARATOR): _HUMP_SCORE,
+        (_HUMP_UPPER, _LOWER): _HUMP_WORD,
+        (_HUMP_UPPER, _DIGIT): _HUMP_WORD,
+        (_HUMP_UPPER, _UPPER): _HUMP_PAIR,
+        (_HUMP_UPPER, _SEPARATOR): _HUMP_SCORE,
+        (_HUMP_PAIR, _LOWER): _HUMP_WORD,
+        (_HUMP_SCORE, _DIGIT): _HUMP_NUMBER,
+        (_HUMP_NUMBER, _DIGIT): _HUMP_NUMBER,
+        (_HUMP_NUMBER, _UPPER): _HUMP_UPPER,
+        (_HUMP_NUMBER, _SEPARATOR): _HUMP_SCORE,
+}
+
+
+def detect_case(s: AnyStr) -> Optional[str]:
+    """
+    Detect the case a string is in.
+
+    A string is in a case if the case changing function of that case returns
+    it unchanged. Only ASCII strings are detected. The string is classified
+    in a single scan without any regular expressions.
+
+    Parameters
+    ----------
+    s : str | bytes
+        String to classify.
+
+    Returns
+    -------
+    case : str | None
+        Name of the case changing function of the case e.g.,
+        :code:`snake_case`, or `None` if :code:`s` is in none of the cases.
+        Strings in several cases e.g., a single word like :code:`foo`, are
+        reported in the first of these cases in alphabetical order. Strings
+        without any words e.g., :code:`_`, are in no case.
+
+    Examples
+    --------
+    >>> detect_case('fooBar')
+    'camel_case'
+    >>> detect_case('FOO_BAR')
+    'constant_case'
+    >>> detect_case('Foo bar')
+    'sentence_case'
+    >>> detect_case('foo_Bar') is None
+    True
+    """
+    if isinstance(s, _BYTES_TYPES):
+        try:
+            s = bytes(s).decode('ascii')
+        except UnicodeDecodeError:
+            return None
+
+    classes = _CHAR_CLASSES
+    humps = _HUMPS
+    delimiter = None
+    # whether every word has no capitals, starts with a capital or digit and
+    # has no further capitals, or has only capitals and trailing digits, and
+    # whether only the first word has a capital, at its start
+    lower = capitalized = constant = sentence = True
+    hump = first = None
+    start = True
+    prev = _SEPARATOR
+    for c in s:
+        cls = classes.get(c, _SEPARATOR)
+        if cls == _OTHER:
+            return None
+        if cls == _SEPARATOR:
+            if start or c not in _DELIMITERS \
+                    or (delimiter is not None and c != delimiter):
+                return None
+            delimiter = c
+            start = True
+            prev = _SEPARATOR
+            hump = humps.get((hump, cls)) if c == '_' else None
+            continue
+
+        if first is None:
+            first = cls
+            hump = _HUMP_FIRST if cls == _UPPER else _HUMP_WORD
+        else:
+            hump = humps.get((hump, cls))
+        if cls == _UPPER:
+            lower = False
+            if not start:
+                capitalized = sentence = False
+            elif delimiter is not None:
+                sentence = False
+            if prev == _DIGIT:
+                constant = False
+        elif cls == _LOWER:
+            constant = False
+            if start:
+                capitalized = False
+                if delimiter is None:
+                    sentence = False
+        start = False
+        prev = cls
+
+    if start:
+        return None
+
+    # a first word starting with a digit is the same in camelCase and
+    # PascalCase, where it is reported as the former
+    camel = hump in (_HUMP_WORD, _HUMP_FIRST, _HUMP_UPPER, _HUMP_NUMBER)
+    matches = (
+            ('camel_case', camel and first != _UPPER),
+            ('capital_case', capitalized and delimiter in (None, ' ')),
+            ('constant_case', constant and delimiter in (None, '_')),
+            ('dot_case', lower and delimiter in (None, '.')),
+            ('header_case', capitalized and delimiter in (None, '-')),
+            ('no_case', lower and delimiter in (None, ' ')),
+            ('param_case', lower and delimiter in (None, '-')),
+            ('pascal_case', camel and first == _UPPER),
+            ('path_case', lower and delimiter in (None, '/')),
+            ('sentence_case', sentence and delimiter in (None, ' ')),
+            ('snake_case', lower and delimiter in (None, '_')),
+    )
+
+    return next((case for case, match in matches if match), None)
+
+
+@_builtin
 def camel_case(s: str):
     """
     Transform into a string with the separator denoted by the next word
@@ -143,11 +920,9 @@ def camel_case(s: str):
     s : str
         Transformed string.
     """
-    return _change_case(s, '', (str.lower,
-                                lambda w: f'_{w}'
-                                if w.isnumeric() else w.capitalize()))
 
 
+@_builtin
 def capital_case(s: str):
     """
     Transform into a space separated string with each word capitalized.
@@ -162,9 +937,9 @@ def capital_case(s: str):
     s : str
         Transformed string.
     """
-    return _change_case(s, ' ', str.capitalize)
 
 
+@_builtin
 def constant_case(s: str):
     """
     Transform into upper case string with an underscore between words.
@@ -178,9 +953,9 @@ def constant_case(s: str):
     -------
         Transformed string.
     """
-    return _change_case(s, '_', str.upper)
 
 
+@_builtin
 def dot_case(s: str):
     """
     Transform into a lower case string with a period between words.
@@ -194,9 +969,9 @@ def dot_case(s: str):
     -------
         Transformed string.
     """
-    return _change_case(s, '.', str.lower)
 
 
+@_builtin
 def header_case(s: str):
     """
     Transform into a dash separated string of capitalized words.
@@ -210,9 +985,9 @@ def header_case(s: str):
     -------
         Transformed string.
     """
-    return _change_case(s, '-', str.capitalize)
 
 
+@_builtin
 def no_case(s: str):
     """
     Transform into a lower cased string with spaces between words.
@@ -226,9 +1001,9 @@ def no_case(s: str):
     -------
         Transformed string.
     """
-    return _change_case(s, ' ', str.lower)
 
 
+@_builtin
 def param_case(s: str):
     """
     Transform into a lower cased string with dashes between words.
@@ -242,9 +1017,9 @@ def param_case(s: str):
     -------
         Transformed string.
     """
-    return _change_case(s, '-', str.lower)
 
 
+@_builtin
 def pascal_case(s: str):
     """
     Transform into a string of capitalized words without separators.
@@ -258,11 +1033,9 @@ def pascal_case(s: str):
     -------
         Transformed string.
     """
-    return _change_case(s, '', (str.capitalize,
-                                lambda w: f'_{w}'
-                                if w.isnumeric() else w.capitalize()))
 
 
+@_builtin
 def path_case(s: str):
     """
     Transform into a lower case string with slashes between words.
@@ -276,9 +1049,9 @@ def path_case(s: str):
     -------
         Transformed string.
     """
-    return _change_case(s, '/', str.lower)
 
 
+@_builtin
 def sentence_case(s: str):
     """
     Transform into a lower case with spaces between words, then capitalize
@@ -293,9 +1066,9 @@ def sentence_case(s: str):
     -------
         Transformed string.
     """
-    return _change_case(s, ' ', (str.capitalize, str.lower))
 
 
+@_builtin
 def snake_case(s: str):
     """
     Transform into a lower case string with underscores between words.
@@ -309,41 +1082,387 @@ def snake_case(s: str):
     -------
         Transformed string.
     """
-    return _change_case(s, '_', str.lower)
 
-def _to_case(case_fn):
+
+# Containers walked by the converters of :func:`_to_case`
+_CONTAINERS = frozenset((dict, OrderedDict, list, tuple, set))
+
+# Bounds of the shape cache of `_deep_change_case_steps`: the number of
+# distinct shapes after which the dictionaries are unlikely to be records and
+# the cache is given up, and the number of keys beyond which a dictionary is
+# unlikely to be a record and is not cached at all
+_SHAPES_MAXSIZE = 256
+_SHAPE_MAXKEYS = 256
+
+
+def _deep_change_case(value, case_fn: Callable[[str], str]):
+    """
+    Change case of the keys of all dictionaries in a nested structure.
+
+    The structure is walked with an explicit stack rather than by recursion,
+    so it may be nested arbitrarily deep. Strings which are neither keys nor
+    values of a dictionary e.g., a string or the items of a list passed as
+    :code:`value`, are changed in case, too. Values of dictionaries are only
+    walked into.
+
+    Parameters
+    ----------
+    value : Any
+        String, dictionary, ordered dictionary, list, tuple, or set, possibly
+        nested, to change the case of. Other values are returned unchanged.
+    case_fn : Callable[[str], str]
+        Case changing function to apply to each string. Its result is reused
+        for every occurrence of the same string in :code:`value`.
+
+    Returns
+    -------
+    value : Any
+        Copy of :code:`value` with the case of its strings changed.
+    """
+    steps = _deep_change_case_steps(value, case_fn)
+    try:
+        while True:
+            next(steps)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _deep_change_case_steps(value,
+                            case_fn: Callable[[str], str],
+                            chunk_size: Optional[int] = None):
+    """
+    Change case of the keys of all dictionaries in a nested structure in
+    steps.
+
+    Generator doing the work of :func:`_deep_change_case` in chunks, so that
+    the walk can be interleaved with other work e.g., by an event loop.
+
+    Parameters
+    ----------
+    value : Any
+        Structure to change the case of, see :func:`_deep_change_case`.
+    case_fn : Callable[[str], str]
+        Case changing function to apply to each string.
+    chunk_size : int, optional
+        Number of values to walk between two yields. Defaults to walking the
+        whole structure at once.
+
+    Yields
+    ------
+    None
+        After every :code:`chunk_size` values walked.
+
+    Returns
+    -------
+    value : Any
+        Copy of :code:`value` with the case of its strings changed, as the
+        value of the final :code:`StopIteration`.
+    """
+    changed = {}
+    # converted keys of dictionaries by their keys, so that the keys of
+    # records sharing the same keys are converted only once and zipped with
+    # the values of every further record. Only dictionaries whose keys are all
+    # strings are cached. Keys of string subclasses equal to cached keys are
+    # converted like those.
+    shapes = {}
+
+    def change(s):
+        try:
+            return changed[s]
+        except KeyError:
+            c = changed[s] = case_fn(s)
+            return c
+
+    # every frame converts `target[slot]` in place, `in_value` tells whether
+    # it is (part of) the value of a dictionary. Tuples and sets are built as
+    # lists first and created by a finalizing frame once all their items are
+    # converted.
+    root = [value]
+    stack = [(root, 0, False)]
+    chunk_size = chunk_size or _sys.maxsize
+    while stack:
+        for _ in _itertools.repeat(None, chunk_size):
+            if not stack:
+                break
+            frame = stack.pop()
+            if len(frame) == 4:
+                target, slot, factory, items = frame
+                target[slot] = factory(items)
+                continue
+
+            target, slot, in_value = frame
+            value = target[slot]
+            kind = type(value)
+            if kind is str:
+                if not in_value:
+                    target[slot] = change(value)
+            elif kind is dict or kind is OrderedDict:
+                keys = converted_keys = None
+                if shapes is not None and len(value) <= _SHAPE_MAXKEYS:
+                    keys = tuple(value)
+                    converted_keys = shapes.get(keys)
+                converted = target[slot] = kind()
+                if converted_keys is not None:
+                    for k, v in zip(converted_keys, value.values()):
+                        converted[k] = v
+                        if type(v) in _CONTAINERS:
+                            stack.append((converted, k, True))
+                    continue
+
+                cacheable = keys is not None
+                for k, v in value.items():
+                    if type(k) is str:
+                        converted[change(k)] = v
+                    else:
+                        converted[k] = v
+                        cacheable = False
+                # keys converting to the same key cannot be zipped
+                if cacheable and len(converted) == len(keys):
+                    shapes[keys] = tuple(converted)
+                    if len(shapes) >= _SHAPES_MAXSIZE:
+                        shapes = None
+                for k, v in converted.items():
+                    if type(v) in _CONTAINERS:
+                        stack.append((converted, k, True))
+            elif kind in _CONTAINERS:
+                items = list(value)
+                if kind is list:
+                    target[slot] = items
+                else:
+                    stack.append((target, slot, kind, items))
+                for idx, v in enumerate(items):
+                    if type(v) is str:
+                        if not in_value:
+                            items[idx] = change(v)
+                    elif type(v) in _CONTAINERS:
+                        stack.append((items, idx, in_value))
+
+        if stack:
+            yield
+
+    return root[0]
+
+
+def _to_case(case_fn: Callable[[str], str]):
+    """
+    Create a converter changing the case of the keys of nested dictionaries.
+
+    Parameters
+    ----------
+    case_fn : Callable[[str], str]
+        Case changing function to apply to each key.
+
+    Returns
+    -------
+    convert : Callable[[Any], Any]
+        Converter, see :func:`_deep_change_case`.
+    """
+    name = f'to_{case_fn.__name__}'.replace('_case', '')
+
     def convert(value):
-        if type(value) == str:
-            return case_fn(value)
-        elif type(value) == list:
-            return list(map(convert, value))
-        elif type(value) == tuple:
-            return tuple(map(convert, value))
-        elif type(value) == set:
-            return set(map(convert, value))
-        elif type(value) == OrderedDict:
-            _d = {}
-            for k, v in value.items():
-                _value = value[k]
-                if type(_value) == dict:
-                    _value = convert(_value)
-                _d[case_fn(k)] = _value
-            return _d
-        elif type(value) == dict:
-            _d = {}
-            for k, v in value.items():
-                _value = value[k]
-                if type(_value) == dict:
-                    _value = convert(_value)
-                _d[case_fn(k)] = _value
-            return _d
-        else:
-            return value
+        stats = _instrument._stats
+        if stats is None:
+            return _deep_change_case(value, case_fn)
+
+        start = _time.perf_counter()
+        converted = _deep_change_case(value, case_fn)
+        stats.record(name, walk=_time.perf_counter() - start)
+
+        return converted
+
     return convert
 
+
 to_camel = _to_case(camel_case)
 to_snake = _to_case(snake_case)
 
+Case = namedtuple('Case', ('name', 'convert', 'many', 'to_case'))
+
+# Commands of the command line interface besides the case changing ones, as
+# which cases cannot be registered
+_COMMAND_NAMES = frozenset(('csv', 'json', 'rename', 'rewrite'))
+
+# Functions of every case by its name with and without the trailing `_case`,
+# created once on first use of the case
+_RESOLVED = {}
+
+
+def _number_or(transform: Callable[[str], str]) -> Callable[[str], str]:
+    """
+    Prefix numeric words with an underscore instead of transforming them,
+    see :func:`_capitalize_or_number`.
+    """
+    if transform is str.capitalize:
+        return _capitalize_or_number
+
+    def number_or(word: str) -> str:
+        return f'_{word}' if word.isnumeric() else transform(word)
+
+    return number_or
+
+
+def register_case(name: str,
+                  delimiter: str,
+                  first: Callable[[str], str],
+                  rest: Optional[Callable[[str], str]] = None,
+                  numbers: bool = False) -> Case:
+    """
+    Register a new case.
+
+    A registered case is declared once and gets everything a built-in case
+    has: a case changing function, a batch function, a converter of the keys
+    of nested structures, rendering by :meth:`case_changer.words.Words.render`,
+    and a subcommand of the command line interface if registered before
+    :func:`case_changer.cli.main` runs.
+
+    Parameters
+    ----------
+    name : str
+        Name of the case with or without the trailing :code:`_case` e.g.,
+        :code:`train` or :code:`train_case`.
+    delimiter : str
+        Delimiter to put between the transformed words.
+    first : Callable[[str], str]
+        Transformation callback applied to the first word.
+    rest : Callable[[str], str], optional
+        Transformation callback applied to the remaining words. Defaults to
+        :code:`first`.
+    numbers : bool, optional
+        Whether to prefix numeric non-leading words with an underscore
+        instead of transforming them, like camelCase does, so that they do
+        not merge with their predecessor if the delimiter is empty.
+
+    Returns
+    -------
+    case : Case
+        Functions of the case, see :func:`get_case`.
+
+    Raises
+    ------
+    ValueError
+        If :code:`name` is not an identifier, is already registered, or
+        collides with a command of the command line interface.
+
+    Examples
+    --------
+    >>> train = register_case('train', '-', str.capitalize)
+    >>> train.convert('fooBar baz')
+    'Foo-Bar-Baz'
+    >>> train.to_case({'fooBar': 1})
+    {'Foo-Bar': 1}
+    >>> unregister_case('train')
+    """
+    name = name if name.endswith('_case') else f'{name}_case'
+    if not name.isidentifier():
+        raise ValueError(f'Case name must be an identifier, got {name!r}.')
+    if name in _CASES:
+        raise ValueError(f'Case {name!r} is already registered.')
+    if name[:-len('_case')] in _COMMAND_NAMES:
+        raise ValueError(f'Case {name!r} collides with the command '
+                         f'{name[:-len("_case")]!r}.')
+
+    rest = first if rest is None else rest
+    if numbers:
+        rest = _number_or(rest)
+    _CASES[name] = (delimiter, first if rest is first else (first, rest))
+
+    return get_case(name)
+
+
+def unregister_case(name: str) -> None:
+    """
+    Remove a case registered with :func:`register_case`.
+
+    Parameters
+    ----------
+    name : str
+        Name of the case with or without the trailing :code:`_case`.
+
+    Raises
+    ------
+    ValueError
+        If :code:`name` does not denote a registered case or denotes a
+        built-in one.
+    """
+    name = _case_name(name)
+    if name in _CANONICAL_REGEXPS:
+        raise ValueError(f'Built-in case {name!r} cannot be unregistered.')
+
+    del _CASES[name]
+    _RESOLVED.pop(name, None)
+    _RESOLVED.pop(name[:-len('_case')], None)
+
+
+def get_case(name: str) -> Case:
+    """
+    Get the functions of a built-in or registered case.
+
+    The functions are created on first use of a case and reused afterwards.
+
+    Parameters
+    ----------
+    name : str
+        Name of the case with or without the trailing :code:`_case`.
+
+    Returns
+    -------
+    case : Case
+        Name of the case changing function, the case changing function, its
+        batch variant, and the converter of the keys of nested structures.
+
+    Raises
+    ------
+    ValueError
+        If :code:`name` does not denote a known case.
+
+    Examples
+    --------
+    >>> get_case('snake').many(['fooBar', 'BazQux'])
+    ['foo_bar', 'baz_qux']
+    """
+    try:
+        return _RESOLVED[name]
+    except KeyError:
+        pass
+
+    alias = name
+    name = _case_name(name)
+    if name in _RESOLVED:
+        case = _RESOLVED[alias] = _RESOLVED[name]
+        return case
+
+    from case_changer import batch
+
+    if name in _CANONICAL_REGEXPS:
+        convert = globals()[name]
+        many = getattr(batch, f'{name}_many')
+    else:
+        delimiter, transform = _CASES[name]
+        if not isinstance(transform, Tuple):
+            transform = (transform, transform)
+        convert = make_converter(delimiter, *transform)
+        convert.__name__ = convert.__qualname__ = name
+        convert.__doc__ = f"""
+    Transform into the registered case {name}.
+    """
+        many = batch._many(name)
+    to_case = globals().get(f'to_{name[:-len("_case")]}') or _to_case(convert)
+
+    case = _RESOLVED[name] = _RESOLVED[alias] = \
+        Case(name, convert, many, to_case)
+
+    return case
+
+
+def __getattr__(name: str) -> Callable[[str], str]:
+    # case changing functions of registered cases, so that they can be looked
+    # up and pickled like the built-in ones
+    if name in _CASES and name not in _CANONICAL_REGEXPS:
+        return get_case(name).convert
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 __all__ = [
         'camel_case',
         'capital_case',
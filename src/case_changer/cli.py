@@ -1,39 +1,573 @@
+"""
+Command line interface of case-changer.
+
+Startup time matters as the command line is often invoked once per string
+from scripts, so the subcommands are registered statically and every module
+not needed by the invoked subcommand is imported only when needed.
+"""
 from __future__ import annotations
 
+import contextlib
 import functools
-import inspect
-from typing import Callable, Tuple
+import io
+import itertools
+import os
+import sys
+from collections import deque
+from typing import TYPE_CHECKING, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 import click
 
-import case_changer.changers
+if TYPE_CHECKING:
+    from case_changer.stats import StatsInfo
+
+# Number of bytes read from the input at once
+_BLOCK_SIZE = 1 << 20
+
+# Encoding of the input and output streams, undecodable bytes are passed
+# through unchanged
+_ENCODING = 'utf-8'
+_ERRORS = 'surrogateescape'
+
+# Subcommand changing the case of strings for every built-in case changing
+# function in `case_changer.changers`, registered cases are added on demand
+_CASE_COMMANDS = {
+        'camel': 'camel_case',
+        'capital': 'capital_case',
+        'constant': 'constant_case',
+        'dot': 'dot_case',
+        'header': 'header_case',
+        'no': 'no_case',
+        'param': 'param_case',
+        'pascal': 'pascal_case',
+        'path': 'path_case',
+        'sentence': 'sentence_case',
+        'snake': 'snake_case',
+}
+
+# Minimum number of blocks of input for which to start a process pool, smaller
+# inputs are converted faster in the current process
+_MIN_PARALLEL_BLOCKS = 4
+
+
+def _read_records(stream: BinaryIO,
+                  separator: str,
+                  block_size: int = _BLOCK_SIZE) -> Iterator[List[str]]:
+    """
+    Read separated records from a binary stream in chunks.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        Binary stream to read from.
+    separator : str
+        Single ASCII character terminating each record.
+    block_size : int, optional
+        Number of bytes to read at once. Memory use is bounded by this size
+        plus the length of the longest record.
+
+    Yields
+    ------
+    records : List[str]
+        Decoded records of the next block, without separators. Records
+        separated by newlines lose a single trailing carriage return, too.
+    """
+    sep = separator.encode('ascii')
+    # records of lines may end in a carriage return, which is dropped
+    newline = separator == '\n'
+    rest = b''
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+
+        end = block.rfind(sep)
+        if end < 0:
+            rest += block
+            continue
+
+        text = (rest + block[:end]).decode(_ENCODING, _ERRORS)
+        rest = block[end + 1:]
+        if newline and '\r' in text:
+            # the last record's line feed is not part of the text
+            text = (text + '\n').replace('\r\n', '\n')[:-1]
+        yield text.split(separator)
+
+    if rest:
+        text = rest.decode(_ENCODING, _ERRORS)
+        if newline and text.endswith('\r'):
+            text = text[:-1]
+        yield [text]
+
+
+def _write_records(stream: BinaryIO,
+                   records: List[str],
+                   separator: str) -> None:
+    """
+    Write records to a binary stream with a single write.
+
+    Parameters
+    ----------
+    stream : BinaryIO
+        Binary stream to write to.
+    records : List[str]
+        Records to write, each of which is terminated by :code:`separator`.
+    separator : str
+        Separator to terminate each record with.
+    """
+    if records:
+        stream.write((separator.join(records) + separator).encode(
+                _ENCODING, _ERRORS))
+
+
+def _case_commands() -> Dict[str, str]:
+    # built-in cases plus those registered through `register_case`, which can
+    # only have happened if the case changing functions are imported already
+    changers = sys.modules.get('case_changer.changers')
+    if changers is None:
+        return _CASE_COMMANDS
+
+    return {name[:-len('_case')]: name for name in changers._CASES}
+
+
+@contextlib.contextmanager
+def _open_text(path: str, mode: str) -> Iterator[TextIO]:
+    """
+    Open a file or a standard stream as text without translating newlines,
+    as the :mod:`csv` module requires.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, :code:`-` for standard input or output.
+    mode : str
+        :code:`r` to read or :code:`w` to write.
+
+    Yields
+    ------
+    stream : TextIO
+        Text stream, which is closed afterwards unless it is a standard
+        stream.
+    """
+    if path != '-':
+        with open(path, mode, encoding=_ENCODING, errors=_ERRORS,
+                  newline='') as stream:
+            yield stream
+        return
+
+    stream = io.TextIOWrapper(
+            click.open_file('-', f'{mode}b'),
+            encoding=_ENCODING, errors=_ERRORS, newline='')
+    try:
+        yield stream
+    finally:
+        stream.flush()
+        stream.detach()
+
+
+def _many(name: str) -> Callable[[Iterable[str]], List[str]]:
+    # batch variant of a built-in or registered case changer
+    import case_changer.changers
+
+    return case_changer.changers.get_case(name).many
+
+
+def _convert_records(name: str, records: List[str]) -> List[str]:
+    # module-level entry point of the worker processes, which only receive the
+    # name of the case changer and the records to convert
+    return _many(name)(records)
+
+
+def _convert_records_with_stats(name: str, records: List[str]) -> Tuple[
+        List[str], 'StatsInfo']:
+    # entry point of the worker processes if statistics are recorded, which
+    # are reported back to the main process for each block
+    import case_changer.stats
+
+    case_changer.stats.enable_stats()
+    converted = _convert_records(name, records)
+
+    return converted, case_changer.stats.stats_info()
+
+
+def _convert_blocks(name: str,
+                    blocks: Iterable[List[str]],
+                    jobs: int = 1) -> Iterator[List[str]]:
+    """
+    Convert blocks of records, optionally in a pool of worker processes.
+
+    Parameters
+    ----------
+    name : str
+        Name of the case changing function in :mod:`case_changer.changers`.
+    blocks : Iterable[List[str]]
+        Blocks of records as returned by :func:`_read_records`.
+    jobs : int, optional
+        Number of worker processes. If :code:`1` or if there are less than
+        :code:`_MIN_PARALLEL_BLOCKS` blocks, the blocks are converted in the
+        current process.
+
+    Yields
+    ------
+    records : List[str]
+        Converted records of each block, in the order of :code:`blocks`.
+        If statistics are enabled, those of the worker processes are added to
+        the statistics of the current process.
+    """
+    blocks = iter(blocks)
+    head = list(itertools.islice(blocks, _MIN_PARALLEL_BLOCKS))
+    if jobs <= 1 or len(head) < _MIN_PARALLEL_BLOCKS:
+        for block in itertools.chain(head, blocks):
+            yield _convert_records(name, block)
+        return
+
+    from concurrent.futures import Future
+    from concurrent.futures import ProcessPoolExecutor
+
+    import case_changer.stats
+
+    # statistics recorded by the workers are added to those of this process
+    stats = case_changer.stats._stats
+    if stats is None:
+        convert, result = _convert_records, Future.result
+    else:
+        def result(future):
+            converted, info = future.result()
+            stats.merge(info)
+            return converted
+        convert = _convert_records_with_stats
+
+    # keep at most two blocks per worker in flight to bound memory use
+    with ProcessPoolExecutor(jobs) as pool:
+        pending = deque()
+        for block in itertools.chain(head, blocks):
+            pending.append(pool.submit(convert, name, block))
+            if len(pending) >= 2 * jobs:
+                yield result(pending.popleft())
+        while pending:
+            yield result(pending.popleft())
+
+
+def _stats_option(fn: Callable) -> Callable:
+    return click.option(
+            '--stats',
+            is_flag=True,
+            help='Print call counts, time per stage, input sizes and cache '
+                 'statistics to standard error.')(fn)
+
+
+def _enable_stats() -> None:
+    import case_changer.stats
+
+    case_changer.stats.enable_stats()
+
+
+def _echo_stats() -> None:
+    import case_changer.stats
+
+    click.echo(case_changer.stats.format_stats(
+            case_changer.stats.stats_info()), err=True)
+    case_changer.stats.disable_stats()
 
 
 def _wrap_command(cmd: Tuple[str, Callable]):
     # wrap around each command as the CLI takes a variable list of strings to
     # change and each case changer only takes a single string as argument
+    many = _many(cmd[0])
+
     @functools.wraps(cmd[1])
     def wrapper(*args, **kwargs):
-        for s in kwargs.pop('strings', ()):
-            click.echo(cmd[1](s))
+        strings = kwargs.pop('strings', ())
+        inputs = list(kwargs.pop('inputs', ()))
+        separator = '\0' if kwargs.pop('null', False) else '\n'
+        jobs = kwargs.pop('jobs', 1) or os.cpu_count()
+        stats = kwargs.pop('stats', False)
+        if stats:
+            _enable_stats()
+        if strings == ('-',):
+            strings = ()
+            inputs.append(click.open_file('-', 'rb'))
+
+        out = click.open_file('-', 'wb')
+        _write_records(out, many(strings), separator)
+        for stream in inputs:
+            for records in _convert_blocks(
+                    cmd[0], _read_records(stream, separator), jobs):
+                _write_records(out, records, separator)
+        out.flush()
+        if stats:
+            _echo_stats()
+
+    # wrap a command around (wrap the main argument and the input options
+    # around the callback)
+    wrapper = click.argument(
+            'strings',
+            nargs=-1,
+            type=click.STRING)(wrapper)
+    wrapper = click.option(
+            '-0', '--null',
+            is_flag=True,
+            help='Separate strings by NUL instead of newline.')(wrapper)
+    wrapper = click.option(
+            '-j', '--jobs',
+            default=1,
+            type=click.IntRange(min=0),
+            help='Number of processes converting the input in parallel, 0 '
+                 'for one per CPU.')(wrapper)
+    wrapper = _stats_option(wrapper)
+    wrapper = click.option(
+            '-i', '--input', 'inputs',
+            multiple=True,
+            type=click.File('rb'),
+            help='Read strings line by line from FILE, - for standard '
+                 'input.')(wrapper)
+
+    return click.command(cmd[0].replace('_case', ''))(wrapper)
+
+
+class _CaseChoice(click.Choice):
+    """
+    Choice of the built-in and registered cases.
+
+    The choices are looked up on use rather than when the command line is
+    imported, so that they include the cases registered in between.
+    """
+
+    def __init__(self):
+        super().__init__(())
+
+    @property
+    def choices(self) -> List[str]:
+        return list(_case_commands())
+
+    @choices.setter
+    def choices(self, value) -> None:
+        pass
+
+
+class _Group(click.Group):
+    """
+    Group of commands which creates the case changing commands on demand.
+
+    Looking up a command of a built-in or registered case imports the case
+    changing functions and creates only that command, so invoking one command
+    does not pay for creating all others.
+    """
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(self.commands.keys() | _case_commands().keys())
+
+    def get_command(self, ctx: click.Context,
+                    cmd_name: str) -> Optional[click.Command]:
+        commands = _case_commands()
+        if cmd_name in commands and cmd_name not in self.commands:
+            import case_changer.changers
 
-    # wrap a command around (wrap the main argument around the callback)
-    return click.command(cmd[0].replace('_case', ''))(
-            click.argument(
-                    'strings',
-                    nargs=-1,
-                    type=click.STRING)(wrapper)
-    )
+            case = case_changer.changers.get_case(commands[cmd_name])
+            self.add_command(_wrap_command((case.name, case.convert)))
 
+        return super().get_command(ctx, cmd_name)
 
-@click.group()
+
+@click.group(cls=_Group)
 def cli():
     pass
 
 
-[cli.add_command(_wrap_command(a))
- for a in inspect.getmembers(case_changer.changers)
- if (not a[0].startswith('_') and inspect.isfunction(a[1]))]
+@cli.command('json')
+@click.argument(
+        'case',
+        type=_CaseChoice())
+@click.argument(
+        'input',
+        default='-',
+        type=click.File('rb'))
+@click.option(
+        '-o', '--output',
+        default='-',
+        type=click.File('wb'),
+        help='Write the converted JSON to FILE instead of standard output.')
+@_stats_option
+def json_command(case, input, output, stats):
+    """
+    Change the case of all object keys of a JSON document or of
+    newline-delimited JSON documents, streaming from INPUT (standard input by
+    default).
+    """
+    import case_changer.changers
+    import case_changer.jsonstream
+
+    if stats:
+        _enable_stats()
+    case_fn = case_changer.changers.get_case(case).convert
+    for text in case_changer.jsonstream.transform_json(
+            input, case_fn, chunk_size=_BLOCK_SIZE):
+        output.write(text.encode(_ENCODING, _ERRORS))
+    output.flush()
+    if stats:
+        _echo_stats()
+
+
+@cli.command('csv')
+@click.argument(
+        'case',
+        type=_CaseChoice())
+@click.argument(
+        'input',
+        default='-',
+        type=click.Path(dir_okay=False, allow_dash=True))
+@click.option(
+        '-o', '--output',
+        default='-',
+        type=click.Path(dir_okay=False, allow_dash=True),
+        help='Write the converted CSV to FILE instead of standard output.')
+@click.option(
+        '-c', '--column', 'columns',
+        multiple=True,
+        help='Change the case of the values of the column NAME, too.')
+@click.option(
+        '--header/--no-header',
+        default=True,
+        help='Whether to change the case of the header.')
+@click.option(
+        '-d', '--delimiter',
+        default=',',
+        help='Field delimiter, a single character.')
+@click.option(
+        '-t', '--tsv',
+        is_flag=True,
+        help='Separate fields by tabs, short for --delimiter "\t".')
+def csv_command(case, input, output, columns, header, delimiter, tsv):
+    """
+    Change the case of the header and of selected columns of a CSV file,
+    streaming from INPUT (standard input by default).
+    """
+    import case_changer.changers
+    import case_changer.csvstream
+
+    if len(delimiter) != 1:
+        raise click.BadParameter('must be a single character',
+                                 param_hint='--delimiter')
+
+    case_fn = case_changer.changers.get_case(case).convert
+    with _open_text(input, 'r') as source, _open_text(output, 'w') as target:
+        try:
+            case_changer.csvstream.transform_csv(
+                    source, target, case_fn, header, columns,
+                    delimiter='\t' if tsv else delimiter)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint='--column') from None
+
+
+@cli.command('rewrite')
+@click.argument(
+        'case',
+        type=_CaseChoice())
+@click.argument(
+        'pattern')
+@click.argument(
+        'globs',
+        nargs=-1,
+        required=True)
+@click.option(
+        '-n', '--dry-run',
+        is_flag=True,
+        help='Print a unified diff of the changes instead of writing them.')
+@click.option(
+        '-j', '--jobs',
+        default=1,
+        type=click.IntRange(min=0),
+        help='Number of processes rewriting files in parallel, 0 for one per '
+             'CPU.')
+def rewrite_command(case, pattern, globs, dry_run, jobs):
+    """
+    Change the case of every identifier matching the regular expression
+    PATTERN in the files matching GLOBS e.g., 'src/**/*.py'. Only files which
+    change are written, each atomically. Prints the path of every changed
+    file.
+    """
+    import re
+
+    import case_changer.rewrite
+
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        raise click.BadParameter(str(e), param_hint='PATTERN') from None
+
+    changed = 0
+    for path, diff in case_changer.rewrite.rewrite_files(
+            globs, pattern, case, dry_run, jobs or os.cpu_count()):
+        click.echo(diff if dry_run else path, nl=not dry_run)
+        changed += 1
+    click.echo(f'{changed} file{"" if changed == 1 else "s"} '
+               f'{"would be " if dry_run else ""}rewritten', err=True)
+
+
+@cli.command('rename')
+@click.argument(
+        'case',
+        type=_CaseChoice())
+@click.argument(
+        'root',
+        type=click.Path(exists=True, file_okay=False))
+@click.option(
+        '-f', '--files-only',
+        is_flag=True,
+        help='Rename files only, not directories.')
+@click.option(
+        '-n', '--dry-run',
+        is_flag=True,
+        help='Print the renames instead of applying them.')
+@click.option(
+        '-j', '--jobs',
+        default=1,
+        type=click.IntRange(min=0),
+        help='Number of threads renaming in parallel, 0 for one per CPU.')
+def rename_command(case, root, files_only, dry_run, jobs):
+    """
+    Change the case of the names of all files and directories below ROOT,
+    keeping leading dots and file extensions. Nothing is renamed if any two
+    names would collide.
+    """
+    import time
+
+    import case_changer.rename
+
+    start = time.perf_counter()
+    try:
+        renames = case_changer.rename.plan_renames(root, case, not files_only)
+    except (FileExistsError, ValueError) as e:
+        raise click.ClickException(str(e)) from None
+    planned = time.perf_counter() - start
+
+    if dry_run:
+        for source, target in renames:
+            click.echo(f'{source} -> {target}')
+        click.echo(f'{len(renames):,d} renames planned in {planned:.3f} s',
+                   err=True)
+        return
+
+    start = time.perf_counter()
+    case_changer.rename.apply_renames(renames, jobs or os.cpu_count())
+    applied = time.perf_counter() - start
+    click.echo(f'{len(renames):,d} renames planned in {planned:.3f} s, '
+               f'applied in {applied:.3f} s '
+               f'({len(renames) / max(applied, 1e-9):,.0f} renames/s)',
+               err=True)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """
+    Run the command line interface.
+
+    Parameters
+    ----------
+    args : List[str], optional
+        Command line arguments. Defaults to :code:`sys.argv[1:]`.
+    """
+    cli.main(args=args, prog_name='case-changer')
+
 
 if __name__ == "__main__":
-    cli.main()
+    main()
@@ -0,0 +1,214 @@
+"""
+Case conversion of NumPy, pandas and Arrow string arrays.
+
+Every function converts only the distinct values of an array and scatters
+the results back, so heavily repetitive columns cost about as much as their
+number of distinct values. Missing and non-string values are passed through
+unchanged.
+
+Importing this module registers the :code:`case` accessor on pandas
+:class:`~pandas.Series` and :class:`~pandas.Index` objects::
+
+    >>> import pandas as pd
+    >>> import case_changer.columnar
+    >>> pd.Series(['fooBar', 'BazQux', 'fooBar']).case.snake().tolist()
+    ['foo_bar', 'baz_qux', 'foo_bar']
+
+NumPy, pandas and pyarrow are optional dependencies, install them with the
+:code:`numpy`, :code:`pandas`, or :code:`arrow` extras, respectively.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List
+
+from case_changer.changers import _CASES
+from case_changer.changers import get_case
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None
+
+try:
+    import pandas as _pd
+except ImportError:  # pragma: no cover
+    _pd = None
+
+try:
+    import pyarrow as _pa
+    import pyarrow.compute as _pc
+except ImportError:  # pragma: no cover
+    _pa = None
+    _pc = None
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+
+def _convert_uniques(uniques: Iterable[Any],
+                     many: Callable[[List[str]], List[str]]) -> Dict[Any, Any]:
+    """
+    Convert distinct values into a mapping from original to converted value.
+
+    Parameters
+    ----------
+    uniques : Iterable[Any]
+        Distinct values of an array.
+    many : Callable[[List[str]], List[str]]
+        Batch case changing function to apply to the string values.
+
+    Returns
+    -------
+    mapping : Dict[Any, Any]
+        Converted value of every value of :code:`uniques`. Non-string values
+        map onto themselves.
+    """
+    mapping = {u: u for u in uniques}
+    strings = [u for u in mapping if isinstance(u, str)]
+    mapping.update(zip(strings, many(strings)))
+
+    return mapping
+
+
+def _convert_numpy(values: _np.ndarray,
+                   many: Callable[[List[str]], List[str]]) -> _np.ndarray:
+    if values.dtype.kind == 'U':
+        uniques, inverse = _np.unique(values, return_inverse=True)
+        converted = _np.array(many(uniques.tolist()), dtype=str)
+        return converted[inverse].reshape(values.shape)
+
+    if values.dtype.kind == 'O':
+        flat = values.ravel().tolist()
+        mapping = _convert_uniques(dict.fromkeys(flat), many)
+        converted = _np.empty(values.shape, dtype=object)
+        converted.ravel()[:] = [mapping[v] for v in flat]
+        return converted
+
+    raise TypeError(f'Cannot change case of NumPy array of dtype '
+                    f'{values.dtype}, must be of object or unicode dtype.')
+
+
+def _convert_pandas(values: Any,
+                    many: Callable[[List[str]], List[str]]) -> Any:
+    mapping = _convert_uniques(values.dropna().unique(), many)
+    converted = values.map(mapping, na_action='ignore')
+    if values.dtype != object:
+        return converted
+
+    # mapping turns the missing values of object arrays into NaN, keep them
+    # and the object dtype they need
+    missing = values.isna()
+    if not missing.any():
+        return converted
+
+    return converted.astype(object).where(~missing, values)
+
+
+def _convert_arrow(values: Any,
+                   many: Callable[[List[str]], List[str]]) -> Any:
+    if isinstance(values, _pa.ChunkedArray):
+        return _pa.chunked_array(
+                [_convert_arrow(chunk, many) for chunk in values.chunks],
+                type=values.type)
+
+    encoded = values.dictionary_encode()
+    dictionary = _pa.array(many(encoded.dictionary.to_pylist()),
+                           type=values.type)
+
+    return _pc.take(dictionary, encoded.indices)
+
+
+def convert(values: Any, case: str) -> Any:
+    """
+    Change the case of every string of an array.
+
+    Parameters
+    ----------
+    values : numpy.ndarray | pandas.Series | pandas.Index | pyarrow.Array |
+    pyarrow.ChunkedArray
+        Array of strings. NumPy arrays must be of object or unicode dtype,
+        Arrow arrays of a string type.
+    case : str
+        Name of the case with or without the trailing :code:`_case` e.g.,
+        :code:`snake` or :code:`snake_case`.
+
+    Returns
+    -------
+    converted : numpy.ndarray | pandas.Series | pandas.Index | pyarrow.Array
+    | pyarrow.ChunkedArray
+        Array of the same kind and shape as :code:`values` with its strings
+        transformed into :code:`case`.
+
+    Raises
+    ------
+    TypeError
+        If :code:`values` is not a supported array.
+    ValueError
+        If :code:`case` does not denote a known case.
+    """
+    many = get_case(case).many
+
+    if _pd is not None and isinstance(values, (_pd.Series, _pd.Index)):
+        return _convert_pandas(values, many)
+    if _np is not None and isinstance(values, _np.ndarray):
+        return _convert_numpy(values, many)
+    if _pa is not None and isinstance(values, (_pa.Array, _pa.ChunkedArray)):
+        return _convert_arrow(values, many)
+
+    raise TypeError(f'Cannot change case of {type(values).__name__}, must be '
+                    f'a NumPy array, pandas Series or Index, or Arrow array.')
+
+
+class CaseAccessor:
+    """
+    Pandas accessor to change the case of the strings of a Series or Index.
+
+    Available as :code:`.case` on every :class:`~pandas.Series` and
+    :class:`~pandas.Index` once :mod:`case_changer.columnar` is imported.
+    Provides one method per built-in or registered case named after the
+    case without the trailing :code:`_case` e.g., :code:`series.case.snake()`.
+    """
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __getattr__(self, name: str):
+        # the methods of the cases are created on demand, so that cases
+        # registered after importing this module have one, too
+        case = f'{name}_case'
+        if name.startswith('_') or case not in _CASES:
+            raise AttributeError(f'{type(self).__name__!r} object has no '
+                                 f'attribute {name!r}')
+
+        return _accessor_method(case).__get__(self, type(self))
+
+    def __dir__(self):
+        return [*super().__dir__(), *(case[:-len('_case')] for case in _CASES)]
+
+    def convert(self, case: str):
+        """
+        Change the case of every string, see :func:`convert`.
+        """
+        return convert(self._obj, case)
+
+
+def _accessor_method(case: str):
+    def method(self):
+        return convert(self._obj, case)
+
+    method.__name__ = method.__qualname__ = case.replace('_case', '')
+    method.__doc__ = f"""
+        Transform every string like :func:`case_changer.{case}`.
+        """
+
+    return method
+
+
+if _pd is not None:
+    _pd.api.extensions.register_series_accessor('case')(CaseAccessor)
+    _pd.api.extensions.register_index_accessor('case')(CaseAccessor)
+
+__all__ = [
+        'CaseAccessor',
+        'convert',
+]
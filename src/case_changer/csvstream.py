@@ -0,0 +1,181 @@
+"""
+Streaming case conversion of CSV and TSV files.
+
+Rows are read with the :mod:`csv` module and written back in batches, so
+memory use is bounded by the batch size rather than by the size of the file.
+The header and any selected columns are converted, where every column keeps
+its own memo of converted values, as categorical columns repeat the same few
+values over and over again.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import itertools
+from typing import Callable, Iterable, List, Optional, TextIO, Union
+
+from case_changer.cache import LRUCache
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+# Number of rows converted and written at once
+_BATCH_ROWS = 4096
+
+
+def _column_indices(header: List[str],
+                    columns: Iterable[Union[str, int]]) -> List[int]:
+    """
+    Resolve columns given by name or index into indices.
+
+    Parameters
+    ----------
+    header : List[str]
+        Original column names.
+    columns : Iterable[str | int]
+        Names as in :code:`header` or zero-based indices of the columns.
+
+    Returns
+    -------
+    indices : List[int]
+        Sorted distinct indices of the columns.
+
+    Raises
+    ------
+    ValueError
+        If a name is not in :code:`header` or an index is negative.
+    """
+    indices = set()
+    for column in columns:
+        if isinstance(column, int):
+            if column < 0:
+                raise ValueError(f'Column index must not be negative, got '
+                                 f'{column}.')
+            indices.add(column)
+        else:
+            try:
+                indices.add(header.index(column))
+            except ValueError:
+                raise ValueError(f'Unknown column {column!r}, must be one of '
+                                 f'{", ".join(header)}.') from None
+
+    return sorted(indices)
+
+
+def _line_terminator(line: str) -> str:
+    # line terminator of a line read with newline='', where a last line
+    # without one is taken to end in a line feed
+    if line.endswith('\r\n'):
+        return '\r\n'
+    if line.endswith('\r'):
+        return '\r'
+
+    return '\n'
+
+
+def transform_csv(input: TextIO,
+                  output: TextIO,
+                  case_fn: Callable[[str], str],
+                  header: bool = True,
+                  columns: Iterable[Union[str, int]] = (),
+                  cache_size: int = 4096,
+                  batch_rows: int = _BATCH_ROWS,
+                  **fmtparams) -> int:
+    """
+    Change the case of the header and of selected columns of a CSV text.
+
+    The first row is the header. Rows are read, converted and written in
+    batches of :code:`batch_rows`, each with a single write to
+    :code:`output`. Fields of other columns are copied unchanged, although
+    their quoting follows the output dialect. Rows end in the line
+    terminator of the header line unless :code:`lineterminator` is given.
+
+    Parameters
+    ----------
+    input : TextIO
+        Stream to read the CSV text from, opened with :code:`newline=''`.
+    output : TextIO
+        Stream to write the converted CSV text to, opened with
+        :code:`newline=''`.
+    case_fn : Callable[[str], str]
+        Case changing function e.g., :func:`case_changer.snake_case`.
+    header : bool, optional
+        Whether to change the case of the column names.
+    columns : Iterable[str | int], optional
+        Original names or zero-based indices of the columns whose values to
+        change the case of.
+    cache_size : int, optional
+        Maximum number of distinct converted values to remember per column.
+    batch_rows : int, optional
+        Number of rows converted and written at once.
+    fmtparams
+        Dialect and formatting parameters of :func:`csv.reader` and
+        :func:`csv.writer` e.g., :code:`delimiter='\\t'` for TSV.
+
+    Returns
+    -------
+    rows : int
+        Number of rows written, excluding the header.
+
+    Raises
+    ------
+    ValueError
+        If a column is unknown, see :func:`_column_indices`.
+
+    Examples
+    --------
+    >>> import io
+    >>> from case_changer import snake_case
+    >>> out = io.StringIO()
+    >>> transform_csv(io.StringIO('User Id,Plan Type\\n1,FreeTier\\n'), out,
+    ...               snake_case, columns=['Plan Type'])
+    1
+    >>> out.getvalue()
+    'user_id,plan_type\\n1,free_tier\\n'
+    """
+    first = input.readline()
+    if not first:
+        return 0
+    if 'lineterminator' not in fmtparams:
+        fmtparams['lineterminator'] = _line_terminator(first)
+    reader = csv.reader(itertools.chain((first,), input), **fmtparams)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, **fmtparams)
+
+    names: Optional[List[str]] = next(reader, None)
+    if names is None:
+        return 0
+
+    memos = [(index, LRUCache(cache_size))
+             for index in _column_indices(names, columns)]
+    writer.writerow([case_fn(name) for name in names] if header else names)
+
+    count = 0
+    while True:
+        rows = list(itertools.islice(reader, batch_rows))
+        for row in rows:
+            width = len(row)
+            for index, memo in memos:
+                if index >= width:
+                    break
+                value = row[index]
+                converted = memo.get(value)
+                if converted is None:
+                    converted = case_fn(value)
+                    memo.put(value, converted)
+                row[index] = converted
+        writer.writerows(rows)
+        count += len(rows)
+
+        output.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+        if len(rows) < batch_rows:
+            break
+
+    return count
+
+
+__all__ = [
+        'transform_csv',
+]
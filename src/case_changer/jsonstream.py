@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re as _re
+from typing import BinaryIO, Callable, Iterator, List, TextIO, Union
+
+from case_changer.cache import LRUCache
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+# Characters which change the state of the rewriter outside of strings
+_STRUCTURE_REGEXP = _re.compile(r'["{}\[\],:]')
+
+# Characters which end or escape characters inside of strings
+_STRING_REGEXP = _re.compile(r'["\\]')
+
+
+class _KeyRewriter:
+    """
+    Incremental rewriter of the object keys of a JSON text.
+
+    The rewriter tracks only as much of the JSON grammar as is needed to tell
+    object keys from other strings: a stack of the open containers, whether
+    the next string of an object is a key, and whether it is inside a string.
+    Everything but object keys is copied verbatim, so the text is neither
+    validated nor reformatted.
+
+    Parameters
+    ----------
+    case_fn : Callable[[str], str]
+        Case changing function to apply to each key.
+    cache_size : int
+        Maximum number of distinct converted keys to remember.
+    """
+
+    def __init__(self, case_fn: Callable[[str], str], cache_size: int):
+        self._case_fn = case_fn
+        self._cache = LRUCache(cache_size)
+        # `True` for every open object, `False` for every open array
+        self._stack: List[bool] = []
+        self._expect_key = False
+        self._in_string = False
+        self._in_key = False
+        self._escape = False
+        self._key: List[str] = []
+
+    def _rewrite(self, raw: str) -> str:
+        converted = self._cache.get(raw)
+        if converted is None:
+            key = json.loads(raw)
+            changed = self._case_fn(key)
+            # escaped keys stay escaped, as they may decode to lone
+            # surrogates which cannot be encoded
+            converted = raw if changed == key else json.dumps(
+                    changed, ensure_ascii=raw.isascii() or '\\u' in raw)
+            self._cache.put(raw, converted)
+
+        return converted
+
+    def feed(self, text: str) -> str:
+        """
+        Rewrite the next piece of the JSON text.
+
+        Parameters
+        ----------
+        text : str
+            Next piece of the JSON text, which may end anywhere.
+
+        Returns
+        -------
+        text : str
+            Rewritten text as far as it can be rewritten yet. Pieces of keys
+            are held back until the key is complete.
+
+        Raises
+        ------
+        ValueError
+            If an object or array is closed that was never opened.
+        """
+        out = []
+        pos = 0
+        n = len(text)
+        while pos < n:
+            if self._in_string:
+                target = self._key if self._in_key else out
+                if self._escape:
+                    target.append(text[pos])
+                    self._escape = False
+                    pos += 1
+                    continue
+
+                m = _STRING_REGEXP.search(text, pos)
+                if m is None:
+                    target.append(text[pos:])
+                    break
+
+                end = m.end()
+                target.append(text[pos:end])
+                pos = end
+                if m.group() == '\\':
+                    self._escape = True
+                    continue
+
+                self._in_string = False
+                if self._in_key:
+                    out.append(self._rewrite(''.join(self._key)))
+                    self._key.clear()
+                    self._in_key = False
+                continue
+
+            m = _STRUCTURE_REGEXP.search(text, pos)
+            if m is None:
+                out.append(text[pos:])
+                break
+
+            c = m.group()
+            out.append(text[pos:m.start()])
+            pos = m.end()
+            if c == '"':
+                self._in_string = True
+                self._in_key = self._expect_key
+                if self._in_key:
+                    self._key.append(c)
+                    continue
+            elif c == '{':
+                self._stack.append(True)
+                self._expect_key = True
+            elif c == '[':
+                self._stack.append(False)
+                self._expect_key = False
+            elif c == '}' or c == ']':
+                if not self._stack:
+                    raise ValueError(f'Unbalanced {c!r} in JSON text.')
+                self._stack.pop()
+                self._expect_key = False
+            elif c == ',':
+                self._expect_key = bool(self._stack) and self._stack[-1]
+            else:
+                self._expect_key = False
+            out.append(c)
+
+        return ''.join(out)
+
+
+def transform_json(stream: Union[TextIO, BinaryIO],
+                   case_fn: Callable[[str], str],
+                   chunk_size: int = 1 << 16,
+                   cache_size: int = 4096) -> Iterator[str]:
+    """
+    Change the case of all object keys of a JSON text read from a stream.
+
+    The text is read and rewritten piece by piece, so memory use is bounded
+    by the nesting depth and the length of the longest key rather than by
+    the size of the text. Works for single JSON documents as well as for
+    newline-delimited JSON. Only object keys are rewritten, everything else
+    including whitespace is copied verbatim.
+
+    Parameters
+    ----------
+    stream : TextIO | BinaryIO
+        Stream to read the JSON text from. Binary streams must be UTF-8
+        encoded.
+    case_fn : Callable[[str], str]
+        Case changing function to apply to each key e.g.,
+        :func:`case_changer.camel_case`.
+    chunk_size : int, optional
+        Number of characters or bytes to read at once.
+    cache_size : int, optional
+        Maximum number of distinct converted keys to remember.
+
+    Yields
+    ------
+    text : str
+        Next piece of the rewritten JSON text.
+
+    Raises
+    ------
+    ValueError
+        If the JSON text closes an object or array that was never opened.
+
+    Examples
+    --------
+    >>> import io
+    >>> from case_changer import camel_case
+    >>> ''.join(transform_json(io.StringIO('{"user_id": [{"first_name": "a_b"}]}'), camel_case))
+    '{"userId": [{"firstName": "a_b"}]}'
+    """
+    rewriter = _KeyRewriter(case_fn, cache_size)
+    decoder = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder('utf-8')()
+            chunk = decoder.decode(chunk)
+
+        text = rewriter.feed(chunk)
+        if text:
+            yield text
+
+    if decoder is not None:
+        text = rewriter.feed(decoder.decode(b'', final=True))
+        if text:
+            yield text
+
+
+__all__ = [
+        'transform_json',
+]
@@ -0,0 +1,538 @@
+"""
+WSGI and ASGI middleware changing the case of the keys of JSON bodies.
+
+Services speaking camelCase JSON to their clients but snake_case internally
+wrap their application into :class:`WSGIMiddleware` or
+:class:`ASGIMiddleware`. The keys of JSON request bodies are changed into
+snake_case before the application reads them, the keys of JSON response
+bodies into camelCase before they are sent.
+
+Only the keys are changed, everything else including the formatting and the
+literals of numbers is passed on verbatim by the rewriter of
+:func:`case_changer.jsonstream.transform_json`. Bodies of a known length up
+to a limit are rewritten once complete, so that invalid JSON is passed on
+unchanged. Larger bodies and bodies of unknown length are rewritten while
+they stream through the middleware, so they are never held in memory as a
+whole.
+"""
+from __future__ import annotations
+
+import codecs
+import io
+import tempfile
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple
+
+from case_changer.cache import LRUCache
+from case_changer.changers import camel_case
+from case_changer.changers import snake_case
+from case_changer.jsonstream import _KeyRewriter
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+
+def _is_json(content_type: Optional[str]) -> bool:
+    """
+    Tell whether a content type denotes UTF-8 encoded JSON.
+
+    Parameters
+    ----------
+    content_type : str | None
+        Value of a :code:`Content-Type` header e.g.,
+        :code:`application/json; charset=utf-8`.
+
+    Returns
+    -------
+    json : bool
+        `True` for :code:`application/json` and any :code:`+json` type
+        without a charset other than UTF-8.
+    """
+    if not content_type:
+        return False
+
+    media_type, *params = content_type.split(';')
+    media_type = media_type.strip().lower()
+    if media_type != 'application/json' and not media_type.endswith('+json'):
+        return False
+
+    for param in params:
+        name, _, value = param.partition('=')
+        if name.strip().lower() == 'charset' \
+                and value.strip(' "').lower() not in ('utf-8', 'utf8'):
+            return False
+
+    return True
+
+
+def _is_identity(content_encoding: Optional[str]) -> bool:
+    # compressed bodies are passed on unchanged
+    return (not content_encoding
+            or content_encoding.strip().lower() == 'identity')
+
+
+def _content_length(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class _BodyRewriter:
+    """
+    Rewriter of the keys of a UTF-8 encoded JSON body arriving in pieces.
+
+    Buffered bodies are rewritten once complete. They are passed on
+    unchanged if they turn out not to be JSON because they close an object
+    or array they never opened or end inside a string or container, or if a
+    changed key cannot be encoded. Other bodies are rewritten piece by piece,
+    passing bytes which are no valid UTF-8 through unchanged. If such a body
+    turns out not to be JSON, the rest of it is passed through unchanged.
+
+    Parameters
+    ----------
+    change : Callable[[str], str]
+        Case changing function to apply to each key.
+    buffered : bool
+        Whether to buffer the body and convert it as a whole.
+
+    Attributes
+    ----------
+    seconds : float
+        Time spent rewriting the body so far.
+    """
+
+    __slots__ = ('seconds', '_change', '_chunks', '_decoder', '_rewriter')
+
+    def __init__(self, change: Callable[[str], str], buffered: bool):
+        self.seconds: float = 0.0
+        self._change = change
+        self._chunks: Optional[List[bytes]] = None
+        self._decoder = self._rewriter = None
+        if buffered:
+            self._chunks = []
+        else:
+            self._decoder = codecs.getincrementaldecoder('utf-8')(
+                    'surrogateescape')
+            # remembers the quoted keys of this body, `change` those of all
+            self._rewriter = _KeyRewriter(change, 1024)
+
+    @property
+    def buffered(self) -> bool:
+        return self._chunks is not None
+
+    def _convert(self, body: bytes) -> bytes:
+        rewriter = _KeyRewriter(self._change, 1024)
+        try:
+            text = rewriter.feed(body.decode('utf-8', 'surrogateescape'))
+            if rewriter._stack or rewriter._in_string:
+                return body
+            return text.encode('utf-8', 'surrogateescape')
+        except ValueError:
+            # unbalanced containers or changed keys with lone surrogates
+            return body
+
+    def feed(self, data: bytes, final: bool = False) -> bytes:
+        """
+        Rewrite the next piece of the body.
+
+        Parameters
+        ----------
+        data : bytes
+            Next piece of the body, which may end anywhere.
+        final : bool, optional
+            Whether :code:`data` is the last piece of the body.
+
+        Returns
+        -------
+        data : bytes
+            Rewritten body as far as it can be rewritten yet.
+        """
+        start = time.perf_counter()
+        if self._chunks is not None:
+            self._chunks.append(data)
+            data = self._convert(b''.join(self._chunks)) if final else b''
+        else:
+            text = self._decoder.decode(data, final)
+            rewriter = self._rewriter
+            if rewriter is not None:
+                # pieces of a key held back from previous pieces of the body
+                pending = ''.join(rewriter._key)
+                try:
+                    text = rewriter.feed(text)
+                except ValueError:
+                    self._rewriter = None
+                    text = pending + text
+            data = text.encode('utf-8', 'surrogateescape')
+        self.seconds += time.perf_counter() - start
+
+        return data
+
+
+def _cached(case_fn: Callable[[str], str],
+            cache: LRUCache) -> Callable[[str], str]:
+    """
+    Wrap a case changing function to remember its results in a cache.
+
+    Parameters
+    ----------
+    case_fn : Callable[[str], str]
+        Case changing function to wrap.
+    cache : LRUCache
+        Cache to remember the results of :code:`case_fn` in.
+
+    Returns
+    -------
+    change : Callable[[str], str]
+        Case changing function looking up its results in :code:`cache`
+        first.
+    """
+    def change(key: str) -> str:
+        converted = cache.get(key)
+        if converted is None:
+            converted = case_fn(key)
+            cache.put(key, converted)
+        return converted
+
+    return change
+
+
+class _CaseMiddleware:
+    """
+    Configuration shared by the WSGI and the ASGI middleware, see
+    :class:`ASGIMiddleware` for its parameters.
+    """
+
+    def __init__(self,
+                 app: Callable,
+                 request_case: Optional[Callable[[str], str]] = snake_case,
+                 response_case: Optional[Callable[[str], str]] = camel_case,
+                 cache_size: int = 4096,
+                 buffer_size: int = 1 << 20,
+                 report: Optional[Callable[[float], None]] = None):
+        self.app = app
+        self.request_case = request_case
+        self.response_case = response_case
+        self.request_cache = LRUCache(cache_size)
+        self.response_cache = LRUCache(cache_size)
+        self.buffer_size = buffer_size
+        self.report = report
+        self._change_request = self._change_response = None
+        if request_case is not None:
+            self._change_request = _cached(request_case, self.request_cache)
+        if response_case is not None:
+            self._change_response = _cached(response_case,
+                                            self.response_cache)
+
+    def _rewriter(self,
+                  change: Optional[Callable[[str], str]],
+                  content_type: Optional[str],
+                  content_encoding: Optional[str],
+                  content_length: Optional[str]) -> Optional[_BodyRewriter]:
+        """
+        Create the rewriter of a body.
+
+        Returns
+        -------
+        rewriter : _BodyRewriter | None
+            Rewriter of the body, buffering it if its length is known and at
+            most :code:`buffer_size`, or `None` if the body is passed on
+            unchanged.
+        """
+        if change is None or not _is_json(content_type) \
+                or not _is_identity(content_encoding):
+            return None
+
+        length = _content_length(content_length)
+        return _BodyRewriter(change,
+                             length is not None and length <= self.buffer_size)
+
+    def _report(self, *rewriters: Optional[_BodyRewriter]) -> None:
+        seconds = [r.seconds for r in rewriters if r is not None]
+        if self.report is not None and seconds:
+            self.report(sum(seconds))
+
+
+class _WSGIBody:
+    """
+    Response iterable of :class:`WSGIMiddleware` rewriting the response of
+    the wrapped application.
+
+    Parameters
+    ----------
+    body : Iterable[bytes]
+        Response iterable of the wrapped application.
+    rewriter : Callable[[], _BodyRewriter | None]
+        Function returning the rewriter of the response body, which is known
+        only once the application started its response.
+    close : Callable[[], None]
+        Function to call once the response is complete.
+    """
+
+    __slots__ = ('_body', '_rewriter', '_close')
+
+    def __init__(self,
+                 body: Iterable[bytes],
+                 rewriter: Callable[[], Optional[_BodyRewriter]],
+                 close: Callable[[], None]):
+        self._body = body
+        self._rewriter = rewriter
+        self._close = close
+
+    def __iter__(self) -> Iterator[bytes]:
+        for data in self._body:
+            rewriter = self._rewriter()
+            # an empty piece while the body is held back keeps the server
+            # going
+            yield data if rewriter is None else rewriter.feed(data)
+
+        rewriter = self._rewriter()
+        if rewriter is not None:
+            data = rewriter.feed(b'', final=True)
+            if data:
+                yield data
+
+    def close(self) -> None:
+        try:
+            close = getattr(self._body, 'close', None)
+            if close is not None:
+                close()
+        finally:
+            self._close()
+
+
+class WSGIMiddleware(_CaseMiddleware):
+    """
+    WSGI middleware changing the case of the keys of JSON bodies.
+
+    Request bodies are rewritten before the application is called, because
+    WSGI applications rely on the :code:`CONTENT_LENGTH` of the request.
+    Request bodies of more than :code:`buffer_size` bytes or of unknown
+    length are rewritten into a spooled temporary file. Response bodies are
+    rewritten while the application yields them, and their
+    :code:`Content-Length` is dropped. Bodies which are not JSON or are
+    compressed are passed on unchanged.
+
+    Parameters
+    ----------
+    app : Callable
+        WSGI application to wrap.
+    spool_size : int, optional
+        Number of bytes of a streamed request body kept in memory before it
+        is spooled to disk.
+    chunk_size : int, optional
+        Number of bytes to read from a streamed request body at once.
+    **kwargs
+        Configuration of the middleware, see :class:`ASGIMiddleware`.
+
+    Examples
+    --------
+    >>> import json
+    >>> def app(environ, start_response):
+    ...     start_response('200 OK', [('Content-Type', 'application/json')])
+    ...     return [json.dumps({'user_id': 1}).encode()]
+    >>> app = WSGIMiddleware(app)
+    >>> b''.join(app({'REQUEST_METHOD': 'GET'}, lambda *args: None))
+    b'{"userId": 1}'
+    """
+
+    def __init__(self,
+                 app: Callable,
+                 spool_size: int = 1 << 20,
+                 chunk_size: int = 1 << 16,
+                 **kwargs):
+        super().__init__(app, **kwargs)
+        self.spool_size = spool_size
+        self.chunk_size = chunk_size
+
+    def _rewrite_request(self,
+                         environ: Dict[str, Any],
+                         rewriter: _BodyRewriter) -> Dict[str, Any]:
+        stream = environ['wsgi.input']
+        remaining = _content_length(environ.get('CONTENT_LENGTH'))
+        if remaining is None and not environ.get('wsgi.input_terminated'):
+            remaining = 0
+
+        if rewriter.buffered:
+            body = io.BytesIO()
+        else:
+            body = tempfile.SpooledTemporaryFile(self.spool_size)
+        while remaining is None or remaining > 0:
+            size = self.chunk_size if remaining is None \
+                else min(self.chunk_size, remaining)
+            data = stream.read(size)
+            if not data:
+                break
+            if remaining is not None:
+                remaining -= len(data)
+            body.write(rewriter.feed(data))
+        body.write(rewriter.feed(b'', final=True))
+
+        environ = dict(environ)
+        environ['CONTENT_LENGTH'] = str(body.tell())
+        environ['wsgi.input'] = body
+        body.seek(0)
+
+        return environ
+
+    def __call__(self,
+                 environ: Dict[str, Any],
+                 start_response: Callable) -> Iterable[bytes]:
+        request = self._rewriter(self._change_request,
+                                 environ.get('CONTENT_TYPE'),
+                                 environ.get('HTTP_CONTENT_ENCODING'),
+                                 environ.get('CONTENT_LENGTH'))
+        if request is not None:
+            environ = self._rewrite_request(environ, request)
+
+        response: List[Optional[_BodyRewriter]] = [None]
+
+        def start(status: str,
+                  headers: List[Tuple[str, str]],
+                  exc_info: Any = None) -> Callable[[bytes], Any]:
+            fields = {name.lower(): value for name, value in headers}
+            rewriter = response[0] = self._rewriter(
+                    self._change_response,
+                    fields.get('content-type'),
+                    fields.get('content-encoding'),
+                    fields.get('content-length'))
+            if rewriter is not None:
+                headers = [(name, value) for name, value in headers
+                           if name.lower() != 'content-length']
+            write = start_response(status, headers, exc_info)
+            if rewriter is None:
+                return write
+
+            return lambda data: write(rewriter.feed(data))
+
+        def close():
+            if request is not None:
+                environ['wsgi.input'].close()
+            self._report(request, response[0])
+
+        try:
+            body = self.app(environ, start)
+        except BaseException:
+            close()
+            raise
+
+        return _WSGIBody(body, lambda: response[0], close)
+
+
+class ASGIMiddleware(_CaseMiddleware):
+    """
+    ASGI middleware changing the case of the keys of JSON bodies.
+
+    Request bodies are rewritten as the application receives them. Because
+    their length changes, their :code:`content-length` header is dropped.
+    Response bodies of at most :code:`buffer_size` bytes are sent at once
+    with a corrected :code:`content-length`, larger ones or ones of unknown
+    length are rewritten message by message without a
+    :code:`content-length`. Bodies which are not JSON or are compressed are
+    passed on unchanged, as are all but HTTP connections.
+
+    Parameters
+    ----------
+    app : Callable
+        ASGI application to wrap.
+    request_case : Callable[[str], str] | None, optional
+        Case changing function to apply to the keys of JSON request bodies,
+        or `None` to pass request bodies on unchanged. Defaults to
+        :func:`case_changer.snake_case`.
+    response_case : Callable[[str], str] | None, optional
+        Case changing function to apply to the keys of JSON response bodies,
+        or `None` to pass response bodies on unchanged. Defaults to
+        :func:`case_changer.camel_case`.
+    cache_size : int, optional
+        Maximum number of distinct converted keys remembered across requests,
+        separately for requests and responses.
+    buffer_size : int, optional
+        Maximum length in bytes of bodies which are parsed and serialized as
+        a whole instead of being rewritten while streaming. It holds the
+        body in memory, but passes invalid JSON on unchanged and lets the
+        ASGI middleware send the :code:`content-length` of the response.
+    report : Callable[[float], None], optional
+        Function called with the seconds spent rewriting the bodies of a
+        request and its response, once the response is complete. Only
+        called for requests with a body or response rewritten.
+
+    Attributes
+    ----------
+    request_cache : LRUCache
+        Converted keys of request bodies, see
+        :meth:`case_changer.cache.LRUCache.info` for its statistics.
+    response_cache : LRUCache
+        Converted keys of response bodies.
+    """
+
+    async def __call__(self,
+                       scope: MutableMapping[str, Any],
+                       receive: Callable[[], Awaitable[dict]],
+                       send: Callable[[dict], Awaitable[None]]) -> None:
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        fields = {name.lower(): value.decode('latin-1')
+                  for name, value in scope.get('headers', ())}
+        request = self._rewriter(self._change_request,
+                                 fields.get(b'content-type'),
+                                 fields.get(b'content-encoding'),
+                                 fields.get(b'content-length'))
+        response: Optional[_BodyRewriter] = None
+        # start of a buffered response, sent along with its body
+        start: Optional[dict] = None
+
+        async def receive_():
+            message = await receive()
+            if message['type'] == 'http.request':
+                message = dict(message, body=request.feed(
+                        message.get('body', b''),
+                        not message.get('more_body', False)))
+            return message
+
+        async def send_(message):
+            nonlocal response, start
+            if message['type'] == 'http.response.start':
+                headers = {name.lower(): value.decode('latin-1')
+                           for name, value in message.get('headers', ())}
+                response = self._rewriter(self._change_response,
+                                          headers.get(b'content-type'),
+                                          headers.get(b'content-encoding'),
+                                          headers.get(b'content-length'))
+                if response is not None:
+                    message = dict(message, headers=[
+                            (name, value) for name, value in message['headers']
+                            if name.lower() != b'content-length'])
+                    if response.buffered:
+                        start = message
+                        return
+            elif message['type'] == 'http.response.body' \
+                    and response is not None:
+                final = not message.get('more_body', False)
+                body = response.feed(message.get('body', b''), final)
+                message = dict(message, body=body)
+                if start is not None:
+                    if not final:
+                        return
+                    await send(dict(start, headers=start['headers'] + [
+                            (b'content-length', b'%d' % len(body))]))
+                    start = None
+            await send(message)
+
+        if request is not None:
+            scope = dict(scope, headers=[
+                    (name, value) for name, value in scope['headers']
+                    if name.lower() != b'content-length'])
+
+        try:
+            await self.app(scope,
+                           receive if request is None else receive_,
+                           send_)
+        finally:
+            self._report(request, response)
+
+
+__all__ = [
+        'ASGIMiddleware',
+        'WSGIMiddleware',
+]
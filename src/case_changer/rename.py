@@ -0,0 +1,216 @@
+"""
+Renaming the files and directories of a tree by case.
+
+The tree is walked with :func:`os.scandir` and the names of each directory
+are converted at once with the batch variant of the case changing function.
+All renames are planned and checked for collisions before the first one is
+applied, so that a collision never leaves the tree half renamed. Renames are
+applied deepest first, in batches which may be spread over a thread pool.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+from typing import Iterator, List, Tuple
+
+from case_changer.changers import get_case
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+# Number of renames handed to a thread at once
+_BATCH_SIZE = 1024
+
+# Maximum number of collisions listed in the error raised for them
+_MAX_REPORTED = 10
+
+
+def _scan(root: str) -> Iterator[Tuple[str, int, List[os.DirEntry]]]:
+    """
+    Walk a directory tree with :func:`os.scandir`.
+
+    Parameters
+    ----------
+    root : str
+        Path of the directory to walk.
+
+    Yields
+    ------
+    path : str
+        Path of every directory of the tree, including :code:`root`.
+    depth : int
+        Number of directories between :code:`root` and :code:`path`, zero
+        for :code:`root` itself.
+    entries : List[os.DirEntry]
+        Entries of the directory. Symbolic links to directories are listed
+        but not walked into.
+    """
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        with os.scandir(path) as it:
+            entries = list(it)
+        yield path, depth, entries
+        stack.extend((entry.path, depth + 1) for entry in entries
+                     if entry.is_dir(follow_symlinks=False))
+
+
+def _split_name(name: str, is_dir: bool) -> Tuple[str, str, str]:
+    """
+    Split a name into the part to convert and the parts to keep.
+
+    Returns
+    -------
+    prefix : str
+        Leading dots of hidden files and directories.
+    stem : str
+        Part of the name to change the case of.
+    suffix : str
+        Extension of a file, including its dot.
+    """
+    stem = name.lstrip('.')
+    prefix = name[:len(name) - len(stem)]
+    suffix = ''
+    if not is_dir:
+        stem, suffix = os.path.splitext(stem)
+
+    return prefix, stem, suffix
+
+
+def plan_renames(root: str,
+                 case: str,
+                 directories: bool = True) -> List[Tuple[str, str]]:
+    """
+    Plan renaming the files and directories below a directory.
+
+    Parameters
+    ----------
+    root : str
+        Path of the directory whose contents to rename. The directory itself
+        is not renamed.
+    case : str
+        Name of the case with or without the trailing :code:`_case`, see
+        :func:`case_changer.get_case`.
+    directories : bool, optional
+        Whether to rename directories, too, besides files and symbolic
+        links. Leading dots and file extensions are always kept.
+
+    Returns
+    -------
+    renames : List[Tuple[str, str]]
+        Source and target paths of every entry whose name changes, entries
+        of deeper directories first.
+
+    Raises
+    ------
+    FileExistsError
+        If a target name exists already or several entries of a directory
+        would get the same name.
+    ValueError
+        If the case puts path separators into names.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     open(os.path.join(tmp, 'Annual Report.PDF'), 'w').close()
+    ...     [os.path.relpath(p, tmp) for p in plan_renames(tmp, 'snake')[0]]
+    ['Annual Report.PDF', 'annual_report.PDF']
+    """
+    # the paths of the renames are compared by their separators when they
+    # are applied, which a trailing separator of the root would throw off
+    root = os.path.normpath(root)
+    many = get_case(case).many
+    separators = tuple(filter(None, (os.sep, os.altsep)))
+
+    renames = []
+    collisions = []
+    for path, depth, entries in _scan(root):
+        candidates = [(entry.name, entry.is_dir(follow_symlinks=False))
+                      for entry in entries]
+        if not directories:
+            candidates = [(name, is_dir) for name, is_dir in candidates
+                          if not is_dir]
+        if not candidates:
+            continue
+
+        names = [name for name, _ in candidates]
+        parts = [_split_name(name, is_dir) for name, is_dir in candidates]
+        stems = many([stem for _, stem, _ in parts])
+
+        existing = {entry.name for entry in entries}
+        targets = {}
+        for name, (prefix, _, suffix), stem in zip(names, parts, stems):
+            target = f'{prefix}{stem}{suffix}'
+            if target == name:
+                continue
+            if any(sep in target for sep in separators):
+                raise ValueError(f'Case {case!r} turns {name!r} into a path, '
+                                 f'{target!r}.')
+            targets.setdefault(target, []).append(name)
+
+        for target, sources in targets.items():
+            if len(sources) > 1 or target in existing:
+                collisions.append((os.path.join(path, target), sources))
+            else:
+                renames.append((depth, os.path.join(path, sources[0]),
+                                os.path.join(path, target)))
+
+    if collisions:
+        raise FileExistsError(
+                f'{len(collisions)} renames collide, e.g. ' + '; '.join(
+                        f'{", ".join(sources)} -> {target}'
+                        for target, sources in collisions[:_MAX_REPORTED]))
+
+    renames.sort(key=lambda rename: -rename[0])
+
+    return [(source, target) for _, source, target in renames]
+
+
+def _rename_batch(renames: List[Tuple[str, str]]) -> None:
+    for source, target in renames:
+        os.rename(source, target)
+
+
+def apply_renames(renames: List[Tuple[str, str]],
+                  jobs: int = 1,
+                  batch_size: int = _BATCH_SIZE) -> None:
+    """
+    Apply renames planned by :func:`plan_renames`.
+
+    Renames are applied level by level, deepest first, as renaming a
+    directory changes the paths of its contents. Renames of the same level
+    are independent of each other, so they are split into batches which can
+    be applied in parallel. The tree must not change between planning and
+    applying the renames, existing targets are not checked again.
+
+    Parameters
+    ----------
+    renames : List[Tuple[str, str]]
+        Source and target paths as returned by :func:`plan_renames`.
+    jobs : int, optional
+        Number of threads applying batches in parallel. Renames are applied
+        in the current thread if :code:`1`.
+    batch_size : int, optional
+        Number of renames per batch.
+    """
+    if jobs <= 1:
+        _rename_batch(renames)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(jobs) as pool:
+        for _, level in itertools.groupby(
+                renames, key=lambda rename: rename[0].count(os.sep)):
+            level = list(level)
+            # wait for every batch of a level before starting the next one
+            list(pool.map(_rename_batch,
+                          [level[i:i + batch_size]
+                           for i in range(0, len(level), batch_size)]))
+
+
+__all__ = [
+        'apply_renames',
+        'plan_renames',
+]
@@ -0,0 +1,273 @@
+"""
+Rewriting identifiers across source trees.
+
+Migrating the naming convention of a code base means changing the case of
+every identifier matching a pattern in thousands of files, most of which do
+not contain any. Each file is therefore mapped into memory and searched as
+bytes without decoding it, and only files which actually change are written,
+atomically by replacing them with a rewritten copy. Conversions are
+remembered across files, and the files can be processed by a pool of worker
+processes.
+"""
+from __future__ import annotations
+
+import difflib
+import functools
+import glob
+import mmap
+import os
+import re
+import shutil
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from case_changer.cache import LRUCache
+from case_changer.changers import _bytes_pattern
+from case_changer.changers import get_case
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+# Maximum number of conversions remembered per case and process
+_CACHE_SIZE = 1 << 16
+
+# Minimum number of files for which to start a process pool, fewer files are
+# rewritten faster in the current process
+_MIN_PARALLEL_FILES = 64
+
+# Conversions of matched identifiers by the name of their case, shared by all
+# files rewritten in a process
+_caches: Dict[str, LRUCache] = {}
+
+
+def _expand(patterns: Iterable[str]) -> List[str]:
+    """
+    Expand glob patterns into the paths of the files they match.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        Glob patterns, where :code:`**` matches any number of directories.
+
+    Returns
+    -------
+    paths : List[str]
+        Paths of the matching regular files, sorted per pattern and in the
+        order of :code:`patterns`. Each file is listed only once by the first
+        path matching it, even if symbolic links lead to it by others.
+    """
+    paths = {}
+    for pattern in patterns:
+        for path in sorted(glob.iglob(pattern, recursive=True)):
+            if os.path.isfile(path):
+                paths.setdefault(os.path.realpath(path), path)
+
+    return list(paths.values())
+
+
+def _compile(pattern: Union[str, bytes, re.Pattern]) -> re.Pattern:
+    # bytes pattern to search the undecoded content of files with
+    if isinstance(pattern, bytes):
+        return re.compile(pattern)
+
+    return _bytes_pattern(pattern)
+
+
+def _rewrite(data: Union[bytes, mmap.mmap],
+             pattern: re.Pattern,
+             case: str) -> Optional[bytes]:
+    """
+    Change the case of every match of a pattern in a buffer.
+
+    Parameters
+    ----------
+    data : bytes | mmap.mmap
+        Buffer to search.
+    pattern : re.Pattern
+        Bytes pattern of the identifiers to change.
+    case : str
+        Name of the case to change the identifiers into.
+
+    Returns
+    -------
+    data : bytes | None
+        Rewritten buffer, or `None` if no match changes.
+    """
+    cache = _caches.get(case)
+    if cache is None:
+        cache = _caches[case] = LRUCache(_CACHE_SIZE)
+    convert = get_case(case).convert
+
+    pieces = []
+    end = 0
+    for match in pattern.finditer(data):
+        identifier = match[0]
+        converted = cache.get(identifier)
+        if converted is None:
+            converted = convert(identifier)
+            cache.put(identifier, converted)
+        if converted != identifier:
+            start = match.start()
+            pieces.append(data[end:start])
+            pieces.append(converted)
+            end = match.end()
+
+    if not pieces:
+        return None
+
+    pieces.append(data[end:])
+
+    return b''.join(pieces)
+
+
+def _diff(path: str, old: bytes, new: bytes) -> str:
+    # unified diff of a file's content, undecodable bytes are kept as they are
+    return ''.join(difflib.unified_diff(
+            old.decode('utf-8', 'surrogateescape').splitlines(keepends=True),
+            new.decode('utf-8', 'surrogateescape').splitlines(keepends=True),
+            fromfile=f'a/{path}',
+            tofile=f'b/{path}'))
+
+
+def _replace(path: str, data: bytes) -> None:
+    """
+    Atomically replace the content of a file.
+
+    The data is written to a temporary file in the same directory, which
+    gets the permissions of the original file and then replaces it, so that
+    readers see either the old or the new content but never a partial one.
+    Symbolic links are followed and the file they point to is replaced, so
+    that they keep pointing to it.
+    """
+    path = os.path.realpath(path)
+    directory, name = os.path.split(path)
+    fd, temporary = tempfile.mkstemp(dir=directory or '.',
+                                     prefix=f'.{name}.',
+                                     suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        shutil.copymode(path, temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def rewrite_file(path: str,
+                 pattern: Union[str, bytes, re.Pattern],
+                 case: str,
+                 dry_run: bool = False) -> Optional[str]:
+    """
+    Change the case of every identifier matching a pattern in a file.
+
+    The file is mapped into memory and searched without decoding it, and it
+    is only written if some identifier changes.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to rewrite.
+    pattern : str | bytes | re.Pattern
+        Regular expression matching the identifiers to change. String
+        patterns are matched against the UTF-8 encoded content, so classes
+        like :code:`\\w` only match ASCII characters.
+    case : str
+        Name of the case with or without the trailing :code:`_case`, see
+        :func:`case_changer.get_case`.
+    dry_run : bool, optional
+        Whether to leave the file untouched and only report the changes.
+
+    Returns
+    -------
+    diff : str | None
+        `None` if the file does not change. Otherwise the unified diff of the
+        changes in a dry run and an empty string else.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     path = os.path.join(tmp, 'module.py')
+    ...     with open(path, 'w') as fh:
+    ...         _ = fh.write('userId = getUserId()\\n')
+    ...     _ = rewrite_file(path, r'\\b[a-z]+[A-Z]\\w*', 'snake')
+    ...     print(open(path).read(), end='')
+    user_id = get_user_id()
+    """
+    pattern = _compile(pattern)
+    case = get_case(case).name
+    with open(path, 'rb') as fh:
+        if not os.fstat(fh.fileno()).st_size:
+            return None
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            rewritten = _rewrite(data, pattern, case)
+            if rewritten is None:
+                return None
+            if dry_run:
+                return _diff(path, data[:], rewritten)
+
+    _replace(path, rewritten)
+
+    return ''
+
+
+def rewrite_files(globs: Iterable[str],
+                  pattern: Union[str, bytes, re.Pattern],
+                  case: str,
+                  dry_run: bool = False,
+                  jobs: int = 1) -> Iterator[Tuple[str, str]]:
+    """
+    Change the case of every identifier matching a pattern in many files.
+
+    Parameters
+    ----------
+    globs : Iterable[str]
+        Glob patterns of the files to rewrite e.g., :code:`src/**/*.py`.
+    pattern : str | bytes | re.Pattern
+        Regular expression matching the identifiers to change, see
+        :func:`rewrite_file`.
+    case : str
+        Name of the case to change the identifiers into.
+    dry_run : bool, optional
+        Whether to leave the files untouched and only report the changes.
+    jobs : int, optional
+        Number of worker processes. If :code:`1` or if there are less than
+        :code:`_MIN_PARALLEL_FILES` files, the files are rewritten in the
+        current process. Registered cases are only known to the workers if
+        the platform forks them.
+
+    Yields
+    ------
+    path : str
+        Path of every file that changes, in the order of :code:`globs`.
+    diff : str
+        Unified diff of its changes in a dry run, an empty string else.
+    """
+    paths = _expand(globs)
+    pattern = _compile(pattern)
+    case = get_case(case).name
+    rewrite = functools.partial(rewrite_file, pattern=pattern, case=case,
+                                dry_run=dry_run)
+
+    if jobs <= 1 or len(paths) < _MIN_PARALLEL_FILES:
+        results = map(rewrite, paths)
+        yield from ((path, diff) for path, diff in zip(paths, results)
+                    if diff is not None)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # hand out files in chunks to spread the cost of the round trips, while
+    # keeping the chunks small enough to balance the load
+    chunksize = max(1, min(64, len(paths) // (4 * jobs)))
+    with ProcessPoolExecutor(jobs) as pool:
+        results = pool.map(rewrite, paths, chunksize=chunksize)
+        yield from ((path, diff) for path, diff in zip(paths, results)
+                    if diff is not None)
+
+
+__all__ = [
+        'rewrite_file',
+        'rewrite_files',
+]
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter, namedtuple
+from typing import Dict, Iterable, Optional
+
+from case_changer import cache as _caching
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+StatsInfo = namedtuple('StatsInfo', ('calls', 'times', 'sizes', 'cache'))
+
+# Stages of a conversion, in the order they run
+STAGES = ('split', 'strip', 'transform', 'join', 'walk')
+
+
+def _bucket(size: int) -> int:
+    # smallest power of two not less than `size`
+    return 1 << (size - 1).bit_length() if size else 0
+
+
+class Stats:
+    """
+    Recorder of the statistics of the case changing functions.
+
+    Attributes
+    ----------
+    calls : Counter
+        Number of calls of each case changing function by its name.
+    times : Dict[str, float]
+        Cumulative time in seconds spent in each stage, see :code:`STAGES`.
+        The :code:`split` stage covers tokenizing altogether if a tokenizer
+        splits and strips in a single pass, like the ASCII fast path does.
+        The :code:`walk` stage is the time spent in :func:`to_snake` and
+        :func:`to_camel` including the conversion of their keys.
+    sizes : Counter
+        Number of converted strings by the smallest power of two not less
+        than their length.
+    """
+
+    __slots__ = ('calls', 'times', 'sizes', '_lock')
+
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self.times: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.sizes: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self,
+               name: str,
+               size: Optional[int] = None,
+               **times: float) -> None:
+        """
+        Record a call of a case changing function.
+
+        Parameters
+        ----------
+        name : str
+            Name of the called function.
+        size : int, optional
+            Length of the converted string, if any.
+        times : float
+            Time in seconds spent in each stage by this call.
+        """
+        with self._lock:
+            self.calls[name] += 1
+            if size is not None:
+                self.sizes[_bucket(size)] += 1
+            for stage, seconds in times.items():
+                self.times[stage] += seconds
+
+    def record_batch(self,
+                     name: str,
+                     sizes: Iterable[int],
+                     **times: float) -> None:
+        """
+        Record a call of a batch case changing function.
+
+        Parameters
+        ----------
+        name : str
+            Name of the called function.
+        sizes : Iterable[int]
+            Lengths of the converted strings.
+        times : float
+            Time in seconds spent in each stage by this call.
+        """
+        buckets = Counter(map(_bucket, sizes))
+        with self._lock:
+            self.calls[name] += 1
+            self.sizes.update(buckets)
+            for stage, seconds in times.items():
+                self.times[stage] += seconds
+
+    def merge(self, info: StatsInfo) -> None:
+        """
+        Add statistics recorded elsewhere e.g., in a worker process.
+
+        Parameters
+        ----------
+        info : StatsInfo
+            Statistics to add, as returned by :meth:`info`.
+        """
+        with self._lock:
+            self.calls.update(info.calls)
+            self.sizes.update(info.sizes)
+            for stage, seconds in info.times.items():
+                self.times[stage] = self.times.get(stage, 0.0) + seconds
+
+    def info(self) -> StatsInfo:
+        """
+        Report the recorded statistics.
+
+        Returns
+        -------
+        info : StatsInfo
+            Copies of the calls, stage times and size histogram, and the
+            statistics of the cache or `None` if caching is disabled.
+        """
+        with self._lock:
+            return StatsInfo(dict(self.calls),
+                             dict(self.times),
+                             dict(sorted(self.sizes.items())),
+                             _caching.cache_info())
+
+
+# Statistics recorder of all case changing functions, `None` while disabled
+_stats: Optional[Stats] = None
+
+
+def enable_stats() -> None:
+    """
+    Record statistics of the case changing functions.
+
+    While disabled, the only cost is a single check per call. While enabled,
+    each stage of a conversion is timed separately, which makes conversions
+    noticeably slower. Enabling already enabled statistics resets them.
+    """
+    global _stats
+
+    _stats = Stats()
+
+
+def disable_stats() -> None:
+    """
+    Stop recording statistics of the case changing functions.
+    """
+    global _stats
+
+    _stats = None
+
+
+def reset_stats() -> None:
+    """
+    Drop all recorded statistics.
+    """
+    if _stats is not None:
+        enable_stats()
+
+
+def stats_info() -> Optional[StatsInfo]:
+    """
+    Report the statistics of the case changing functions.
+
+    Returns
+    -------
+    info : StatsInfo | None
+        Calls, cumulative stage times, input size histogram and cache
+        statistics, or `None` if statistics are disabled.
+    """
+    return None if _stats is None else _stats.info()
+
+
+def format_stats(info: StatsInfo) -> str:
+    """
+    Format statistics as human-readable text.
+
+    Parameters
+    ----------
+    info : StatsInfo
+        Statistics as returned by :func:`stats_info`.
+
+    Returns
+    -------
+    text : str
+        Multi-line report of the statistics.
+    """
+    lines = ['calls:']
+    lines += [f'  {name:24} {count:12,d}'
+              for name, count in sorted(info.calls.items())]
+    lines.append('time per stage:')
+    lines += [f'  {stage:24} {seconds:12.6f} s'
+              for stage, seconds in info.times.items()]
+    lines.append('input sizes:')
+    lines += [f'  <= {size:<21,d} {count:12,d}'
+              for size, count in info.sizes.items()]
+    if info.cache is None:
+        lines.append('cache: disabled')
+    else:
+        lines.append('cache: ' + ', '.join(
+                f'{field}={value}'
+                for field, value in info.cache._asdict().items()))
+
+    return '\n'.join(lines)
+
+
+__all__ = [
+        'Stats',
+        'StatsInfo',
+        'disable_stats',
+        'enable_stats',
+        'format_stats',
+        'reset_stats',
+        'stats_info',
+]
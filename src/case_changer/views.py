@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Union
+
+from case_changer.changers import _deep_change_case
+from case_changer.changers import camel_case
+from case_changer.changers import snake_case
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+
+def _wrap(value: Any,
+          case_fn: Callable[[str], str],
+          changed: Dict[str, str]) -> Any:
+    """
+    Wrap a value into a view if it is a container.
+
+    Parameters
+    ----------
+    value : Any
+        Value to wrap.
+    case_fn : Callable[[str], str]
+        Case changing function to apply to each key.
+    changed : Dict[str, str]
+        Converted keys shared by all views of the same structure.
+
+    Returns
+    -------
+    value : KeyConvertingView | SequenceView | Any
+        View on :code:`value` if it is a mapping or a list or tuple,
+        :code:`value` itself otherwise.
+    """
+    if isinstance(value, Mapping):
+        return KeyConvertingView(value, case_fn, changed)
+    if isinstance(value, (list, tuple)):
+        return SequenceView(value, case_fn, changed)
+
+    return value
+
+
+class KeyConvertingView(Mapping):
+    """
+    Read-only view on a mapping with the case of its keys changed.
+
+    Keys are converted only once a key is looked up for the first time and
+    nested containers are wrapped into views only once they are accessed. If
+    only a few keys of a large structure are read, this avoids most of the
+    cost of :func:`case_changer.to_snake` and :func:`case_changer.to_camel`.
+
+    Parameters
+    ----------
+    data : Mapping
+        Mapping to provide a view on. Changes to :code:`data` made after the
+        first key lookup are not reflected by the view.
+    case_fn : Callable[[str], str]
+        Case changing function to apply to each key.
+    changed : Dict[str, str], optional
+        Converted keys shared with other views of the same structure.
+    """
+
+    __slots__ = ('_data', '_case_fn', '_changed', '_index', '_children')
+
+    def __init__(self,
+                 data: Mapping,
+                 case_fn: Callable[[str], str],
+                 changed: Optional[Dict[str, str]] = None):
+        self._data = data
+        self._case_fn = case_fn
+        self._changed: Dict[str, str] = {} if changed is None else changed
+        self._index: Optional[Dict[Hashable, Hashable]] = None
+        self._children: Dict[Hashable, Any] = {}
+
+    def _build_index(self) -> Dict[Hashable, Hashable]:
+        # map each converted key onto its original key
+        changed = self._changed
+        case_fn = self._case_fn
+        index = {}
+        for key in self._data:
+            if type(key) is str:
+                converted = changed.get(key)
+                if converted is None:
+                    converted = changed[key] = case_fn(key)
+                index[converted] = key
+            else:
+                index[key] = key
+        self._index = index
+
+        return index
+
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            return self._children[key]
+        except KeyError:
+            pass
+
+        index = self._index
+        if index is None:
+            index = self._build_index()
+
+        raw = self._data[index[key]]
+        value = _wrap(raw, self._case_fn, self._changed)
+        if value is not raw:
+            self._children[key] = value
+
+        return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        index = self._index
+        if index is None:
+            index = self._build_index()
+
+        return key in index
+
+    def __iter__(self) -> Iterator[Hashable]:
+        index = self._index
+        if index is None:
+            index = self._build_index()
+
+        return iter(index)
+
+    def __len__(self) -> int:
+        index = self._index
+        if index is None:
+            index = self._build_index()
+
+        return len(index)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._data!r})'
+
+    def to_dict(self) -> dict:
+        """
+        Convert the viewed mapping eagerly.
+
+        Returns
+        -------
+        converted : dict
+            Deep copy of the viewed mapping with the case of all keys changed,
+            like :func:`case_changer.to_snake` or :func:`case_changer.to_camel`.
+        """
+        return _deep_change_case(self._data, self._case_fn)
+
+
+class SequenceView(Sequence):
+    """
+    Read-only view on a list or tuple wrapping its containers into views.
+
+    Parameters
+    ----------
+    data : list | tuple
+        Sequence to provide a view on.
+    case_fn : Callable[[str], str]
+        Case changing function to apply to the keys of nested mappings.
+    changed : Dict[str, str], optional
+        Converted keys shared with other views of the same structure.
+    """
+
+    __slots__ = ('_data', '_case_fn', '_changed')
+
+    def __init__(self,
+                 data: Union[list, tuple],
+                 case_fn: Callable[[str], str],
+                 changed: Optional[Dict[str, str]] = None):
+        self._data = data
+        self._case_fn = case_fn
+        self._changed: Dict[str, str] = {} if changed is None else changed
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return SequenceView(self._data[idx], self._case_fn, self._changed)
+
+        return _wrap(self._data[idx], self._case_fn, self._changed)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._data!r})'
+
+
+def view(data: Union[Mapping, list, tuple],
+         case_fn: Callable[[str], str]) -> Union[KeyConvertingView,
+                                                 SequenceView]:
+    """
+    Create a lazy view on a structure with the case of its keys changed.
+
+    Parameters
+    ----------
+    data : Mapping | list | tuple
+        Possibly nested structure to provide a view on.
+    case_fn : Callable[[str], str]
+        Case changing function to apply to each key.
+
+    Returns
+    -------
+    view : KeyConvertingView | SequenceView
+        Read-only view on :code:`data`.
+
+    Raises
+    ------
+    TypeError
+        If :code:`data` is neither a mapping nor a list or tuple.
+    """
+    wrapped = _wrap(data, case_fn, {})
+    if wrapped is data:
+        raise TypeError(f'Cannot create view on {type(data).__name__}, must '
+                        f'be a mapping, list, or tuple.')
+
+    return wrapped
+
+
+def camel_view(data: Union[Mapping, list, tuple]) -> Union[KeyConvertingView,
+                                                           SequenceView]:
+    """
+    Create a lazy view on a structure with its keys in camelCase.
+
+    Parameters
+    ----------
+    data : Mapping | list | tuple
+        Possibly nested structure to provide a view on.
+
+    Returns
+    -------
+    view : KeyConvertingView | SequenceView
+        Read-only view on :code:`data`, see :func:`view`.
+    """
+    return view(data, camel_case)
+
+
+def snake_view(data: Union[Mapping, list, tuple]) -> Union[KeyConvertingView,
+                                                           SequenceView]:
+    """
+    Create a lazy view on a structure with its keys in snake_case.
+
+    Parameters
+    ----------
+    data : Mapping | list | tuple
+        Possibly nested structure to provide a view on.
+
+    Returns
+    -------
+    view : KeyConvertingView | SequenceView
+        Read-only view on :code:`data`, see :func:`view`.
+    """
+    return view(data, snake_case)
+
+
+__all__ = [
+        'KeyConvertingView',
+        'SequenceView',
+        'camel_view',
+        'snake_view',
+        'view',
+]
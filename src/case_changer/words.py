@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+from array import array
+from typing import Callable, Collection, Dict, Iterable, Iterator, List, Optional
+
+from case_changer import changers as _changers
+from case_changer.changers import _CASES
+from case_changer.changers import _word_offsets
+from case_changer.changers import get_case
+
+__author__ = 'Philipp Tempel'
+__email__ = 'p.tempel@tudelft.nl'
+
+
+def _render(source: str,
+            words: Collection[str],
+            convert: Callable[[str], str]) -> str:
+    """
+    Render the words of a string like a case changing function would.
+
+    Parameters
+    ----------
+    source : str
+        Original string the words were obtained from.
+    words : Collection[str]
+        Words of :code:`source` as found by the current tokenizer, iterated
+        only if they are rendered.
+    convert : Callable[[str], str]
+        Case changing function created by
+        :func:`case_changer.changers.make_converter`.
+
+    Returns
+    -------
+    s : str
+        Transformed string, or :code:`source` if it does not contain any
+        words or is already in the case.
+    """
+    is_canonical = convert.is_canonical
+    if not words or is_canonical is not None and is_canonical(source):
+        return source
+
+    return convert.join(words)
+
+
+def _render_all(source: str,
+                words: Collection[str],
+                cases: Optional[Iterable[str]]) -> Dict[str, str]:
+    """
+    Render the words of a string in several cases, see :func:`_render`.
+
+    Returns
+    -------
+    rendered : Dict[str, str]
+        Transformed strings keyed by the name of their case changing
+        function, in the order of :code:`cases` or of all known cases.
+    """
+    rendered = {}
+    for case in map(get_case, _CASES if cases is None else cases):
+        convert = case.convert
+        is_canonical = convert.is_canonical
+        rendered[case.name] = (
+                source if not words or is_canonical is not None
+                and is_canonical(source) else convert.join(words))
+
+    return rendered
+
+
+class Words:
+    """
+    Words of a string, tokenized once and renderable into any case.
+
+    Tokenizing a string is the expensive part of changing its case. If the
+    same string is needed in several cases, tokenize it once with
+    :func:`tokenize` and render each case from the returned object.
+
+    Parameters
+    ----------
+    source : str
+        Original string the words were obtained from.
+    words : Iterable[str]
+        Words of :code:`source` in their original case.
+
+    Examples
+    --------
+    >>> words = tokenize('XMLHttpRequest')
+    >>> words.render('snake')
+    'xml_http_request'
+    >>> words.render_all(('camel', 'constant'))
+    {'camel_case': 'xmlHttpRequest', 'constant_case': 'XML_HTTP_REQUEST'}
+    """
+
+    __slots__ = ('source', 'words')
+
+    def __init__(self, source: str, words: Iterable[str]):
+        self.source: str = source
+        self.words: List[str] = list(words)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.words)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __eq__(self, other):
+        if not isinstance(other, Words):
+            return NotImplemented
+
+        return self.source == other.source and self.words == other.words
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.source!r}, {self.words!r})'
+
+    def render(self, case: str) -> str:
+        """
+        Render the words in the given case.
+
+        Parameters
+        ----------
+        case : str
+            Name of the case with or without the trailing :code:`_case` e.g.,
+            :code:`snake` or :code:`snake_case`.
+
+        Returns
+        -------
+        s : str
+            Transformed string. Like the case changing functions, returns the
+            original string if it does not contain any words.
+        """
+        return _render(self.source, self.words, get_case(case).convert)
+
+    def render_all(self,
+                   cases: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Render the words in several cases at once.
+
+        Parameters
+        ----------
+        cases : Iterable[str], optional
+            Names of the cases to render, see :meth:`render`. Defaults to all
+            known cases.
+
+        Returns
+        -------
+        rendered : Dict[str, str]
+            Transformed strings keyed by the name of their case changing
+            function, in the order of :code:`cases`.
+        """
+        return _render_all(self.source, self.words, cases)
+
+
+class Tokens:
+    """
+    Words of a string stored compactly as offsets into the string.
+
+    Behaves like :class:`Words` but holds a single array of offsets instead
+    of a list of word strings, so keeping many tokenized strings around e.g.,
+    a large batch waiting to be rendered, takes a fraction of the memory and
+    of the objects. The words are sliced from the source only when rendered,
+    and fed to the transforms of the case one at a time.
+
+    Parameters
+    ----------
+    source : str
+        Original string the words were obtained from.
+    offsets : Iterable[int]
+        Start and end offsets of every word of :code:`source` in turn.
+
+    Examples
+    --------
+    >>> tokens = tokenize_compact('XMLHttpRequest')
+    >>> tokens.offsets
+    array('I', [0, 3, 3, 7, 7, 14])
+    >>> tokens.render('snake')
+    'xml_http_request'
+    """
+
+    __slots__ = ('source', 'offsets')
+
+    def __init__(self, source: str, offsets: Iterable[int]):
+        self.source: str = source
+        self.offsets: array = (offsets if isinstance(offsets, array)
+                               else array('I', offsets))
+
+    def __iter__(self) -> Iterator[str]:
+        bounds = iter(self.offsets)
+        return (self.source[start:end] for start, end in zip(bounds, bounds))
+
+    def __len__(self) -> int:
+        return len(self.offsets) // 2
+
+    def __eq__(self, other):
+        if not isinstance(other, Tokens):
+            return NotImplemented
+
+        return self.source == other.source and self.offsets == other.offsets
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.source!r}, {self.offsets!r})'
+
+    @property
+    def words(self) -> List[str]:
+        """
+        Words of the source in their original case.
+        """
+        return list(self)
+
+    def render(self, case: str) -> str:
+        """
+        Render the words in the given case, see :meth:`Words.render`.
+        """
+        return _render(self.source, self, get_case(case).convert)
+
+    def render_all(self,
+                   cases: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Render the words in several cases at once, see
+        :meth:`Words.render_all`.
+        """
+        return _render_all(self.source, self, cases)
+
+
+def tokenize(s: str) -> Words:
+    """
+    Tokenize a string into its words.
+
+    Parameters
+    ----------
+    s : str
+        Original string to tokenize.
+
+    Returns
+    -------
+    words : Words
+        Words of :code:`s` which can be rendered into any case.
+    """
+    return Words(s, _changers._split_words(s))
+
+
+def tokenize_compact(s: str) -> Tokens:
+    """
+    Tokenize a string into the offsets of its words.
+
+    Parameters
+    ----------
+    s : str
+        Original string to tokenize.
+
+    Returns
+    -------
+    tokens : Tokens
+        Words of :code:`s` which can be rendered into any case, stored as
+        offsets into :code:`s`.
+    """
+    return Tokens(s, _word_offsets(s))
+
+
+__all__ = [
+        'Tokens',
+        'Words',
+        'tokenize',
+        'tokenize_compact',
+]
@@ -0,0 +1,100 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from case_changer import *
+from case_changer import aio
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+PAYLOAD = [{'userId': i, 'lineItems': [{'itemName': 'a_b', 'Tags': ('xY',)}],
+            'ownerUser': {'firstName': {'deepKey': [i]}}}
+           for i in range(500)]
+
+
+async def collect(source):
+    return [item async for item in source]
+
+
+async def agen(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.parametrize('chunk_size', (1, 3, 1024))
+def test_aconvert(chunk_size: int):
+    strings = [f'fooBar{i}' for i in range(10)]
+
+    assert asyncio.run(collect(aconvert(
+            snake_case, strings, chunk_size=chunk_size))) == list(
+            map(snake_case, strings))
+
+
+def test_aconvert_async_source():
+    assert asyncio.run(collect(aconvert(
+            to_camel, agen(PAYLOAD), chunk_size=7))) == list(
+            map(to_camel, PAYLOAD))
+
+
+def test_aconvert_executor():
+    strings = [f'fooBar{i}' for i in range(1000)]
+
+    async def main():
+        with ThreadPoolExecutor(2) as executor:
+            return await collect(aconvert(snake_case, strings, chunk_size=300,
+                                          executor=executor,
+                                          executor_threshold=200))
+
+    assert asyncio.run(main()) == list(map(snake_case, strings))
+
+
+def test_aconvert_chunk_size():
+    with pytest.raises(ValueError):
+        asyncio.run(collect(aconvert(snake_case, ['a'], chunk_size=0)))
+
+
+@pytest.mark.parametrize('chunk_size', (1, 10, 10000))
+def test_ato_case(chunk_size: int):
+    assert asyncio.run(ato_snake(PAYLOAD, chunk_size=chunk_size)) == to_snake(
+            PAYLOAD)
+    assert asyncio.run(ato_camel(PAYLOAD, chunk_size=chunk_size)) == to_camel(
+            PAYLOAD)
+
+
+@pytest.mark.parametrize('value', ('fooBar', 1, None, [], {}))
+def test_ato_case_scalar(value):
+    assert asyncio.run(ato_snake(value)) == to_snake(value)
+
+
+def test_ato_case_executor():
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            return await ato_snake(PAYLOAD, chunk_size=50, executor=executor)
+
+    assert asyncio.run(main()) == to_snake(PAYLOAD)
+
+
+def test_ato_case_yields():
+    # other tasks run while a large structure is converted
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        converted = await aio.ato_snake(PAYLOAD, chunk_size=100)
+        task.cancel()
+        return converted
+
+    assert asyncio.run(main()) == to_snake(PAYLOAD)
+    assert len(ticks) > 10
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,120 @@
+import pytest
+
+from case_changer import *
+from case_changer import batch
+from case_changer import changers
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+CASES = (
+        'camel_case',
+        'capital_case',
+        'constant_case',
+        'dot_case',
+        'header_case',
+        'no_case',
+        'param_case',
+        'pascal_case',
+        'path_case',
+        'sentence_case',
+        'snake_case',
+)
+
+STRINGS = (
+        "",
+        "test",
+        "TEST",
+        "test string",
+        "Test String",
+        "TestV2",
+        "_foo_bar_",
+        "  test  ",
+        "___",
+        "anHTMLTag",
+        "XMLHttpRequest",
+        "ID123String",
+        "version 1.21.0",
+        "version 0..78..9",
+        "CONSTANT_CASE ",
+        '"quotes"',
+        "İstanbul",
+        "straſeBahn",
+)
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_many(case: str):
+    many = getattr(batch, f'{case}_many')
+
+    assert many(STRINGS) == [getattr(changers, case)(s) for s in STRINGS]
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_many_single(case: str):
+    many = getattr(batch, f'{case}_many')
+
+    for s in STRINGS:
+        assert many([s]) == [getattr(changers, case)(s)]
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_many_ascii(case: str):
+    many = getattr(batch, f'{case}_many')
+    strings = [s for s in STRINGS if s.isascii()]
+
+    assert many(strings) == [getattr(changers, case)(s) for s in strings]
+
+
+def test_many_ascii_registered_case():
+    train = register_case('train', '-', str.capitalize)
+    try:
+        assert train.many(['fooBar', 'baz qux', '']) == [
+                'Foo-Bar', 'Baz-Qux', '']
+    finally:
+        unregister_case('train')
+
+
+def test_many_empty():
+    assert snake_case_many([]) == []
+
+
+def test_many_iterable():
+    assert snake_case_many(s for s in ('fooBar', 'BazQux')) == [
+            'foo_bar', 'baz_qux']
+
+
+def test_many_sentinel():
+    strings = ['foo\x1eBar', 'bazQux', '\x1e']
+
+    assert snake_case_many(strings) == list(map(snake_case, strings))
+    assert camel_case_many(strings) == list(map(camel_case, strings))
+
+
+def test_many_sentinel_registered_case():
+    train = register_case('train', '-', str.capitalize)
+    try:
+        assert train.many(['foo\x1eBar', 'bazQux']) == ['Foo-Bar', 'Baz-Qux']
+        assert train.many([b'\x1ex_y']) == [b'X-Y']
+    finally:
+        unregister_case('train')
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_many_bytes(case: str):
+    many = getattr(batch, f'{case}_many')
+    strings = [s.encode() for s in STRINGS if s.isascii()]
+
+    assert many(strings) == [getattr(changers, case)(s) for s in strings]
+    assert many(map(bytearray, strings)) == many(strings)
+
+
+def test_many_bytes_sentinel():
+    strings = [b'foo\x1eBar', b'bazQux', b'\x1e']
+
+    assert snake_case_many(strings) == list(map(snake_case, strings))
+    assert camel_case_many(strings) == list(map(camel_case, strings))
+
+
+if __name__ == "__main__":
+    pytest.main()
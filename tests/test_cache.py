@@ -0,0 +1,75 @@
+import pytest
+
+from case_changer import *
+from case_changer.cache import LRUCache
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+
+@pytest.fixture
+def cache():
+    enable_cache(maxsize=2)
+    yield
+    disable_cache()
+
+
+def test_lru_cache_evicts_least_recently_used():
+    lru = LRUCache(2)
+    lru.put('a', 1)
+    lru.put('b', 2)
+    assert lru.get('a') == 1
+    lru.put('c', 3)
+
+    assert 'a' in lru
+    assert 'b' not in lru
+    assert lru.get('b') is None
+    assert lru.info() == (1, 1, 1, 2, 2)
+
+
+def test_lru_cache_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_cache_disabled():
+    assert cache_info() is None
+    assert snake_case('TestString') == 'test_string'
+    assert cache_info() is None
+
+
+def test_cache_hits_and_misses(cache):
+    assert snake_case('TestString') == 'test_string'
+    assert snake_case('TestString') == 'test_string'
+    assert camel_case('TestString') == 'testString'
+
+    info = cache_info()
+    assert (info.hits, info.misses, info.evictions) == (1, 2, 0)
+    assert (info.maxsize, info.currsize) == (2, 2)
+
+
+def test_cache_evictions(cache):
+    assert snake_case('a b') == 'a_b'
+    assert snake_case('c d') == 'c_d'
+    assert snake_case('e f') == 'e_f'
+
+    assert cache_info().evictions == 1
+    assert cache_info().currsize == 2
+
+
+def test_cache_converters(cache):
+    assert to_snake({'fooBar': 1}) == {'foo_bar': 1}
+    assert to_snake({'fooBar': 2}) == {'foo_bar': 2}
+
+    assert cache_info().hits == 1
+
+
+def test_clear_cache(cache):
+    snake_case('TestString')
+    clear_cache()
+
+    assert cache_info() == (0, 0, 0, 2, 0)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,11 +1,24 @@
+import random
+from collections import OrderedDict
+
 import pytest
 
 from case_changer import *
+from case_changer import changers
 
 __author__ = 'Philipp Tempel'
 __email__ = 'python@philipptempel.me'
 
 
+@pytest.fixture(autouse=True, params=('regex', 'scan'))
+def tokenizer(request):
+    # run every test case against every tokenizer
+    previous = get_tokenizer()
+    set_tokenizer(request.param)
+    yield request.param
+    set_tokenizer(previous)
+
+
 @pytest.mark.parametrize(
         ('inpt', 'expected'),
         (
@@ -219,5 +232,350 @@ def test_snake_case(inpt: str, expected: str):
     assert snake_case(inpt) == expected
 
 
+@pytest.mark.parametrize(
+        ('inpt', 'expected'),
+        (
+                ("", ""),
+                ("___", "___"),
+                ("test string", "Test-String"),
+                ("XMLHttpRequest", "Xml-Http-Request"),
+                ("version 1.2.10", "Version-1-2-10"),
+        )
+)
+def test_make_converter(inpt: str, expected: str):
+    train_case = changers.make_converter('-', str.capitalize)
+
+    assert train_case(inpt) == expected
+
+
+def test_make_converter_first_and_rest():
+    ada_case = changers.make_converter('_', str.upper, str.capitalize)
+
+    assert ada_case('some identifier name') == 'SOME_Identifier_Name'
+
+
+def test_make_converter_patterns():
+    # only split at underscores, keep everything else
+    convert = changers.make_converter('-', str.lower, split_patterns=(),
+                                      strip_pattern=r'_+')
+
+    assert convert('__FooBar_Baz.Qux') == 'foobar-baz.qux'
+
+
+@pytest.mark.parametrize(
+        ('inpt', 'expected'),
+        (
+                ("fooBar", "foo_bar"),
+                (1, 1),
+                (None, None),
+                (["fooBar", 1], ["foo_bar", 1]),
+                (("fooBar", "BazQux"), ("foo_bar", "baz_qux")),
+                ({"fooBar", "BazQux"}, {"foo_bar", "baz_qux"}),
+                ({"fooBar": "BazQux"}, {"foo_bar": "BazQux"}),
+                ({1: "fooBar"}, {1: "fooBar"}),
+                ({"fooBar": {"BazQux": 1}}, {"foo_bar": {"baz_qux": 1}}),
+                ({"fooBar": [{"BazQux": 1}, "BazQux"]},
+                 {"foo_bar": [{"baz_qux": 1}, "BazQux"]}),
+                ({"fooBar": ({"BazQux": 1},)}, {"foo_bar": ({"baz_qux": 1},)}),
+                ({"fooBar": {("BazQux",)}}, {"foo_bar": {("BazQux",)}}),
+                ([{"fooBar": [[{"BazQux": []}]]}],
+                 [{"foo_bar": [[{"baz_qux": []}]]}]),
+        )
+)
+def test_to_snake(inpt, expected):
+    assert to_snake(inpt) == expected
+
+
+def test_to_camel_ordered_dict():
+    converted = to_camel(OrderedDict((("foo_bar", 1), ("baz_qux", 2))))
+
+    assert type(converted) is OrderedDict
+    assert list(converted.items()) == [("fooBar", 1), ("bazQux", 2)]
+
+
+def test_to_camel_deep():
+    inpt = leaf = {}
+    for _ in range(100000):
+        leaf["next_item"] = [{}]
+        leaf = leaf["next_item"][0]
+
+    converted = to_camel(inpt)
+    for _ in range(100000):
+        converted = converted["nextItem"][0]
+    assert converted == {}
+
+
+@pytest.mark.parametrize(
+        'records',
+        (
+                [{"fooBar": i, "BazQux": [{"quuxCorge": i}]} for i in range(5)],
+                [{"fooBar": 1, "foo_bar": 2}, {"fooBar": 3, "foo_bar": 4}],
+                [{1: "fooBar", "bazQux": 2}, {True: "fooBar", "bazQux": 2}],
+                [OrderedDict((("fooBar", i),)) for i in range(3)]
+                + [{"fooBar": 3}],
+                [{f"fooBar{i % 300}": i} for i in range(600)],
+        )
+)
+def test_to_snake_records(records):
+    # records of the same shape give the same result as converting each alone
+    converted = to_snake(records)
+
+    assert converted == [to_snake(record) for record in records]
+    for record, expected in zip(converted, map(to_snake, records)):
+        assert type(record) is type(expected)
+        assert list(record.items()) == list(expected.items())
+        assert list(map(type, record)) == list(map(type, expected))
+
+
+def test_to_snake_does_not_modify_input():
+    inpt = {"fooBar": [{"BazQux": (1, {"quuxCorge": 2})}]}
+
+    to_snake(inpt)
+
+    assert inpt == {"fooBar": [{"BazQux": (1, {"quuxCorge": 2})}]}
+
+
+@pytest.mark.parametrize(
+        'inpt',
+        (
+                "",
+                "   ",
+                "a",
+                "A",
+                "ABC",
+                "ABc",
+                "aBC",
+                "a1B",
+                "A1b",
+                "AB1c",
+                "XMLHttpRequest",
+                "IQueryAArgs",
+                "ID123String",
+                "__init__",
+                "\0foo\0Bar\0",
+                "\u0130stanbul",
+                "stra\u017feBahn",
+                "10\u212aOhm",
+                "\u00e9t\u00e9Caf\u00e9",
+                "\u0391\u03b2\u0393",
+        )
+)
+def test_tokenizers_agree(inpt: str):
+    assert changers._scan_words(inpt) == changers._regex_words(inpt)
+    assert changers._pattern_words(inpt) == changers._regex_words(inpt)
+
+
+def test_tokenizers_agree_random():
+    alphabet = 'aZ09 _-.\0\u0130\u0131\u017f\u212a\u00e9\u00c9'
+    rng = random.Random(0)
+    for _ in range(5000):
+        inpt = ''.join(rng.choice(alphabet)
+                       for _ in range(rng.randrange(12)))
+        assert changers._scan_words(inpt) == changers._regex_words(inpt)
+
+
+def test_ascii_fast_path_random():
+    alphabet = 'abZY019 _-.\0'
+    rng = random.Random(0)
+    for _ in range(5000):
+        inpt = ''.join(rng.choice(alphabet)
+                       for _ in range(rng.randrange(16)))
+        assert changers._regex_words(inpt) == changers._pattern_words(inpt)
+
+
+@pytest.mark.parametrize('case', tuple(changers._CASES))
+@pytest.mark.parametrize('inpt', (
+        b"",
+        b"test",
+        b"TestV2",
+        b"XMLHttpRequest",
+        b"version 1.2.10",
+        b"__init__",
+))
+def test_bytes(case: str, inpt: bytes):
+    fn = getattr(changers, case)
+    expected = fn(inpt.decode()).encode()
+
+    assert fn(inpt) == expected
+    assert fn(bytearray(inpt)) == expected
+    assert fn(memoryview(inpt)) == expected
+    assert type(fn(bytearray(inpt))) is bytes
+
+
+def test_bytes_non_ascii():
+    assert snake_case('caf\u00e9Bar'.encode()) == b'caf_bar'
+    assert snake_case(b'foo\xffBar') == b'foo_bar'
+
+
+def test_bytes_random():
+    alphabet = 'abZY019 _-.\0'
+    rng = random.Random(0)
+    for _ in range(2000):
+        inpt = ''.join(rng.choice(alphabet)
+                       for _ in range(rng.randrange(16)))
+        assert snake_case(inpt.encode()) == snake_case(inpt).encode()
+        assert pascal_case(inpt.encode()) == pascal_case(inpt).encode()
+
+
+def test_make_converter_bytes():
+    train_case = make_converter('-', str.capitalize)
+    upper_dot = make_converter('.', str.upper,
+                               split_patterns=changers.DEFAULT_SPLIT_REGEXP,
+                               strip_pattern=changers.DEFAULT_STRIP_REGEXP)
+    title = make_converter(' ', str.title)
+
+    assert train_case(b'xml_http') == b'Xml-Http'
+    assert upper_dot(bytearray(b'fooBar baz')) == b'FOO.BAR.BAZ'
+    assert title(b'foo_bar') == b'Foo Bar'
+
+
+@pytest.mark.parametrize(
+        "inpt,expected",
+        (
+                ("", None),
+                ("fooBar", "camel_case"),
+                ("fooBarV2", "camel_case"),
+                ("Foo Bar", "capital_case"),
+                ("FOO_BAR", "constant_case"),
+                ("foo.bar", "dot_case"),
+                ("Foo-Bar", "header_case"),
+                ("foo bar", "no_case"),
+                ("foo-bar", "param_case"),
+                ("FooBar", "pascal_case"),
+                ("foo/bar", "path_case"),
+                ("Foo bar", "sentence_case"),
+                ("foo_bar", "snake_case"),
+                ("foo", "camel_case"),
+                (b"FOO_BAR_2", "constant_case"),
+                ("foo_Bar", None),
+                ("foo__bar", None),
+                ("foo-bar_baz", None),
+                ("XMLHttp", None),
+                ("9", "camel_case"),
+                ("0a", "camel_case"),
+                ("9bb", "camel_case"),
+                ("9Zb", "camel_case"),
+                ("9aZ", "camel_case"),
+                ("0_1", "camel_case"),
+                ("aYYa", "camel_case"),
+                ("YYa", "pascal_case"),
+                ("XmlHTTPRequest", None),
+                ("_", None),
+                (" foo", None),
+                ("caf\u00e9", None),
+                (b"foo\xff", None),
+        )
+)
+def test_detect_case(inpt, expected):
+    assert detect_case(inpt) == expected
+
+
+def test_detect_case_random():
+    alphabet = 'abZY019 _-./'
+    rng = random.Random(0)
+    for _ in range(5000):
+        inpt = ''.join(rng.choice(alphabet)
+                       for _ in range(rng.randrange(12)))
+        # strings without words are in no case
+        expected = None
+        if any(c.isalnum() for c in inpt):
+            expected = next((case for case in changers._CASES
+                             if case in changers._CANONICAL_REGEXPS
+                             and getattr(changers, case)(inpt) == inpt),
+                            None)
+        assert detect_case(inpt) == expected
+
+
+@pytest.mark.parametrize('case', tuple(changers._CASES))
+def test_canonical_round_trip(case: str):
+    fn = getattr(changers, case)
+    # the same case without the shortcut for canonical strings
+    delimiter, transform = changers._CASES[case]
+    if not isinstance(transform, tuple):
+        transform = (transform, transform)
+    general = make_converter(delimiter, *transform)
+
+    alphabet = 'abZY019 _-./'
+    rng = random.Random(0)
+    for _ in range(2000):
+        inpt = ''.join(rng.choice(alphabet)
+                       for _ in range(rng.randrange(12)))
+        converted = fn(inpt)
+        assert converted == general(inpt)
+        assert fn(converted) == general(converted)
+        assert fn(converted.encode()) == general(converted).encode()
+
+
+@pytest.mark.parametrize('case', tuple(changers._CASES))
+def test_canonical_unchanged(case: str):
+    fn = getattr(changers, case)
+    inpt = fn('some_Value 2 of XMLHttp')
+
+    assert fn(inpt) is inpt
+
+
+@pytest.fixture
+def train_case():
+    case = register_case('train', '-', str.capitalize)
+    yield case
+    unregister_case('train')
+
+
+def test_register_case(train_case: Case):
+    assert train_case.name == 'train_case'
+    assert train_case.convert('fooBar baz') == 'Foo-Bar-Baz'
+    assert train_case.convert(b'fooBar baz') == b'Foo-Bar-Baz'
+    assert train_case.many(['fooBar', 'x_y']) == ['Foo-Bar', 'X-Y']
+    assert train_case.to_case({'fooBar': [{'x_y': 'a_b'}]}) == {
+            'Foo-Bar': [{'X-Y': 'a_b'}]}
+    assert get_case('train_case') is train_case
+    assert changers.train_case is train_case.convert
+    assert tokenize('fooBar').render('train') == 'Foo-Bar'
+
+
+def test_register_case_numbers():
+    case = register_case('hump', '', str.lower, str.upper, numbers=True)
+    try:
+        assert case.convert('foo bar 12 baz') == 'fooBAR_12BAZ'
+        assert case.many(['foo bar 12 baz']) == ['fooBAR_12BAZ']
+    finally:
+        unregister_case('hump')
+
+
+@pytest.mark.parametrize('name', ('snake', 'snake_case', 'not-an-identifier',
+                                  'json', 'csv_case', 'rewrite', 'rename'))
+def test_register_case_invalid(name: str):
+    with pytest.raises(ValueError):
+        register_case(name, '_', str.lower)
+
+
+def test_unregister_case(train_case: Case):
+    with pytest.raises(ValueError):
+        unregister_case('snake')
+
+    unregister_case('train')
+    with pytest.raises(ValueError):
+        get_case('train')
+    with pytest.raises(AttributeError):
+        changers.train_case
+
+    register_case('train', '-', str.capitalize)
+
+
+@pytest.mark.parametrize('case', changers._CASES)
+def test_get_case(case: str):
+    resolved = get_case(case)
+
+    assert resolved.convert is getattr(changers, case)
+    assert resolved.many(['fooBar 12']) == [resolved.convert('fooBar 12')]
+    assert resolved.to_case({'fooBar 12': 'fooBar'}) == {
+            resolved.convert('fooBar 12'): 'fooBar'}
+
+
+def test_set_tokenizer_unknown():
+    with pytest.raises(ValueError):
+        set_tokenizer('unknown')
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,7 +1,13 @@
+import io
+
 import click.testing
 import pytest
 
+from case_changer import changers
 from case_changer import cli
+from case_changer import disable_stats
+from case_changer import enable_stats
+from case_changer import stats_info
 
 __author__ = 'Philipp Tempel'
 __email__ = 'python@philipptempel.me'
@@ -264,5 +270,200 @@ def test_snake_case(inpt: str, expected: str):
     assert result.output == f'{expected}\n'
 
 
+def test_case_commands():
+    assert sorted(cli._CASE_COMMANDS.values()) == sorted(changers._CASES)
+    assert set(cli._CASE_COMMANDS) <= set(cli.cli.list_commands(None))
+
+
+def test_main(capsys):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(['snake', 'fooBar'])
+
+    assert exc.value.code == 0
+    assert capsys.readouterr().out == 'foo_bar\n'
+
+
+def test_stdin():
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['snake', '-'],
+                           input='fooBar\nBaz Qux\r\n\nversion 1.2.10')
+
+    assert result.exit_code == 0
+    assert result.output == 'foo_bar\nbaz_qux\n\nversion_1_2_10\n'
+
+
+def test_input_file(tmp_path):
+    path = tmp_path / 'strings.txt'
+    path.write_text('fooBar\nBazQux\n')
+
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['camel', 'test string', '--input',
+                                     str(path)])
+
+    assert result.exit_code == 0
+    assert result.output == 'testString\nfooBar\nbazQux\n'
+
+
+def test_null_separated():
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['constant', '-0', '-i', '-'],
+                           input='fooBar\0Baz\nQux\0')
+
+    assert result.exit_code == 0
+    assert result.output == 'FOO_BAR\0BAZ_QUX\0'
+
+
+def test_read_records_blocks():
+    stream = io.BytesIO('fooBar\nbäzQux\n\nlast'.encode())
+
+    records = [r for rs in cli._read_records(stream, '\n', block_size=3)
+               for r in rs]
+
+    assert records == ['fooBar', 'bäzQux', '', 'last']
+
+
+@pytest.mark.parametrize('block_size', (1, 2, 3, 4, 5, 1 << 20))
+@pytest.mark.parametrize(('data', 'expected'), (
+        (b'a\r\nb\r\n---\r\nc\r\n', ['a', 'b', '---', 'c']),
+        (b'a\r\nb\r\n---\r\nc', ['a', 'b', '---', 'c']),
+        (b'a\r\n\r\nb\r\r\n', ['a', '', 'b\r']),
+        (b'a\rb\n', ['a\rb']),
+))
+def test_read_records_crlf(data: bytes, expected: list, block_size: int):
+    stream = io.BytesIO(data)
+
+    records = [r for rs in cli._read_records(stream, '\n', block_size)
+               for r in rs]
+
+    assert records == expected
+
+
+@pytest.mark.parametrize('block_size', (1, 2, 3, 1 << 20))
+def test_read_records_null_keeps_carriage_return(block_size: int):
+    stream = io.BytesIO(b'x\r\0--\r')
+
+    records = [r for rs in cli._read_records(stream, '\0', block_size)
+               for r in rs]
+
+    assert records == ['x\r', '--\r']
+
+
+def test_crlf_end_to_end():
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['snake', '-'],
+                           input=b'fooBar\r\n---\r\n')
+
+    assert result.exit_code == 0
+    assert result.stdout_bytes == b'foo_bar\n---\n'
+
+
+def test_null_separated_carriage_return():
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['snake', '-0', '-'],
+                           input=b'x\0--\r')
+
+    assert result.exit_code == 0
+    assert result.stdout_bytes == b'x\0--\r\0'
+
+
+@pytest.mark.parametrize('jobs', (1, 2))
+def test_convert_blocks(jobs: int):
+    blocks = [[f'fooBar{i}', f'BazQux {i}'] for i in range(20)]
+
+    converted = list(cli._convert_blocks('snake_case', blocks, jobs))
+
+    assert converted == [[f'foo_bar{i}', f'baz_qux_{i}'] for i in range(20)]
+
+
+def test_jobs():
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['snake', '--jobs', '2', '-'],
+                           input='fooBar\nBazQux\n')
+
+    assert result.exit_code == 0
+    assert result.output == 'foo_bar\nbaz_qux\n'
+
+
+def test_json(tmp_path):
+    path = tmp_path / 'export.ndjson'
+    path.write_text('{"user_id": [{"first_name": "a_b"}]}\n{"x_y": 1}\n')
+
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['json', 'camel', str(path)])
+
+    assert result.exit_code == 0
+    assert result.output == (
+            '{"userId": [{"firstName": "a_b"}]}\n{"xY": 1}\n')
+
+
+def test_stats():
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['snake', '--stats', '-'],
+                           input='fooBar\nBazQux\n')
+
+    assert result.exit_code == 0
+    assert result.stdout == 'foo_bar\nbaz_qux\n'
+    assert 'snake_case_many' in result.stderr
+    assert 'split' in result.stderr
+
+
+@pytest.mark.parametrize('jobs', (1, 2))
+def test_convert_blocks_stats(jobs: int):
+    blocks = [[f'fooBar{i}'] for i in range(20)]
+
+    enable_stats()
+    try:
+        list(cli._convert_blocks('snake_case', blocks, jobs))
+        info = stats_info()
+    finally:
+        disable_stats()
+
+    assert info.calls == {'snake_case_many': 20}
+
+
+@pytest.fixture
+def train_case():
+    changers.register_case('train', '-', str.capitalize)
+    yield
+    changers.unregister_case('train')
+
+
+def test_registered_case(train_case):
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['train', 'fooBar', '-i', '-'],
+                           input='baz_qux\n')
+
+    assert 'train' in cli.cli.list_commands(None)
+    assert result.exit_code == 0
+    assert result.output == 'Foo-Bar\nBaz-Qux\n'
+
+
+@pytest.mark.parametrize('jobs', (1, 2))
+def test_registered_case_blocks(train_case, jobs: int):
+    blocks = [[f'fooBar{i}'] for i in range(20)]
+
+    converted = list(cli._convert_blocks('train_case', blocks, jobs))
+
+    assert converted == [[f'Foo-Bar{i}'] for i in range(20)]
+
+
+def test_command_names():
+    # registered cases must not shadow any of the other commands, whose
+    # callbacks unlike those of the case commands are defined in the module
+    commands = {name for name, command in cli.cli.commands.items()
+                if command.callback.__module__ == cli.__name__}
+
+    assert commands == changers._COMMAND_NAMES
+
+
+def test_registered_case_json(train_case):
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['json', 'train'],
+                           input='{"user_id": 1}')
+
+    assert result.exit_code == 0
+    assert result.output == '{"User-Id": 1}'
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,135 @@
+import pytest
+
+from case_changer import *
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+columnar = pytest.importorskip('case_changer.columnar')
+
+STRINGS = ['fooBar', 'BazQux', 'fooBar', 'x_256', '', 'fooBar']
+
+
+def test_numpy_unicode():
+    np = pytest.importorskip('numpy')
+    values = np.array(STRINGS).reshape(2, 3)
+
+    converted = columnar.convert(values, 'snake')
+
+    assert converted.shape == (2, 3)
+    assert converted.dtype.kind == 'U'
+    assert converted.ravel().tolist() == list(map(snake_case, STRINGS))
+
+
+def test_numpy_object():
+    np = pytest.importorskip('numpy')
+    values = np.array(STRINGS + [None, 1], dtype=object)
+
+    converted = columnar.convert(values, 'camel_case')
+
+    assert converted.dtype == object
+    assert converted.tolist() == list(map(camel_case, STRINGS)) + [None, 1]
+
+
+def test_numpy_invalid_dtype():
+    np = pytest.importorskip('numpy')
+
+    with pytest.raises(TypeError):
+        columnar.convert(np.arange(3), 'snake')
+
+
+def test_pandas_series():
+    pd = pytest.importorskip('pandas')
+    values = pd.Series(STRINGS + [None], index=list('abcdefg'), name='keys')
+
+    converted = columnar.convert(values, 'constant')
+
+    assert isinstance(converted, pd.Series)
+    assert converted.name == 'keys'
+    assert converted.index.tolist() == list('abcdefg')
+    assert converted[:-1].tolist() == list(map(constant_case, STRINGS))
+    assert pd.isna(converted.iloc[-1])
+
+
+def test_pandas_missing():
+    pd = pytest.importorskip('pandas')
+    values = pd.Series(['fooBar', None, 1, float('nan'), pd.NA], dtype=object)
+
+    converted = values.case.snake()
+
+    assert converted.dtype == object
+    assert converted[0] == 'foo_bar'
+    assert converted[1] is None
+    assert converted[2] == 1
+    assert converted[3] != converted[3]
+    assert converted[4] is pd.NA
+    assert columnar.convert(pd.Index(['fooBar', None], dtype=object),
+                            'snake').tolist() == ['foo_bar', None]
+
+
+def test_pandas_index():
+    pd = pytest.importorskip('pandas')
+    values = pd.Index(['fooBar', 'BazQux'])
+
+    converted = values.case.param()
+
+    assert isinstance(converted, pd.Index)
+    assert converted.tolist() == ['foo-bar', 'baz-qux']
+
+
+def test_pandas_accessor():
+    pd = pytest.importorskip('pandas')
+    values = pd.Series(STRINGS)
+
+    assert values.case.snake().tolist() == list(map(snake_case, STRINGS))
+    assert values.case.convert('header').tolist() == list(
+            map(header_case, STRINGS))
+
+
+def test_pandas_accessor_registered_case():
+    pd = pytest.importorskip('pandas')
+    values = pd.Series(STRINGS)
+
+    train = register_case('train', '-', str.capitalize)
+    try:
+        assert 'train' in dir(values.case)
+        assert values.case.train().tolist() == list(map(train.convert,
+                                                        STRINGS))
+        assert columnar.convert(values, 'train').tolist() == list(
+                map(train.convert, STRINGS))
+    finally:
+        unregister_case('train')
+
+    with pytest.raises(AttributeError):
+        values.case.train
+
+
+def test_arrow():
+    pa = pytest.importorskip('pyarrow')
+    values = pa.array(STRINGS + [None])
+
+    converted = columnar.convert(values, 'snake')
+
+    assert isinstance(converted, pa.Array)
+    assert converted.type == values.type
+    assert converted.to_pylist() == list(map(snake_case, STRINGS)) + [None]
+
+
+def test_arrow_chunked():
+    pa = pytest.importorskip('pyarrow')
+    values = pa.chunked_array([STRINGS[:3], STRINGS[3:]], type=pa.large_string())
+
+    converted = columnar.convert(values, 'snake')
+
+    assert isinstance(converted, pa.ChunkedArray)
+    assert converted.type == pa.large_string()
+    assert converted.to_pylist() == list(map(snake_case, STRINGS))
+
+
+def test_unsupported():
+    with pytest.raises(TypeError):
+        columnar.convert(STRINGS, 'snake')
+
+
+if __name__ == "__main__":
+    pytest.main()
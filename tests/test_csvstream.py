@@ -0,0 +1,142 @@
+import io
+
+import click.testing
+import pytest
+
+from case_changer import cli
+from case_changer import snake_case
+from case_changer.csvstream import transform_csv
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+CSV = ('User Id,Plan Type,Comment\r\n'
+       '1,FreeTier,"Hello, World"\r\n'
+       '2,ProTier,"multi\nLine"\r\n'
+       '3,FreeTier\r\n')
+
+
+@pytest.mark.parametrize('batch_rows', (1, 2, 4096))
+def test_transform_csv(batch_rows: int):
+    output = io.StringIO()
+    calls = []
+
+    def case_fn(s):
+        calls.append(s)
+        return snake_case(s)
+
+    rows = transform_csv(io.StringIO(CSV, newline=''), output, case_fn,
+                         columns=['Plan Type'], batch_rows=batch_rows)
+
+    assert rows == 3
+    assert output.getvalue() == (
+            'user_id,plan_type,comment\r\n'
+            '1,free_tier,"Hello, World"\r\n'
+            '2,pro_tier,"multi\nLine"\r\n'
+            '3,free_tier\r\n')
+    # every value of a column is converted only once
+    assert calls.count('FreeTier') == 1
+
+
+def test_transform_csv_columns_only():
+    output = io.StringIO()
+
+    transform_csv(io.StringIO(CSV, newline=''), output, snake_case,
+                  header=False, columns=[0, 2])
+
+    assert output.getvalue().splitlines()[:2] == ['User Id,Plan Type,Comment',
+                                                  '1,FreeTier,hello_world']
+
+
+def test_transform_csv_tsv():
+    output = io.StringIO()
+
+    transform_csv(io.StringIO('a B\tcD\nx\tyZ\n'), output, snake_case,
+                  delimiter='\t', lineterminator='\n')
+
+    assert output.getvalue() == 'a_b\tc_d\nx\tyZ\n'
+
+
+@pytest.mark.parametrize('newline', ('\n', '\r\n', '\r'))
+def test_transform_csv_line_terminator(tmp_path, newline: str):
+    path = tmp_path / 'input.csv'
+    path.write_bytes(f'User Id,Plan Type{newline}1,FreeTier{newline}'.encode())
+    out = tmp_path / 'output.csv'
+
+    with open(path, newline='') as source, open(out, 'w', newline='') as target:
+        transform_csv(source, target, snake_case, columns=['Plan Type'])
+
+    assert out.read_bytes() == (
+            f'user_id,plan_type{newline}1,free_tier{newline}'.encode())
+
+
+def test_transform_csv_no_line_terminator():
+    output = io.StringIO()
+
+    transform_csv(io.StringIO('Plan Type'), output, snake_case)
+
+    assert output.getvalue() == 'plan_type\n'
+
+
+def test_transform_csv_empty():
+    output = io.StringIO()
+
+    assert transform_csv(io.StringIO(''), output, snake_case) == 0
+    assert output.getvalue() == ''
+
+
+@pytest.mark.parametrize('column', ('Unknown', -1))
+def test_transform_csv_unknown_column(column):
+    with pytest.raises(ValueError):
+        transform_csv(io.StringIO(CSV), io.StringIO(), snake_case,
+                      columns=[column])
+
+
+def test_transform_csv_batched_writes():
+    writes = []
+    output = io.StringIO()
+    output.write = writes.append
+    lines = ''.join(f'{i},fooBar{i % 3}\n' for i in range(10))
+
+    transform_csv(io.StringIO('Id,Name\n' + lines), output, snake_case,
+                  columns=['Name'], batch_rows=4)
+
+    assert len(writes) == 3
+    assert writes[0].startswith('id,name\n0,foo_bar0\n')
+
+
+def test_cli_csv(tmp_path):
+    path = tmp_path / 'input.csv'
+    path.write_bytes(CSV.encode())
+    out = tmp_path / 'output.csv'
+
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['csv', 'camel', str(path), '-o', str(out),
+                                     '-c', 'Plan Type'])
+
+    assert result.exit_code == 0
+    assert out.read_bytes().decode().splitlines()[:2] == [
+            'userId,planType,comment', '1,freeTier,"Hello, World"']
+
+
+def test_cli_tsv():
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['csv', 'constant', '--tsv', '--no-header',
+                                     '-c', 'Kind'],
+                           input='Id\tKind\n1\tsomeKind\n')
+
+    assert result.exit_code == 0
+    assert result.stdout_bytes == b'Id\tKind\n1\tSOME_KIND\n'
+
+
+def test_cli_csv_unknown_column():
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['csv', 'snake', '-c', 'Nope'],
+                           input='Id\n1\n')
+
+    assert result.exit_code == 2
+    assert 'Nope' in result.output
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,67 @@
+import io
+import json
+
+import pytest
+
+from case_changer import *
+from case_changer.jsonstream import transform_json
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+DOCUMENT = {
+        'user_id': 1,
+        'user_name': 'foo_bar',
+        'tags': ['some_tag', {'tag_name': 'x'}],
+        'quoted "key_name"': {'back\\slash_key': [], 'uni_ключ': True},
+        'last_login': {'ip_address': '127.0.0.1', 'at': None, 'ms': -1.5e3},
+        'empty_object': {},
+        'escaped_keyé_x': '}{][,:"',
+}
+
+
+def transformed(text, case_fn, chunk_size=1 << 16):
+    return ''.join(transform_json(io.StringIO(text), case_fn,
+                                  chunk_size=chunk_size))
+
+
+@pytest.mark.parametrize('chunk_size', (1, 2, 3, 7, 1 << 16))
+@pytest.mark.parametrize('ensure_ascii', (True, False))
+def test_transform_json(chunk_size: int, ensure_ascii: bool):
+    text = json.dumps(DOCUMENT, ensure_ascii=ensure_ascii, indent=2)
+
+    result = transformed(text, camel_case, chunk_size)
+
+    assert json.loads(result) == to_camel(DOCUMENT)
+
+
+def test_transform_json_ndjson():
+    text = '{"foo_bar": 1}\n[{"baz_qux": "a_b"}]\n"a_b"\n'
+
+    assert transformed(text, camel_case) == (
+            '{"fooBar": 1}\n[{"bazQux": "a_b"}]\n"a_b"\n')
+
+
+def test_transform_json_keeps_formatting():
+    text = '{ "fooBar" :\t[1,2] ,"same": "fooBar"}'
+
+    assert transformed(text, snake_case) == (
+            '{ "foo_bar" :\t[1,2] ,"same": "fooBar"}')
+
+
+def test_transform_json_bytes():
+    text = json.dumps(DOCUMENT, ensure_ascii=False).encode()
+
+    result = ''.join(transform_json(io.BytesIO(text), camel_case,
+                                    chunk_size=1))
+
+    assert json.loads(result) == to_camel(DOCUMENT)
+
+
+def test_transform_json_unbalanced():
+    with pytest.raises(ValueError):
+        transformed('{"a": 1}}', camel_case)
+
+
+if __name__ == "__main__":
+    pytest.main()
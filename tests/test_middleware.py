@@ -0,0 +1,316 @@
+import asyncio
+import io
+import json
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+
+from case_changer.middleware import ASGIMiddleware
+from case_changer.middleware import WSGIMiddleware
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+REQUEST = {'userId': 1, 'lastLogin': {'ipAddress': '127.0.0.1'},
+           'tagNames': ['someTag']}
+
+
+def wsgi_echo(content_type='application/json', chunks=1):
+    # echo the request body, or its keys if it was JSON, in several pieces
+    def app(environ, start_response):
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+        body = environ['wsgi.input'].read(length)
+        start_response('200 OK', [('Content-Type', content_type),
+                                  ('Content-Length', str(len(body)))])
+        size = -(-len(body) // chunks)
+        return [body[i:i + size] for i in range(0, len(body), size)]
+
+    return app
+
+
+def wsgi_request(app, body=b'', content_type='application/json', **environ):
+    setup_testing_defaults(environ)
+    environ.update({'REQUEST_METHOD': 'POST',
+                    'CONTENT_TYPE': content_type,
+                    'CONTENT_LENGTH': str(len(body)),
+                    'wsgi.input': io.BytesIO(body)})
+    started = []
+    written = []
+
+    def start_response(*args):
+        started.append(args)
+        return written.append
+
+    result = app(environ, start_response)
+    try:
+        data = b''.join(written + list(result))
+    finally:
+        if hasattr(result, 'close'):
+            result.close()
+
+    return started[0][0], dict(started[0][1]), data
+
+
+def asgi_echo(content_type=b'application/json', chunks=1):
+    async def app(scope, receive, send):
+        body = b''
+        while True:
+            message = await receive()
+            body += message.get('body', b'')
+            if not message.get('more_body', False):
+                break
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', content_type),
+                                (b'content-length', b'%d' % len(body))]})
+        size = max(-(-len(body) // chunks), 1)
+        pieces = [body[i:i + size] for i in range(0, len(body), size)] or [b'']
+        for i, piece in enumerate(pieces):
+            await send({'type': 'http.response.body', 'body': piece,
+                        'more_body': i < len(pieces) - 1})
+
+    return app
+
+
+def asgi_request(app, body=b'', content_type=b'application/json', chunks=1):
+    size = max(-(-len(body) // chunks), 1)
+    messages = [{'type': 'http.request', 'body': body[i:i + size],
+                 'more_body': i + size < len(body)}
+                for i in range(0, len(body), size)] or [
+                       {'type': 'http.request', 'body': b''}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': 'POST', 'path': '/',
+             'headers': [(b'content-type', content_type),
+                         (b'content-length', b'%d' % len(body))]}
+    asyncio.run(app(scope, receive, send))
+
+    return (dict(sent[0]['headers']),
+            b''.join(message['body'] for message in sent[1:]))
+
+
+@pytest.mark.parametrize('buffer_size', (0, 1 << 20))
+@pytest.mark.parametrize('chunks', (1, 3, 1000))
+def test_wsgi(chunks: int, buffer_size: int):
+    keys = []
+    app = WSGIMiddleware(wsgi_echo(chunks=chunks),
+                         request_case=lambda s: keys.append(s) or s.upper(),
+                         buffer_size=buffer_size,
+                         chunk_size=7)
+
+    status, headers, body = wsgi_request(app, json.dumps(REQUEST).encode())
+
+    assert status == '200 OK'
+    assert 'Content-Length' not in headers
+    assert json.loads(body) == {'userid': 1,
+                                'lastlogin': {'ipaddress': '127.0.0.1'},
+                                'tagnames': ['someTag']}
+    assert sorted(keys) == ['ipAddress', 'lastLogin', 'tagNames', 'userId']
+
+
+def test_wsgi_round_trip():
+    app = WSGIMiddleware(wsgi_echo())
+
+    _, _, body = wsgi_request(app, json.dumps(REQUEST).encode())
+
+    assert json.loads(body) == REQUEST
+
+
+def test_wsgi_request_snake_case():
+    seen = []
+
+    def app(environ, start_response):
+        body = environ['wsgi.input'].read(int(environ['CONTENT_LENGTH']))
+        seen.append(json.loads(body))
+        start_response('204 No Content', [])
+        return []
+
+    wsgi_request(WSGIMiddleware(app), json.dumps(REQUEST).encode())
+
+    assert seen == [{'user_id': 1, 'last_login': {'ip_address': '127.0.0.1'},
+                     'tag_names': ['someTag']}]
+
+
+@pytest.mark.parametrize('content_type', ('text/plain', 'application/xml',
+                                          'application/json; charset=latin-1'))
+def test_wsgi_skips_non_json(content_type: str):
+    app = WSGIMiddleware(wsgi_echo(content_type))
+    body = json.dumps(REQUEST).encode()
+
+    _, headers, data = wsgi_request(app, body, content_type)
+
+    assert data == body
+    assert headers['Content-Length'] == str(len(body))
+
+
+def test_wsgi_skips_compressed():
+    app = WSGIMiddleware(wsgi_echo())
+    body = json.dumps(REQUEST).encode()
+
+    _, _, data = wsgi_request(app, body, HTTP_CONTENT_ENCODING='gzip')
+
+    assert json.loads(data) == REQUEST
+
+
+def test_wsgi_problem_json():
+    app = WSGIMiddleware(wsgi_echo('application/problem+json'))
+
+    _, _, data = wsgi_request(app, b'{"error_code": 1}',
+                              'application/problem+json')
+
+    assert data == b'{"errorCode": 1}'
+
+
+@pytest.mark.parametrize('buffer_size', (0, 1 << 20))
+@pytest.mark.parametrize('body', (
+        b'{"e_f": "\\ud800"}',
+        '{"\u00e4_\\ud800": 1}'.encode(),
+        b'{"n_m": [1e400, 0.10000000000000000555, 1.0E2, -0]}',
+))
+def test_wsgi_verbatim(body: bytes, buffer_size: int):
+    # only keys change, literals are kept and lone surrogates do not fail
+    app = WSGIMiddleware(wsgi_echo(), request_case=str.upper,
+                         buffer_size=buffer_size, chunk_size=3)
+
+    status, _, data = wsgi_request(app, body)
+
+    assert status == '200 OK'
+    assert data.split(b':', 1)[1] == body.split(b':', 1)[1]
+    assert json.loads(data).keys() != json.loads(body).keys()
+
+
+def test_wsgi_not_json():
+    app = WSGIMiddleware(wsgi_echo())
+
+    _, _, data = wsgi_request(app, b'{"a_b": 1}]{"c_d": 2}')
+
+    assert data == b'{"a_b": 1}]{"c_d": 2}'
+
+
+def test_wsgi_not_json_streaming():
+    app = WSGIMiddleware(wsgi_echo(chunks=1000), buffer_size=0, chunk_size=2)
+
+    _, _, data = wsgi_request(app, b'{"a_b": 1}]{"c_d": 2}')
+
+    assert data == b'{"aB": 1}]{"c_d": 2}'
+
+
+def test_wsgi_unknown_length():
+    app = WSGIMiddleware(wsgi_echo())
+    body = json.dumps(REQUEST).encode()
+
+    _, _, data = wsgi_request(app, body, CONTENT_LENGTH='',
+                              **{'wsgi.input_terminated': True})
+
+    assert json.loads(data) == REQUEST
+
+
+def test_wsgi_shared_cache_and_report():
+    reports = []
+    app = WSGIMiddleware(wsgi_echo(), report=reports.append)
+
+    for _ in range(3):
+        wsgi_request(app, json.dumps(REQUEST).encode())
+
+    assert len(reports) == 3
+    assert all(seconds >= 0 for seconds in reports)
+    assert app.request_cache.info().misses == len(app.request_cache) == 4
+    assert app.request_cache.info().hits == 8
+
+
+def test_wsgi_write():
+    def app(environ, start_response):
+        write = start_response('200 OK',
+                               [('Content-Type', 'application/json')])
+        write(b'{"user_')
+        return [b'id": 1}']
+
+    _, _, data = wsgi_request(WSGIMiddleware(app))
+
+    assert data == b'{"userId": 1}'
+
+
+@pytest.mark.parametrize('chunks', (1, 3, 1000))
+def test_asgi(chunks: int):
+    app = ASGIMiddleware(asgi_echo(chunks=chunks))
+
+    headers, body = asgi_request(app, json.dumps(REQUEST).encode(),
+                                 chunks=chunks)
+
+    assert int(headers[b'content-length']) == len(body)
+    assert json.loads(body) == REQUEST
+
+
+@pytest.mark.parametrize('chunks', (1, 3, 1000))
+def test_asgi_streaming(chunks: int):
+    app = ASGIMiddleware(asgi_echo(chunks=chunks), buffer_size=0)
+
+    headers, body = asgi_request(app, json.dumps(REQUEST).encode(),
+                                 chunks=chunks)
+
+    assert b'content-length' not in headers
+    assert json.loads(body) == REQUEST
+
+
+def test_asgi_verbatim():
+    app = ASGIMiddleware(asgi_echo())
+    body = b'{"e_f": ["\\ud800", 1e400, 1.0E2]}'
+
+    headers, data = asgi_request(app, body)
+
+    assert data == b'{"eF": ["\\ud800", 1e400, 1.0E2]}'
+    assert int(headers[b'content-length']) == len(data)
+
+
+def test_asgi_request_snake_case():
+    app = ASGIMiddleware(asgi_echo(), response_case=None)
+
+    headers, body = asgi_request(app, json.dumps(REQUEST).encode(), chunks=5)
+
+    assert json.loads(body) == {'user_id': 1,
+                                'last_login': {'ip_address': '127.0.0.1'},
+                                'tag_names': ['someTag']}
+    assert int(headers[b'content-length']) == len(body)
+
+
+def test_asgi_skips_non_json():
+    reports = []
+    app = ASGIMiddleware(asgi_echo(b'text/plain'), report=reports.append)
+    body = json.dumps(REQUEST).encode()
+
+    headers, data = asgi_request(app, body, b'text/plain')
+
+    assert data == body
+    assert reports == []
+
+
+def test_asgi_report():
+    reports = []
+    app = ASGIMiddleware(asgi_echo(), report=reports.append)
+
+    asgi_request(app, b'{"a_b": 1}')
+    asgi_request(app, b'{"a_b": 1}')
+
+    assert len(reports) == 2
+    assert app.request_cache.info().hits == 1
+
+
+def test_asgi_other_scopes():
+    scopes = []
+
+    async def app(scope, receive, send):
+        scopes.append(scope)
+
+    scope = {'type': 'lifespan'}
+    asyncio.run(ASGIMiddleware(app)(scope, None, None))
+
+    assert scopes == [scope]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,121 @@
+import os
+
+import click.testing
+import pytest
+
+from case_changer import cli
+from case_changer.rename import apply_renames
+from case_changer.rename import plan_renames
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+
+def listing(root):
+    return sorted(os.path.relpath(os.path.join(path, name), root)
+                  for path, dirs, files in os.walk(root)
+                  for name in dirs + files)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / 'Annual Reports' / 'Q1 Data').mkdir(parents=True)
+    (tmp_path / 'Annual Reports' / 'Q1 Data' / 'Raw Export.CSV').write_text('')
+    (tmp_path / 'Annual Reports' / 'summaryFile.tar.gz').write_text('')
+    (tmp_path / '.hiddenFile').write_text('')
+    (tmp_path / 'already_fine.txt').write_text('')
+    (tmp_path / 'Makefile').write_text('')
+    return tmp_path
+
+
+@pytest.mark.parametrize('jobs', (1, 4))
+def test_rename(tree, jobs: int):
+    renames = plan_renames(str(tree), 'snake')
+    apply_renames(renames, jobs, batch_size=1)
+
+    assert len(renames) == 6
+    assert listing(tree) == [
+            '.hidden_file',
+            'already_fine.txt',
+            'annual_reports',
+            os.path.join('annual_reports', 'q1_data'),
+            os.path.join('annual_reports', 'q1_data', 'raw_export.CSV'),
+            os.path.join('annual_reports', 'summary_file_tar.gz'),
+            'makefile',
+    ]
+
+
+@pytest.mark.parametrize('jobs', (1, 4))
+def test_rename_trailing_separator(tree, jobs: int):
+    # the root as completed by shells, whose contents must still be renamed
+    # before itself
+    renames = plan_renames(str(tree) + os.sep, 'snake')
+    apply_renames(renames, jobs, batch_size=1)
+
+    assert os.path.join('annual_reports', 'q1_data', 'raw_export.CSV') in \
+        listing(tree)
+
+
+def test_rename_files_only(tree):
+    apply_renames(plan_renames(str(tree), 'param', directories=False))
+
+    assert listing(tree) == [
+            '.hidden-file',
+            'Annual Reports',
+            os.path.join('Annual Reports', 'Q1 Data'),
+            os.path.join('Annual Reports', 'Q1 Data', 'raw-export.CSV'),
+            os.path.join('Annual Reports', 'summary-file-tar.gz'),
+            'already-fine.txt',
+            'makefile',
+    ]
+
+
+@pytest.mark.parametrize('names', (('fooBar.txt', 'foo_bar.txt'),
+                                   ('fooBar.txt', 'FooBar.txt')))
+def test_rename_collision(tmp_path, names):
+    for name in names:
+        (tmp_path / name).write_text('')
+    (tmp_path / 'otherName').write_text('')
+
+    with pytest.raises(FileExistsError, match='foo_bar.txt'):
+        plan_renames(str(tmp_path), 'snake')
+    assert sorted(os.listdir(tmp_path)) == sorted(names + ('otherName',))
+
+
+def test_rename_path_case(tmp_path):
+    (tmp_path / 'fooBar').write_text('')
+
+    with pytest.raises(ValueError):
+        plan_renames(str(tmp_path), 'path')
+
+
+def test_cli_rename(tree):
+    runner = click.testing.CliRunner()
+
+    result = runner.invoke(cli.cli, ['rename', 'snake', str(tree), '-n'])
+
+    assert result.exit_code == 0
+    assert f'{tree / "Makefile"} -> {tree / "makefile"}\n' in result.stdout
+    assert 'Makefile' in os.listdir(tree)
+
+    result = runner.invoke(cli.cli, ['rename', 'snake', str(tree), '-j', '2'])
+
+    assert result.exit_code == 0
+    assert result.stdout == ''
+    assert 'renames/s' in result.stderr
+    assert 'makefile' in os.listdir(tree)
+
+
+def test_cli_rename_collision(tmp_path):
+    (tmp_path / 'fooBar').write_text('')
+    (tmp_path / 'foo_bar').write_text('')
+
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['rename', 'snake', str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert 'collide' in result.stderr
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,147 @@
+import os
+
+import click.testing
+import pytest
+
+from case_changer import cli
+from case_changer import rewrite
+from case_changer.rewrite import rewrite_file
+from case_changer.rewrite import rewrite_files
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+# camelCase identifiers
+PATTERN = r'\b[a-z]+[A-Z]\w*'
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / 'pkg').mkdir()
+    (tmp_path / 'pkg' / 'sub').mkdir()
+    (tmp_path / 'pkg' / 'main.py').write_text(
+            'userId = getUserId()\nprint(userId)\n')
+    (tmp_path / 'pkg' / 'sub' / 'util.py').write_text(
+            'def getUserId():\n    return 1\n')
+    (tmp_path / 'pkg' / 'plain.py').write_text('value = 1\n')
+    (tmp_path / 'pkg' / 'empty.py').write_text('')
+    (tmp_path / 'pkg' / 'notes.txt').write_text('userId\n')
+    return tmp_path
+
+
+def test_rewrite_file(tmp_path):
+    path = tmp_path / 'module.py'
+    path.write_bytes('userId = "fooBär"  # getUserId\n'.encode())
+    path.chmod(0o750)
+
+    assert rewrite_file(str(path), PATTERN, 'snake') == ''
+    assert path.read_bytes() == 'user_id = "foo_bär"  # get_user_id\n'.encode()
+    assert path.stat().st_mode & 0o777 == 0o750
+    assert os.listdir(tmp_path) == ['module.py']
+
+
+def test_rewrite_file_unchanged(tmp_path):
+    path = tmp_path / 'module.py'
+    path.write_text('user_id = get_user_id()\n')
+    inode = path.stat().st_ino
+
+    assert rewrite_file(str(path), r'\w+', 'snake') is None
+    assert path.stat().st_ino == inode
+
+
+def test_rewrite_file_dry_run(tmp_path):
+    path = tmp_path / 'module.py'
+    path.write_text('userId = 1\nx = 2\n')
+
+    diff = rewrite_file(str(path), PATTERN.encode(), 'constant', dry_run=True)
+
+    assert path.read_text() == 'userId = 1\nx = 2\n'
+    assert diff.splitlines()[2:] == ['@@ -1,2 +1,2 @@', '-userId = 1',
+                                     '+USER_ID = 1', ' x = 2']
+
+
+@pytest.mark.parametrize('jobs', (1, 2))
+def test_rewrite_files(tree, monkeypatch, jobs: int):
+    monkeypatch.setattr(rewrite, '_MIN_PARALLEL_FILES', 2)
+    monkeypatch.chdir(tree)
+
+    changed = list(rewrite_files(['pkg/**/*.py', 'pkg/main.py'], PATTERN,
+                                 'snake', jobs=jobs))
+
+    assert changed == [('pkg/main.py', ''),
+                       (os.path.join('pkg', 'sub', 'util.py'), '')]
+    assert (tree / 'pkg' / 'main.py').read_text() == (
+            'user_id = get_user_id()\nprint(user_id)\n')
+    assert (tree / 'pkg' / 'sub' / 'util.py').read_text() == (
+            'def get_user_id():\n    return 1\n')
+    assert (tree / 'pkg' / 'notes.txt').read_text() == 'userId\n'
+
+
+def test_rewrite_file_symlink(tmp_path):
+    path = tmp_path / 'module.py'
+    path.write_text('userId = 1\n')
+    link = tmp_path / 'link.py'
+    link.symlink_to('module.py')
+
+    assert rewrite_file(str(link), PATTERN, 'snake') == ''
+    assert link.is_symlink()
+    assert path.read_text() == 'user_id = 1\n'
+    assert sorted(os.listdir(tmp_path)) == ['link.py', 'module.py']
+
+
+def test_rewrite_files_symlink(tree, monkeypatch):
+    monkeypatch.chdir(tree)
+    (tree / 'pkg' / 'link.py').symlink_to('main.py')
+
+    changed = list(rewrite_files(['pkg/*.py'], PATTERN, 'snake'))
+
+    assert changed == [(os.path.join('pkg', 'link.py'), '')]
+    assert (tree / 'pkg' / 'link.py').is_symlink()
+    assert (tree / 'pkg' / 'main.py').read_text() == (
+            'user_id = get_user_id()\nprint(user_id)\n')
+
+
+def test_rewrite_files_cache(tree, monkeypatch):
+    monkeypatch.setattr(rewrite, '_caches', {})
+
+    globs = [str(tree / 'pkg' / '**' / '*.py')]
+
+    assert list(rewrite_files(globs, PATTERN, 'camel')) == []
+    assert len(list(rewrite_files(globs, PATTERN, 'snake'))) == 2
+
+    # userId, getUserId, userId in one file and getUserId in another
+    info = rewrite._caches['snake_case'].info()
+    assert info.misses == len(rewrite._caches['snake_case']) == 2
+    assert info.hits == 2
+    assert set(rewrite._caches) == {'camel_case', 'snake_case'}
+
+
+def test_cli_rewrite(tree, monkeypatch):
+    monkeypatch.chdir(tree)
+    runner = click.testing.CliRunner()
+
+    result = runner.invoke(cli.cli, ['rewrite', 'snake', PATTERN,
+                                     'pkg/*.py', '--dry-run'])
+
+    assert result.exit_code == 0
+    assert result.stdout.startswith('--- a/pkg/main.py\n+++ b/pkg/main.py\n')
+    assert result.stderr == '1 file would be rewritten\n'
+    assert 'userId' in (tree / 'pkg' / 'main.py').read_text()
+
+    result = runner.invoke(cli.cli, ['rewrite', 'snake', PATTERN, 'pkg/*.py'])
+
+    assert result.exit_code == 0
+    assert result.stdout == 'pkg/main.py\n'
+    assert 'userId' not in (tree / 'pkg' / 'main.py').read_text()
+
+
+def test_cli_rewrite_invalid_pattern():
+    runner = click.testing.CliRunner()
+    result = runner.invoke(cli.cli, ['rewrite', 'snake', '(', '*.py'])
+
+    assert result.exit_code == 2
+    assert 'PATTERN' in result.output
+
+
+if __name__ == "__main__":
+    pytest.main()
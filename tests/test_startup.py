@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import case_changer
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+# Budgets of the cumulative import time in milliseconds, which may be raised
+# on slow machines through the environment
+IMPORT_BUDGET = float(os.environ.get('CASE_CHANGER_IMPORT_BUDGET', 30))
+CLI_BUDGET = float(os.environ.get('CASE_CHANGER_CLI_BUDGET', 150))
+
+# Modules which only some commands need
+DEFERRED = (
+        'case_changer.columnar',
+        'case_changer.csvstream',
+        'case_changer.jsonstream',
+        'case_changer.rename',
+        'case_changer.rewrite',
+        'case_changer.views',
+        'case_changer.words',
+        'concurrent.futures',
+        'csv',
+        'json',
+)
+
+
+def import_times(*args: str) -> Dict[str, float]:
+    """
+    Run Python with :code:`-X importtime` and collect the import times.
+
+    Returns
+    -------
+    times : Dict[str, float]
+        Cumulative import time in milliseconds of every imported module,
+        best of three runs. Modules imported by other modules are prefixed
+        with a space.
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, (
+            os.path.dirname(os.path.dirname(case_changer.__file__)),
+            env.get('PYTHONPATH'))))
+
+    best = {}
+    for _ in range(3):
+        result = subprocess.run([sys.executable, '-X', 'importtime', *args],
+                                env=env, capture_output=True, text=True)
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            times[name[1:].rstrip()] = int(cumulative) / 1000
+        best = {name: min(t, best.get(name, t)) for name, t in times.items()}
+
+    return best
+
+
+def test_import_budget():
+    times = import_times('-c', 'import case_changer')
+
+    assert not [name for name in times
+                if name.lstrip().startswith('case_changer.')]
+    assert times['case_changer'] <= IMPORT_BUDGET
+
+
+@pytest.mark.parametrize('args', (
+        ('-m', 'case_changer', 'snake'),
+        ('-m', 'case_changer', 'snake', 'fooBar'),
+))
+def test_cli_budget(args):
+    baseline = import_times('-c', 'pass')
+    times = import_times(*args)
+
+    assert not [name for name in times
+                if name.lstrip().startswith(DEFERRED)]
+    assert sum(t for name, t in times.items()
+               if not name.startswith(' ') and name not in baseline) \
+        <= CLI_BUDGET
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,125 @@
+import pytest
+
+from case_changer import *
+from case_changer import changers
+from case_changer.stats import STAGES
+from case_changer.stats import Stats
+from case_changer.stats import format_stats
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+
+@pytest.fixture
+def stats():
+    enable_stats()
+    yield
+    disable_stats()
+
+
+def test_stats_disabled():
+    assert stats_info() is None
+    assert snake_case('TestString') == 'test_string'
+    assert stats_info() is None
+
+
+def test_stats_calls(stats):
+    snake_case('fooBar')
+    snake_case(b'fooBar')
+    camel_case('foo_bar')
+    snake_case_many(['fooBar', 'BazQux'])
+    to_snake({'fooBar': [{'bazQux': 1}]})
+
+    info = stats_info()
+
+    assert info.calls == {
+            'camel_case': 1,
+            'snake_case': 4,
+            'snake_case_many': 1,
+            'to_snake': 1,
+    }
+    assert set(info.times) == set(STAGES)
+    assert all(seconds >= 0 for seconds in info.times.values())
+    assert info.times['walk'] > 0
+    assert info.sizes == {8: 7}
+    assert info.cache is None
+
+
+@pytest.mark.parametrize('inpt', ('fooBar', 'caféBar', b'XMLHttp', '__'))
+@pytest.mark.parametrize('case', tuple(changers._CASES))
+def test_stats_same_result(stats, case: str, inpt: str):
+    fn = getattr(changers, case)
+    changed = fn(inpt)
+    disable_stats()
+
+    assert changed == fn(inpt)
+
+
+def test_stats_separate_strip(stats):
+    # non-ASCII strings are split and stripped in separate passes
+    snake_case('café Bar' * 100)
+
+    assert stats_info().times['strip'] > 0
+
+
+def test_stats_cache(stats):
+    enable_cache()
+    try:
+        snake_case('fooBar')
+        snake_case('fooBar')
+        info = stats_info()
+    finally:
+        disable_cache()
+
+    assert info.calls == {'snake_case': 2}
+    assert info.cache.hits == 1
+
+
+def test_stats_many_sentinel(stats):
+    # strings containing the sentinel are changed one by one by the case
+    # changing function, sharing its cache
+    enable_cache()
+    try:
+        snake_case('foo\x1eBar')
+        snake_case_many(['foo\x1eBar', 'bazQux'])
+        info = stats_info()
+    finally:
+        disable_cache()
+
+    assert info.calls == {'snake_case': 3}
+    assert info.cache.hits == 1
+
+
+def test_reset_stats(stats):
+    snake_case('fooBar')
+    reset_stats()
+
+    assert stats_info().calls == {}
+
+
+def test_merge():
+    stats = Stats()
+    stats.record('snake_case', 3, split=1.0)
+    other = Stats()
+    other.record('snake_case', 5, split=0.5, join=0.25)
+    stats.merge(other.info())
+
+    info = stats.info()
+
+    assert info.calls == {'snake_case': 2}
+    assert info.times['split'] == 1.5
+    assert info.times['join'] == 0.25
+    assert info.sizes == {4: 1, 8: 1}
+
+
+def test_format_stats(stats):
+    snake_case('fooBar')
+
+    text = format_stats(stats_info())
+
+    assert 'snake_case' in text
+    assert 'cache: disabled' in text
+
+
+if __name__ == "__main__":
+    pytest.main()
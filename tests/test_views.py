@@ -0,0 +1,66 @@
+import pytest
+
+from case_changer import *
+from case_changer.views import KeyConvertingView
+from case_changer.views import SequenceView
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+PAYLOAD = {
+        'userId': 1,
+        'userName': 'fooBar',
+        'lastLogin': {'ipAddress': '127.0.0.1'},
+        'recentOrders': [{'orderId': 2, 'lineItems': ({'skuCode': 'X1'},)}],
+        3: 'three',
+}
+
+
+def test_snake_view():
+    view = snake_view(PAYLOAD)
+
+    assert isinstance(view, KeyConvertingView)
+    assert view['user_id'] == 1
+    assert view['user_name'] == 'fooBar'
+    assert view['last_login']['ip_address'] == '127.0.0.1'
+    assert view['recent_orders'][0]['line_items'][0]['sku_code'] == 'X1'
+    assert view[3] == 'three'
+    assert 'user_id' in view
+    assert 'userId' not in view
+    assert len(view) == len(PAYLOAD)
+    assert list(view) == ['user_id', 'user_name', 'last_login',
+                          'recent_orders', 3]
+
+
+def test_snake_view_missing_key():
+    with pytest.raises(KeyError):
+        snake_view(PAYLOAD)['userId']
+
+
+def test_snake_view_nested_views_are_reused():
+    view = snake_view(PAYLOAD)
+
+    assert view['last_login'] is view['last_login']
+
+
+def test_camel_view_sequence():
+    view = camel_view([{'foo_bar': 1}, {'baz_qux': 2}])
+
+    assert isinstance(view, SequenceView)
+    assert len(view) == 2
+    assert view[1]['bazQux'] == 2
+    assert [dict(v) for v in view[:1]] == [{'fooBar': 1}]
+
+
+def test_view_to_dict():
+    assert snake_view(PAYLOAD).to_dict() == to_snake(PAYLOAD)
+    assert dict(snake_view({'fooBar': 1})) == {'foo_bar': 1}
+
+
+def test_view_invalid():
+    with pytest.raises(TypeError):
+        snake_view('fooBar')
+
+
+if __name__ == "__main__":
+    pytest.main()
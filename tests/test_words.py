@@ -0,0 +1,182 @@
+import random
+
+import pytest
+
+from case_changer import *
+from case_changer import changers
+
+__author__ = 'Philipp Tempel'
+__email__ = 'python@philipptempel.me'
+
+CASES = (
+        'camel_case',
+        'capital_case',
+        'constant_case',
+        'dot_case',
+        'header_case',
+        'no_case',
+        'param_case',
+        'pascal_case',
+        'path_case',
+        'sentence_case',
+        'snake_case',
+)
+
+
+@pytest.mark.parametrize(
+        ('inpt', 'expected'),
+        (
+                ("", []),
+                ("  ", []),
+                ("test", ["test"]),
+                ("test string", ["test", "string"]),
+                ("XMLHttpRequest", ["XML", "Http", "Request"]),
+                ("ID123String", ["ID123", "String"]),
+                ("version 1.2.10", ["version", "1", "2", "10"]),
+                ("_foo_bar_", ["foo", "bar"]),
+        )
+)
+def test_tokenize(inpt: str, expected: list):
+    words = tokenize(inpt)
+
+    assert words.source == inpt
+    assert list(words) == expected
+    assert len(words) == len(expected)
+
+
+@pytest.mark.parametrize('case', CASES)
+@pytest.mark.parametrize(
+        'inpt',
+        (
+                "",
+                "___",
+                "test",
+                "Test String",
+                "TestV2",
+                "_foo_bar_",
+                "anHTMLTag",
+                "version 1.21.0",
+        )
+)
+def test_render(case: str, inpt: str):
+    expected = getattr(changers, case)(inpt)
+
+    assert tokenize(inpt).render(case) == expected
+    assert tokenize(inpt).render(case.replace('_case', '')) == expected
+
+
+def test_render_all():
+    words = tokenize('XMLHttpRequest')
+
+    assert words.render_all() == {case: getattr(changers, case)(
+            'XMLHttpRequest') for case in CASES}
+    assert list(words.render_all(('snake', 'camel_case'))) == [
+            'snake_case', 'camel_case']
+
+
+def test_render_random():
+    alphabet = 'abZY019 _-./'
+    rng = random.Random(0)
+    for _ in range(2000):
+        inpt = ''.join(rng.choice(alphabet)
+                       for _ in range(rng.randrange(12)))
+        words = tokenize(inpt)
+
+        assert words.render_all() == {case: getattr(changers, case)(inpt)
+                                      for case in CASES}
+
+
+def test_render_registered_case():
+    register_case('train', '-', str.capitalize)
+    try:
+        words = tokenize('fooBar baz')
+
+        assert words.render('train') == 'Foo-Bar-Baz'
+        assert words.render_all(('train_case', 'snake')) == {
+                'train_case': 'Foo-Bar-Baz', 'snake_case': 'foo_bar_baz'}
+    finally:
+        unregister_case('train')
+
+    with pytest.raises(ValueError):
+        words.render('train')
+
+
+def test_render_unknown_case():
+    with pytest.raises(ValueError):
+        tokenize('test').render('kebab')
+
+
+@pytest.mark.parametrize('tokenizer', ('regex', 'scan'))
+@pytest.mark.parametrize(
+        'inpt',
+        (
+                "",
+                "___",
+                "XMLHttpRequest",
+                "version 1.21.0",
+                "_foo_bar_",
+                "straße İstanbul",
+                "ſtraße\u212aelvinÄrger",
+                "fooBar fooBar foo",
+        )
+)
+def test_tokenize_compact(tokenizer: str, inpt: str):
+    previous = get_tokenizer()
+    set_tokenizer(tokenizer)
+    try:
+        tokens = tokenize_compact(inpt)
+        words = tokenize(inpt)
+    finally:
+        set_tokenizer(previous)
+
+    assert tokens.source == inpt
+    assert tokens.offsets.typecode == 'I'
+    assert tokens.words == list(tokens) == words.words
+    assert len(tokens) == len(words)
+    assert tokens.render_all() == words.render_all()
+    for case in CASES:
+        assert tokens.render(case) == words.render(case)
+
+
+@pytest.mark.parametrize('tokenizer', ('regex', 'scan'))
+def test_tokenize_compact_random(tokenizer: str):
+    alphabet = 'abZY019 _-.\u00e4\u00c4\u0130\u212a'
+    rng = random.Random(0)
+    previous = get_tokenizer()
+    set_tokenizer(tokenizer)
+    try:
+        for _ in range(2000):
+            inpt = ''.join(rng.choice(alphabet)
+                           for _ in range(rng.randrange(12)))
+
+            assert tokenize_compact(inpt).words == tokenize(inpt).words
+    finally:
+        set_tokenizer(previous)
+
+
+def test_tokens():
+    tokens = Tokens('fooBar', [0, 3, 3, 6])
+
+    assert tokens == tokenize_compact('fooBar')
+    assert tokens != Tokens('fooBar', [0, 6])
+    assert tokens != tokenize('fooBar')
+    assert repr(tokens) == "Tokens('fooBar', array('I', [0, 3, 3, 6]))"
+    assert tokens.render('constant') == 'FOO_BAR'
+    assert not hasattr(tokens, '__dict__')
+
+
+def test_tokens_render_offsets(monkeypatch):
+    def words(self):
+        raise AssertionError('words must not be listed to render them')
+
+    monkeypatch.setattr(Tokens, 'words', property(words))
+    tokens = tokenize_compact('XMLHttpRequest')
+
+    assert tokens.render('camel') == 'xmlHttpRequest'
+    assert tokens.render_all(('snake', 'pascal')) == {
+            'snake_case': 'xml_http_request',
+            'pascal_case': 'XmlHttpRequest'}
+
+
+if __name__ == "__main__":
+    pytest.main()